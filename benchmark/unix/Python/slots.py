@@ -0,0 +1,46 @@
+"""
+Microbenchmark of attribute access on the runtime objects of bitprotolib, comparing
+the slotted ProcessContext with an equivalent plain dataclass.
+"""
+
+import sys
+import time
+from dataclasses import dataclass, field
+
+from bitprotolib import bp
+
+
+@dataclass
+class DictProcessContext:
+    is_encode: bool
+    s: bp.Buffer
+    i: int = 0
+    di: bp.DataIndexer = field(default_factory=lambda: bp.DataIndexer(0))
+
+
+def bench_access(name: str, ctx: object, n: int) -> None:
+    start = time.time()
+    for _ in range(n):
+        # The accesses process_base_type does on ctx.
+        ctx.i += (ctx.s[ctx.i >> 3] & 1) + 1  # type: ignore
+    end = time.time()
+    size = sys.getsizeof(ctx)
+    if hasattr(ctx, "__dict__"):
+        size += sys.getsizeof(ctx.__dict__)
+    cost = int((end - start) * 1000000000)  # ns
+    print(
+        "{0}: accessed attributes {1} times, total {2}ms, per access {3}ns, "
+        "object size {4} bytes".format(
+            name, n, int(cost / 1000000), int(cost / n), size
+        )
+    )
+
+
+def main() -> None:
+    n = 1000000
+    bench_access("dict", DictProcessContext(True, bytearray(n >> 3)), n)
+    bench_access("slots", bp.ProcessContext(True, bytearray(n >> 3)), n)
+
+
+if __name__ == "__main__":
+    main()
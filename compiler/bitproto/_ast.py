@@ -41,6 +41,7 @@ Abstraction syntax tree.
       |    |    |- Proto                :Scope:Definition:Node
 """
 
+import zlib
 from collections import OrderedDict as dict_
 from dataclasses import dataclass
 from dataclasses import field as dataclass_field
@@ -52,6 +53,7 @@ from bitproto.errors import (
     DuplicatedDefinition,
     DuplicatedEnumFieldValue,
     DuplicatedMessageFieldNumber,
+    DuplicatedMessageTypeId,
     EnumFieldValueOverflow,
     InternalError,
     InvalidAliasedType,
@@ -982,6 +984,29 @@ class Message(BoundScope, ScopeWithOptions, CompositeType, ExtensibleType):
             return n
         return self.ahead_nbits() + n
 
+    @cache_if_frozen
+    def full_name(self) -> str:
+        """Returns the name of this message joined with the names of its proto and
+        parent messages by dots, e.g. "drone.Drone.Pose"."""
+        names = [self.name]
+        for scope in self.scope_stack[::-1]:
+            if isinstance(scope, Message):
+                names.insert(0, scope.name)
+            elif isinstance(scope, Proto):
+                names.insert(0, scope.name)
+                break
+        return ".".join(names)
+
+    @cache_if_frozen
+    def type_id(self) -> int:
+        """Returns the 16 bits type id of this message, to tag frames on a channel
+        carrying multiple message types. Defaults to the lowest 16 bits of the CRC32 of
+        its full name, if option type_id is not set."""
+        type_id = self.get_option_as_int_or_raise("type_id")
+        if type_id > 0:
+            return type_id
+        return zlib.crc32(self.full_name().encode()) & 0xFFFF
+
     def __repr__(self) -> str:
         extensible_flag = "'" if self.extensible else ""
         return f"<message {self.name}{extensible_flag}>"
@@ -1039,3 +1064,16 @@ class Proto(ScopeWithOptions):
 
     def __repr__(self) -> str:
         return f"<bitproto {self.name}>"
+
+    @override(Node)
+    def validate_post_freeze(self) -> None:
+        # Type ids set by option type_id should be unique. Derived ids may collide,
+        # which is reported on registration of the frame message classes.
+        messages: Dict[int, Message] = {}
+        for _, message in self.messages(recursive=True, bound=self):
+            type_id = message.get_option_as_int_or_raise("type_id")
+            if type_id <= 0:
+                continue
+            if type_id in messages:
+                raise DuplicatedMessageTypeId.from_token(token=message)
+            messages[type_id] = message
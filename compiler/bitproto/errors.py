@@ -258,6 +258,11 @@ class MessageSizeOverflows(GrammarError):
     """Message size overflows constraint, should < 65535 bits (about 8kb)."""
 
 
+@dataclass
+class DuplicatedMessageTypeId(GrammarError):
+    """Duplicated message type id, set another one via option type_id."""
+
+
 @dataclass
 class AliasInMessageUnsupported(GrammarError):
     """Unsupported to declare alias type inside message."""
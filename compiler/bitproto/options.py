@@ -31,6 +31,12 @@ MESSAGE_OPTIONS: OptionDescriptors = (
         lambda v: v >= 0,
         "Setting the maximum limit of number of bytes for target message.",
     ),
+    OptionDescriptor(
+        "type_id",
+        0,
+        lambda v: 0 <= v <= 65535,
+        "Type id of target message in multi-message framing, defaults to 0, that is derived from its full name.",
+    ),
 )
 
 # Proto Options
@@ -59,4 +65,10 @@ PROTO_OPTTIONS: OptionDescriptors = (
         None,
         "Module name of current python module, to be imported, e.g. example_bp",
     ),
+    OptionDescriptor(
+        "py.slots",
+        False,
+        None,
+        "Whether to generate python message classes with __slots__, defaults to false.",
+    ),
 )
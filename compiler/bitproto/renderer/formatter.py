@@ -54,6 +54,9 @@ CaseStyleConverter = Callable[[str], str]
 # Dict[DefinitionType => One or tuple of CaseStyle name OR CaseStyleConverter]
 CaseStyleMapping = Dict[T[Definition], Union[str, Tuple[str, ...], CaseStyleConverter]]
 
+# Tuple of (path of message fields, single type, bit index, array strides).
+PatchField = Tuple[Tuple[MessageField, ...], Type, int, Tuple[int, ...]]
+
 
 @unique
 class CaseStyle(Enum_):
@@ -424,6 +427,11 @@ class Formatter:
         with nested-declaration concern."""
         return self.format_definition_name(t)
 
+    @final
+    def format_message_type_id(self, t: Message) -> str:
+        """Formats the type id of given message as a hex literal."""
+        return "0x{:04X}".format(t.type_id())
+
     @final
     def format_alias_name(self, t: Alias) -> str:
         """Formats the declaration name of given alias,
@@ -732,5 +740,92 @@ class Formatter:
             message, field_name_chain, False, [0]
         )
 
+    #####################
+    # Patching
+    #####################
+
+    @overridable
+    def format_patch_item(self, si: int, shift: int, mask: int) -> str:
+        """Formats one statement patching the bits of mask on byte si of buffer s, from
+        the value variable x shifted by shift, other bits on the byte are kept.
+        :param si: The index of byte in the buffer s.
+        :param shift: The number of bits to shift x, right if positive.
+        :param mask: The mask get from op_mode_get_mask.
+        """
+        raise NotImplementedError
+
+    @final
+    def format_patch_statements(self, i: int, n: int) -> List[str]:
+        """Formats the statements patching number of n bits of value variable x into
+        buffer s at bit index i, a byte at a time, like the optimization mode encoder,
+        but the bits out of the mask are kept instead of cleared.
+        """
+        l: List[str] = []
+        j = 0
+        while j < n:
+            c = min(8 - (i % 8), n - j)
+            shift, mask = j - (i % 8), self.op_mode_get_mask(i % 8, c)
+            l.append(self.format_patch_item(int(i / 8), shift, mask))
+            j += c
+            i += c
+        return l
+
+    @final
+    def format_patch_field_path(self, path: Tuple[MessageField, ...]) -> str:
+        """Formats given path of message fields to patch in bitproto names, with array
+        indexes named as the patch function arguments, e.g. "propellers[k0].direction".
+        """
+        names: List[str] = []
+        k = 0
+        for field in path:
+            name, t = field.name, field.type
+            while isinstance(t, (Array, Alias)):
+                if isinstance(t, Array):
+                    name += f"[k{k}]"
+                    k += 1
+                    t = t.element_type
+                else:
+                    t = t.type
+            names.append(name)
+        return ".".join(names)
+
+    @final
+    def collect_patch_fields(
+        self,
+        t: Type,
+        path: Tuple[MessageField, ...] = (),
+        i: int = 0,
+        strides: Tuple[int, ...] = (),
+    ) -> List[PatchField]:
+        """Collects the single type fields of given message t to patch, as a list of
+        tuple (path, type, i, strides), including fields of nested messages and arrays.
+
+        :param path: The message fields along the path from the top level message.
+        :param i: The index of bit the field starts at in the encoded buffer. For fields
+           in arrays, it's the index of the first element.
+        :param strides: Number of bits between adjacent elements of each array along
+           the path.
+
+        The bit indexes are computed at compile time, assuming the message is encoded
+        by current bitproto, so extensible aheads are always of fixed size.
+        """
+        if isinstance(t, Alias) and isinstance(t.type, Array):
+            return self.collect_patch_fields(t.type, path, i, strides)
+        if isinstance(t, Message):
+            l: List[PatchField] = []
+            if t.extensible:
+                i += t.ahead_nbits()
+            for field in t.sorted_fields():
+                path_ = path + (field,)
+                l.extend(self.collect_patch_fields(field.type, path_, i, strides))
+                i += field.type.nbits()
+            return l
+        if isinstance(t, Array):
+            if t.extensible:
+                i += t.ahead_nbits()
+            strides_ = strides + (t.element_type.nbits(),)
+            return self.collect_patch_fields(t.element_type, path, i, strides_)
+        return [(path, t, i, strides)]
+
 
 F = TypeVar("F", bound=Formatter)
@@ -320,3 +320,21 @@ class CFormatter(Formatter):
         assign = "=" if r == 0 else "|="
         shift_s = self.format_op_mode_smart_shift(shift)
         return f"((unsigned char *)&({chain}))[{fi}] {assign} (s[{si}] {shift_s}) & {mask};"
+
+    ###################
+    # Patching.
+    ###################
+
+    @override(Formatter)
+    def format_patch_item(self, si: int, shift: int, mask: int) -> str:
+        """Implements format_patch_item for C.
+        Generated C statement like:
+
+            s[1] = (s[1] & 131) | ((x << 2) & 124);
+
+        """
+        shift_s = self.format_op_mode_smart_shift(shift)
+        x = f"(x {shift_s})" if shift_s else "x"
+        if mask == 255:
+            return f"s[{si}] = {x};"
+        return f"s[{si}] = (s[{si}] & {255 ^ mask}) | ({x} & {mask});"
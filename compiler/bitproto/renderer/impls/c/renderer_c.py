@@ -35,6 +35,7 @@ from bitproto.renderer.impls.c.renderer_h import (
     BlockMessageEncoderBase,
     BlockMessageFieldDescriptorsIniterBase,
     BlockMessageJsonFormatterBase,
+    BlockMessagePatchersBase,
     BlockMessageProcessorBase,
     RendererCHeader,
 )
@@ -371,6 +372,26 @@ class BlockMessageJsonFormatter(BlockMessageJsonFormatterBase):
         self.push("}")
 
 
+class BlockMessagePatchers(BlockMessagePatchersBase):
+    @override(Block)
+    def render(self) -> None:
+        for index, (path, t, i, strides) in enumerate(self.patch_fields()):
+            if index > 0:
+                self.push_empty_line()
+            self.push(f"{self.function_signature(path, t, strides)} {{")
+            if strides:
+                # Bit index depends on the array indexes.
+                i_s = " + ".join(
+                    [str(i)] + [f"k{k} * {n}" for k, n in enumerate(strides)]
+                )
+                self.push(f"BpPatchBits(s, {i_s}, {t.nbits()}, (uint64_t)v);", indent=4)
+            else:
+                self.push("uint64_t x = (uint64_t)v;", indent=4)
+                for line in self.formatter.format_patch_statements(i, t.nbits()):
+                    self.push(line, indent=4)
+            self.push("}")
+
+
 class BlockMessageFunctions(BlockBindMessage[F], BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block[F]]:
@@ -383,6 +404,7 @@ class BlockMessageFunctions(BlockBindMessage[F], BlockComposition[F]):
             BlockMessageEncoder(self.d),
             BlockMessageDecoder(self.d),
             BlockMessageJsonFormatter(self.d),
+            BlockMessagePatchers(self.d),
         ]
 
 
@@ -2,9 +2,19 @@
 Renderer for C header file.
 """
 
-from typing import Any, List, Optional
-
-from bitproto._ast import Alias, Array, BoundDefinition, Constant, Enum, Message, Proto
+from typing import Any, List, Optional, Tuple
+
+from bitproto._ast import (
+    Alias,
+    Array,
+    BoundDefinition,
+    Constant,
+    Enum,
+    Message,
+    MessageField,
+    Proto,
+    Type,
+)
 from bitproto.errors import InternalError
 from bitproto.renderer.block import (
     Block,
@@ -21,12 +31,14 @@ from bitproto.renderer.block import (
     BlockDeferable,
     BlockWrapper,
 )
+from bitproto.renderer.formatter import PatchField
 from bitproto.renderer.impls.c.formatter import CFormatter as F
 from bitproto.renderer.renderer import Renderer
 from bitproto.utils import (
     cached_property,
     cast_or_raise,
     override,
+    pascal_case,
     snake_case,
     upper_case,
 )
@@ -344,6 +356,36 @@ class BlockMessageJsonFormatterFunctionDeclaration(BlockMessageJsonFormatterBase
         self.push(f"{self.function_signature};")
 
 
+class BlockMessagePatchersBase(BlockBindMessage[F]):
+    def patch_fields(self) -> List[PatchField]:
+        return self.formatter.collect_patch_fields(self.d)
+
+    def function_name(self, path: Tuple[MessageField, ...]) -> str:
+        # Joins with underscores, avoids conflicts with names of nested messages.
+        names = "_".join(pascal_case(field.name) for field in path)
+        return f"Patch{self.message_name}_{names}"
+
+    def function_comment(self, path: Tuple[MessageField, ...]) -> str:
+        field_path = self.formatter.format_patch_field_path(path)
+        return f"Patch field {field_path} of encoded struct {self.message_name} in given buffer s."
+
+    def function_signature(
+        self, path: Tuple[MessageField, ...], t: Type, strides: Tuple[int, ...]
+    ) -> str:
+        args = ["unsigned char *s"]
+        args.extend(f"int k{k}" for k in range(len(strides)))
+        args.append(f"{self.formatter.format_type(t)} v")
+        return f"void {self.function_name(path)}({', '.join(args)})"
+
+
+class BlockMessagePatchersDeclaration(BlockMessagePatchersBase):
+    @override(Block)
+    def render(self) -> None:
+        for path, t, _, strides in self.patch_fields():
+            self.push_comment(self.function_comment(path))
+            self.push(f"{self.function_signature(path, t, strides)};")
+
+
 class BlockMessageFieldDescriptorsIniterBase(BlockBindMessage[F]):
     @cached_property
     def function_name(self) -> str:
@@ -377,6 +419,7 @@ class BlockMessageFunctionDeclarationsForUser(BlockBindMessage[F], BlockComposit
             BlockMessageEncoderFunctionDeclaration(self.d),
             BlockMessageDecoderFunctionDeclaration(self.d),
             BlockMessageJsonFormatterFunctionDeclaration(self.d),
+            BlockMessagePatchersDeclaration(self.d),
         ]
 
     @override(BlockComposition)
@@ -240,3 +240,32 @@ class GoFormatter(Formatter):
                 assign = "="
 
         return f"{chain} {assign} {data}{bshift}"
+
+    ###################
+    # Patching.
+    ###################
+
+    @override(Formatter)
+    def format_patch_item(self, si: int, shift: int, mask: int) -> str:
+        """Implements format_patch_item for Go.
+        Generated Go statement like:
+
+            s[1] = (s[1] & 131) | (byte(x << 2) & 124)
+
+        """
+        shift_s = self.format_op_mode_smart_shift(shift)
+        x = f"byte(x {shift_s})" if shift_s else "byte(x)"
+        if mask == 255:
+            return f"s[{si}] = {x}"
+        return f"s[{si}] = (s[{si}] & {255 ^ mask}) | ({x} & {mask})"
+
+    def format_patch_value(self, t: Type) -> str:
+        """Formats the conversion of patch value variable v of given type to uint64."""
+        # Handle go's annoying type casting
+        if isinstance(t, Bool):
+            return "uint64(bp.Bool2byte(v))"
+        elif isinstance(t, Alias):
+            alias_t = cast_or_raise(Alias, t)
+            if isinstance(alias_t.type, Bool):
+                return "uint64(bp.Bool2byte(bool(v)))"
+        return "uint64(v)"
@@ -663,6 +663,36 @@ class BlockMessageMethodDecode(BlockBindMessage[F]):
         self.push("}")
 
 
+class BlockMessagePatchFunctions(BlockBindMessage[F]):
+    @override(Block)
+    def render(self) -> None:
+        fields = self.formatter.collect_patch_fields(self.d)
+        for index, (path, t, i, strides) in enumerate(fields):
+            if index > 0:
+                self.push_empty_line()
+            # Joins with underscores, avoids conflicts with names of nested messages.
+            names = "_".join(self.formatter.format_message_field_name(f) for f in path)
+            field_path = self.formatter.format_patch_field_path(path)
+            args = ["s []byte"]
+            args.extend(f"k{k} int" for k in range(len(strides)))
+            args.append(f"v {self.formatter.format_type(t)}")
+            value = self.formatter.format_patch_value(t)
+
+            self.push_comment(
+                f"Patch field {field_path} of encoded struct {self.message_name} in given buffer s."
+            )
+            self.push(f"func Patch{self.message_name}_{names}({', '.join(args)}) {{")
+            if strides:
+                # Bit index depends on the array indexes.
+                i_s = "+".join([str(i)] + [f"k{k}*{n}" for k, n in enumerate(strides)])
+                self.push(f"bp.PatchBits(s, {i_s}, {t.nbits()}, {value})", indent=1)
+            else:
+                self.push(f"x := {value}", indent=1)
+                for line in self.formatter.format_patch_statements(i, t.nbits()):
+                    self.push(line, indent=1)
+            self.push("}")
+
+
 class BlockMessage(BlockBindMessage[F], BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block[F]]:
@@ -677,6 +707,7 @@ class BlockMessage(BlockBindMessage[F], BlockComposition[F]):
             BlockMessageMethodBpGetAccessor(self.d),
             BlockMessageMethodBpSetByte(self.d),
             BlockMessageMethodBpGetByte(self.d),
+            BlockMessagePatchFunctions(self.d),
         ]
 
 
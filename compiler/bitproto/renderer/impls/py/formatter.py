@@ -2,7 +2,7 @@
 Python formatter.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from bitproto._ast import (
     Alias,
@@ -20,7 +20,23 @@ from bitproto._ast import (
 )
 from bitproto.errors import InternalError
 from bitproto.renderer.formatter import CaseStyleMapping, Formatter
-from bitproto.utils import final, override, upper_case
+from bitproto.utils import final, overridable, override, upper_case
+
+# Format characters of struct of signed integers by number of bits, in upper case for
+# unsigned integers.
+STRUCT_FORMATS = {8: "b", 16: "h", 32: "i", 64: "q"}
+
+# Maximum number of terms in a single expression, long expressions overflow the stack
+# of Python's compiler.
+MAX_TERMS_PER_EXPRESSION = 32
+
+# A base type field in the layout of a message, as tuple (chain, type, bit offset).
+LayoutField = Tuple[str, Type, int]
+
+# An item in the struct layout of a message, as tuple (aligned, number of bytes,
+# fields). An aligned item is a single byte-aligned integer, otherwise a segment of
+# unaligned fields, with bit offsets relative to the segment.
+StructItem = Tuple[bool, int, List[LayoutField]]
 
 
 class PyFormatter(Formatter):
@@ -115,9 +131,15 @@ class PyFormatter(Formatter):
         enum_name = self.format_enum_name(enum)
         return upper_case("_{0}_VALUE_TO_NAME_MAP".format(enum_name))
 
+    @final
+    def format_enum_name_to_value_map_name(self, enum: Enum) -> str:
+        enum_name = self.format_enum_name(enum)
+        return upper_case("_{0}_NAME_TO_VALUE_MAP".format(enum_name))
+
     def format_default_value_bool(self) -> str:
         return "False"
 
+    @overridable
     def format_default_value_byte(self) -> str:
         return "bp.byte(0)"
 
@@ -271,4 +293,596 @@ class PyFormatter(Formatter):
 
     def format_processor_message(self, t: Message) -> str:
         message_name = self.format_message_name(t)
-        return f"{message_name}().bp_processor()"
+        return f"{message_name}.bp_processor()"
+
+    ###################
+    # Batch Layout.
+    ###################
+
+    def format_batch_field_flag(self, t: Type) -> str:
+        if isinstance(t, Bool):
+            return "bp.FLAG_BOOL"
+        elif isinstance(t, Int):
+            return "bp.FLAG_INT"
+        elif isinstance(t, Uint):
+            return "bp.FLAG_UINT"
+        elif isinstance(t, Byte):
+            return "bp.FLAG_BYTE"
+        elif isinstance(t, Enum):
+            return "bp.FLAG_ENUM"
+        raise InternalError("format_batch_field_flag got unexpected t")
+
+    def format_batch_field(
+        self,
+        t: Type,
+        name: str,
+        i: int,
+        shape: Tuple[int, ...],
+        strides: Tuple[int, ...],
+    ) -> str:
+        flag = self.format_batch_field_flag(t)
+        name_s = self.format_str_value(name)
+        nbits = self.format_int_value(t.nbits())
+        offset = self.format_int_value(i)
+        if shape:
+            return f"bp.BatchField({name_s}, {flag}, {nbits}, {offset}, {shape}, {strides})"
+        return f"bp.BatchField({name_s}, {flag}, {nbits}, {offset})"
+
+    def format_batch_ahead(
+        self, value: int, i: int, shape: Tuple[int, ...], strides: Tuple[int, ...]
+    ) -> str:
+        value_s = self.format_int_value(value)
+        offset = self.format_int_value(i)
+        if shape:
+            return f"bp.BatchAhead({value_s}, {offset}, {shape}, {strides})"
+        return f"bp.BatchAhead({value_s}, {offset})"
+
+    def format_batch_layout_of_type(
+        self,
+        t: Type,
+        name: str,
+        i: int,
+        shape: Tuple[int, ...],
+        strides: Tuple[int, ...],
+        fields: List[str],
+        aheads: List[str],
+    ) -> None:
+        """Collects the formatted batch fields and aheads of given type t.
+
+        :param name: Dotted path to current field from the top level message.
+        :param i: The index of bit current type starts at in the encoded buffer.
+        :param shape: Capacities of the arrays along the path.
+        :param strides: Number of bits between adjacent elements of the arrays.
+        :param fields: List to collect formatted bp.BatchField items.
+        :param aheads: List to collect formatted bp.BatchAhead items.
+        """
+        if isinstance(t, Alias):
+            self.format_batch_layout_of_type(
+                t.type, name, i, shape, strides, fields, aheads
+            )
+        elif isinstance(t, Message):
+            if t.extensible:
+                aheads.append(self.format_batch_ahead(t.nbits(), i, shape, strides))
+                i += t.ahead_nbits()
+            for field in t.sorted_fields():
+                field_name = self.format_message_field_name(field)
+                name_ = f"{name}.{field_name}" if name else field_name
+                self.format_batch_layout_of_type(
+                    field.type, name_, i, shape, strides, fields, aheads
+                )
+                i += field.type.nbits()
+        elif isinstance(t, Array):
+            if t.extensible:
+                aheads.append(self.format_batch_ahead(t.cap, i, shape, strides))
+                i += t.ahead_nbits()
+            shape_ = shape + (t.cap,)
+            strides_ = strides + (t.element_type.nbits(),)
+            self.format_batch_layout_of_type(
+                t.element_type, name, i, shape_, strides_, fields, aheads
+            )
+        else:
+            fields.append(self.format_batch_field(t, name, i, shape, strides))
+
+    def format_batch_layout(self, message: Message) -> Tuple[List[str], List[str]]:
+        """Formats the bp.BatchField list of all base type fields of given message, and
+        the bp.BatchAhead list of all extensible aheads.
+        The bit offsets are computed at compile time, assuming the message is encoded
+        by current bitproto, so extensible aheads are always of fixed size and value.
+        """
+        fields: List[str] = []
+        aheads: List[str] = []
+        self.format_batch_layout_of_type(message, "", 0, (), (), fields, aheads)
+        return fields, aheads
+
+    ###################
+    # Message Views.
+    ###################
+
+    def format_view_name(self, t: Message) -> str:
+        return self.format_name_related_to_definition(t, "{definition_name}View")
+
+    def format_view_type(self, t: Type) -> str:
+        """Returns the type annotation of the value a view returns for given type."""
+        if isinstance(t, Alias):
+            return self.format_view_type(t.type)
+        if isinstance(t, Message):
+            return self.format_view_name(t)
+        if isinstance(t, Array):
+            return "bp.ArrayView"
+        return self.format_type(t)
+
+    def format_view_reader(self, t: Type) -> str:
+        """Returns the function reading a value of given type from (s, i), for
+        elements of array views.
+        """
+        if isinstance(t, Alias):
+            return self.format_view_reader(t.type)
+        if isinstance(t, Message):
+            return f"{self.format_view_name(t)}.bp_at"
+        if isinstance(t, Array):
+            return f"lambda s, i: {self.format_view_array(t, 's', 'i')}"
+        flag = self.format_batch_field_flag(t)
+        return f"bp.reader({flag}, {t.nbits()})"
+
+    def format_view_array(self, t: Array, s: str, i: str) -> str:
+        """Returns the expression of the view of array t at bit index i of buffer s."""
+        if t.extensible:
+            i = f"{i} + {t.ahead_nbits()}"
+        stride = t.element_type.nbits()
+        reader = self.format_view_reader(t.element_type)
+        return f"bp.ArrayView({s}, {i}, {t.cap}, {stride}, {reader})"
+
+    def format_view_getter(self, t: Type, offset: int) -> str:
+        """Returns the expression reading the value of given type at given bit offset
+        from the start of current view.
+        """
+        if isinstance(t, Alias):
+            return self.format_view_getter(t.type, offset)
+        if isinstance(t, Bool):
+            return f"self.bp_bool({offset})"
+        if isinstance(t, Int):
+            return f"self.bp_int({offset}, {t.nbits()})"
+        if isinstance(t, Message):
+            return f"{self.format_view_name(t)}.bp_at(self.bp_s, self.bp_i + {offset})"
+        if isinstance(t, Array):
+            return self.format_view_array(t, "self.bp_s", f"self.bp_i + {offset}")
+        return f"self.bp_uint({offset}, {t.nbits()})"
+
+    def collect_view_aheads(
+        self, t: Type, i: int, aheads: List[Tuple[int, int]]
+    ) -> None:
+        """Collects the extensible aheads in given type t starting at bit index i, as
+        tuples (offset, value), arrays are expanded.
+        """
+        if isinstance(t, Alias):
+            self.collect_view_aheads(t.type, i, aheads)
+        elif isinstance(t, Message):
+            if t.extensible:
+                aheads.append((i, t.nbits()))
+                i += t.ahead_nbits()
+            for field in t.sorted_fields():
+                self.collect_view_aheads(field.type, i, aheads)
+                i += field.type.nbits()
+        elif isinstance(t, Array):
+            if t.extensible:
+                aheads.append((i, t.cap))
+                i += t.ahead_nbits()
+            for _ in range(t.cap):
+                self.collect_view_aheads(t.element_type, i, aheads)
+                i += t.element_type.nbits()
+
+    def format_view_fields(self, message: Message) -> List[Tuple[str, str, str]]:
+        """Formats the fields of given message's view, as tuples (name, annotation,
+        getter expression).
+        """
+        items: List[Tuple[str, str, str]] = []
+        i = message.ahead_nbits() if message.extensible else 0
+        for field in message.sorted_fields():
+            name = self.format_message_field_name(field)
+            annotation = self.format_view_type(field.type)
+            items.append((name, annotation, self.format_view_getter(field.type, i)))
+            i += field.type.nbits()
+        return items
+
+    def format_view_aheads(self, message: Message) -> List[Tuple[int, int]]:
+        """Returns the extensible aheads of given message as tuples (offset, value)."""
+        aheads: List[Tuple[int, int]] = []
+        self.collect_view_aheads(message, 0, aheads)
+        return aheads
+
+    ###################
+    # Dict Conversion.
+    ###################
+
+    def format_enum_value_to_name_map_reference(self, t: Enum) -> str:
+        """Formats the reference to the value to name map of given enum, which may be
+        imported from another proto.
+        """
+        name = self.format_definition_name_inner_proto(t, Enum)
+        map_name = upper_case(f"_{name}_VALUE_TO_NAME_MAP")
+        return self.format_name_related_to_definition(t, map_name)
+
+    def format_to_dict_value(self, t: Type, v: str, depth: int = 0) -> str:
+        """Formats the expression converting given value expression v of type t to a
+        dict value, the same as dataclasses.asdict does, except enums are converted to
+        their names if variable enum_names is true.
+
+        :param depth: Depth of array nesting, to name the iteration variables.
+        """
+        if isinstance(t, Enum):
+            map_name = self.format_enum_value_to_name_map_reference(t)
+            return f"({map_name}.get({v}, {v}) if enum_names else {v})"
+        elif isinstance(t, Message):
+            return f"{v}.to_dict(enum_names)"
+        elif isinstance(t, Alias) and isinstance(t.type, Array):
+            return self.format_to_dict_value(t.type, v, depth)
+        elif isinstance(t, Array):
+            if isinstance(t.element_type, Byte):
+                return f"bytearray({v})"
+            x = f"x{depth}"
+            e = self.format_to_dict_value(t.element_type, x, depth + 1)
+            if e == x:
+                return f"list({v})"
+            return f"[{e} for {x} in {v}]"
+        return v
+
+    def format_to_dict_items(self, message: Message) -> List[Tuple[str, str]]:
+        """Formats the items of the dict converted from given message, as tuples (key,
+        value expression).
+        """
+        items: List[Tuple[str, str]] = []
+        for field in message.sorted_fields():
+            name = self.format_message_field_name(field)
+            value = self.format_to_dict_value(field.type, f"self.{name}")
+            items.append((self.format_str_value(name), value))
+        return items
+
+    def format_enum_name_to_value_map_reference(self, t: Enum) -> str:
+        """Formats the reference to the name to value map of given enum, which may be
+        imported from another proto.
+        """
+        name = self.format_definition_name_inner_proto(t, Enum)
+        map_name = upper_case(f"_{name}_NAME_TO_VALUE_MAP")
+        return self.format_name_related_to_definition(t, map_name)
+
+    def format_from_dict_value(self, t: Type, v: str, depth: int = 0) -> str:
+        """Formats the expression converting given dict value expression v to a value
+        of type t, the inverse of format_to_dict_value. Enums accept both values and
+        names, nested messages are constructed by their from_dict.
+        """
+        if isinstance(t, Enum):
+            map_name = self.format_enum_name_to_value_map_reference(t)
+            return f"{map_name}.get({v}, {v})"
+        elif isinstance(t, Message):
+            message_type = self.format_message_type(t)
+            return f"{message_type}.from_dict({v}, validate)"
+        elif isinstance(t, Alias) and isinstance(t.type, Array):
+            return self.format_from_dict_value(t.type, v, depth)
+        elif isinstance(t, Array):
+            if isinstance(t.element_type, Byte):
+                return f"bytearray({v})"
+            x = f"x{depth}"
+            e = self.format_from_dict_value(t.element_type, x, depth + 1)
+            if e == x:
+                return f"list({v})"
+            return f"[{e} for {x} in {v}]"
+        return v
+
+    def format_from_dict_items(self, message: Message) -> List[Tuple[str, str]]:
+        """Formats the keyword arguments constructing given message from a dict d, as
+        tuples (field name, value expression). Fields missing from the dict take their
+        default values.
+        """
+        items: List[Tuple[str, str]] = []
+        for field in message.sorted_fields():
+            name = self.format_message_field_name(field)
+            key = self.format_str_value(name)
+            default = self.format_default_value(field.type)
+            value = self.format_from_dict_value(field.type, f"d[{key}]")
+            if value == f"d[{key}]" and not isinstance(field.type, Alias):
+                # Plain values with literal defaults.
+                items.append((name, f"d.get({key}, {default})"))
+            else:
+                items.append((name, f"{value} if {key} in d else {default}"))
+        return items
+
+    def format_from_dict_range(self, t: Type) -> Optional[Tuple[int, int]]:
+        """Returns the range of the integer values of given type by its bits, or None if
+        t isn't an integer type, i.e. message.
+        """
+        if isinstance(t, Alias):
+            return self.format_from_dict_range(t.type)
+        if isinstance(t, Int):
+            upper = 1 << (t.nbits() - 1)
+            return -upper, upper - 1
+        if isinstance(t, (Bool, Byte, Uint, Enum)):
+            return 0, (1 << t.nbits()) - 1
+        return None
+
+    def format_from_dict_checks(self, message: Message) -> List[Tuple[str, str]]:
+        """Formats the validation of the fields of a message m constructed by from_dict,
+        as tuples (name of the checking function in bitprotolib, arguments), see
+        bp.check_range and bp.check_array.
+        """
+        checks: List[Tuple[str, str]] = []
+        for field in message.sorted_fields():
+            name = self.format_message_field_name(field)
+            label = self.format_str_value(f"{message.name}.{field.name}")
+            v = f"m.{name}"
+
+            t = field.type
+            shape: List[int] = []
+            while True:
+                if isinstance(t, Alias) and isinstance(t.type, Array):
+                    t = t.type
+                elif isinstance(t, Array):
+                    shape.append(t.cap)
+                    t = t.element_type
+                else:
+                    break
+
+            bounds = self.format_from_dict_range(t)
+            if shape:
+                args = f"{label}, {v}, ({', '.join(map(str, shape))},)"
+                if bounds is not None:
+                    args += f", {bounds[0]}, {bounds[1]}"
+                checks.append(("check_array", args))
+            elif bounds is not None:
+                checks.append(
+                    ("check_range", f"{label}, {v}, {bounds[0]}, {bounds[1]}")
+                )
+        return checks
+
+    ###################
+    # Struct Fast Path.
+    ###################
+
+    def collect_layout_fields(
+        self, t: Type, chain: str, offset: int, fields: List[LayoutField]
+    ) -> Optional[int]:
+        """Collects the base type fields of given type at given bit offset to fields,
+        in encoding order. Returns the bit offset after, or None if any message or
+        array in it is extensible, where the layout isn't fixed.
+        """
+        if isinstance(t, Alias):
+            return self.collect_layout_fields(t.type, chain, offset, fields)
+        if isinstance(t, Message):
+            if t.extensible:
+                return None
+            for field in t.sorted_fields():
+                name = self.format_message_field_name(field)
+                offset_ = self.collect_layout_fields(
+                    field.type, f"{chain}.{name}", offset, fields
+                )
+                if offset_ is None:
+                    return None
+                offset = offset_
+            return offset
+        if isinstance(t, Array):
+            if t.extensible:
+                return None
+            for k in range(t.cap):
+                offset_ = self.collect_layout_fields(
+                    t.element_type, f"{chain}[{k}]", offset, fields
+                )
+                if offset_ is None:
+                    return None
+                offset = offset_
+            return offset
+        fields.append((chain, t, offset))
+        return offset + t.nbits()
+
+    def is_struct_value(self, t: Type, offset: int) -> bool:
+        """Returns True if given base type at given bit offset is a byte-aligned
+        8/16/32/64 bits integer.
+        """
+        if not isinstance(t, (Byte, Int, Uint, Enum)):
+            return False
+        return offset % 8 == 0 and t.nbits() in STRUCT_FORMATS
+
+    def format_struct_layout(self, message: Message, chain: str) -> List[StructItem]:
+        """Splits the layout of given message into struct items, in encoding order.
+        Byte-aligned 8/16/32/64 bits integers are items of single values, the unaligned
+        fields in between are grouped into segments of whole bytes, processed as
+        integers by shifts and masks. Returns empty list if the message isn't fixed in
+        layout, i.e. extensible.
+        """
+        fields: List[LayoutField] = []
+        nbits = self.collect_layout_fields(message, chain, 0, fields)
+        if nbits is None or nbits == 0:
+            return []
+
+        items: List[StructItem] = []
+        segment: List[LayoutField] = []
+
+        def flush(end: int) -> None:
+            # Groups the pending fields into a segment ends at bit offset end.
+            if segment:
+                start = segment[0][2]
+                nbytes = (end - start + 7) >> 3
+                items.append(
+                    (False, nbytes, [(v, t, i - start) for v, t, i in segment])
+                )
+                segment.clear()
+
+        for v, t, offset in fields:
+            if self.is_struct_value(t, offset):
+                flush(offset)
+                items.append((True, t.nbits() >> 3, [(v, t, 0)]))
+            else:
+                segment.append((v, t, offset))
+        flush(nbits)
+        return items
+
+    def has_struct_layout(self, message: Message) -> bool:
+        """Returns True if given message has byte-aligned values in its struct layout,
+        i.e. worth a struct.Struct to process.
+        """
+        items = self.format_struct_layout(message, "")
+        return any(aligned for aligned, _, _ in items)
+
+    def format_struct_name(self, message: Message, encoding: bool = False) -> str:
+        """Formats the name of the struct.Struct of given message.
+        Encoding packs unsigned integers, values are masked to their bits, the same as
+        the bit by bit processing does. Decoding unpacks signed integers as signed.
+        """
+        message_name = self.format_message_name(message)
+        if encoding:
+            return upper_case(f"_{message_name}_ENCODING_STRUCT")
+        return upper_case(f"_{message_name}_STRUCT")
+
+    def format_struct_format(self, message: Message, encoding: bool = False) -> str:
+        """Formats the format string of the struct.Struct of given message, in little
+        endian, e.g. "<iii". Segments of 1/2/4/8 bytes are unpacked as unsigned
+        integers, others as bytes.
+        """
+        chars: List[str] = ["<"]
+        for aligned, nbytes, fields in self.format_struct_layout(message, ""):
+            if aligned:
+                char = STRUCT_FORMATS[nbytes << 3]
+                t = fields[0][1]
+                if encoding or not self.format_op_mode_int_caster(t):
+                    char = char.upper()  # Unsigned
+                chars.append(char)
+            elif (nbytes << 3) in STRUCT_FORMATS:
+                chars.append(STRUCT_FORMATS[nbytes << 3].upper())
+            else:
+                chars.append(f"{nbytes}s")
+        return self.format_str_value("".join(chars))
+
+    def format_struct_segment_terms(self, fields: List[LayoutField]) -> List[str]:
+        """Formats the terms to or into the integer of a segment on encoding."""
+        terms: List[str] = []
+        for v, t, i in fields:
+            term = f"({v} & {(1 << t.nbits()) - 1})"
+            terms.append(f"{term} << {i}" if i else term)
+        return terms
+
+    def format_struct_segment_value(self, n: str, t: Type, i: int) -> str:
+        """Formats the expression of the value of given type at bit offset i of the
+        integer n of a segment on decoding.
+        """
+        nbits = t.nbits()
+        data = (
+            f"({n} >> {i}) & {(1 << nbits) - 1}" if i else f"{n} & {(1 << nbits) - 1}"
+        )
+        if self.is_op_mode_bool(t):
+            return f"bool({data})"
+        if self.format_op_mode_int_caster(t):
+            sign = 1 << (nbits - 1)
+            return f"(({data}) ^ {sign}) - {sign}"
+        return data
+
+    def format_struct_slice(self, o: str, nbytes: int) -> str:
+        """Formats the slice of nbytes bytes of buffer s at byte offset o."""
+        if o == "0":
+            return f"s[:{nbytes}]"
+        return f"s[{o} : {o} + {nbytes}]"
+
+    def format_struct_encoder(self, message: Message, chain: str, o: str) -> List[str]:
+        """Formats the statements encoding given message into buffer s at byte offset
+        o, by its struct layout. Without byte-aligned values, the whole message is a
+        single segment, converted to bytes directly.
+        """
+        items = self.format_struct_layout(message, chain)
+        use_struct = any(aligned for aligned, _, _ in items)
+        lines: List[str] = []
+        args: List[str] = []
+        for k, (aligned, nbytes, fields) in enumerate(items):
+            if aligned:
+                v, t, _ = fields[0]
+                args.append(f"{v} & {(1 << t.nbits()) - 1}")
+                continue
+            n = f"n{k}"
+            terms = self.format_struct_segment_terms(fields)
+            for j in range(0, len(terms), MAX_TERMS_PER_EXPRESSION):
+                expression = " | ".join(terms[j : j + MAX_TERMS_PER_EXPRESSION])
+                lines.append(f"{n} {'|=' if j else '='} {expression}")
+            if use_struct and (nbytes << 3) in STRUCT_FORMATS:
+                args.append(n)
+            else:
+                args.append(f'{n}.to_bytes({nbytes}, "little")')
+
+        if not use_struct:
+            data = self.format_struct_slice(o, message.nbytes())
+            lines.append(f"{data} = {args[0]}")
+            return lines
+
+        struct_name = self.format_struct_name(message, True)
+        lines.append(f"{struct_name}.pack_into(")
+        lines.extend(f"    {arg}," for arg in ["s", o] + args)
+        lines.append(")")
+        return lines
+
+    def format_struct_decoder(self, message: Message, chain: str, o: str) -> List[str]:
+        """Formats the statements decoding given message from buffer s at byte offset
+        o, by its struct layout. Without byte-aligned values, the whole message is a
+        single segment, converted from bytes directly.
+        """
+        items = self.format_struct_layout(message, chain)
+        use_struct = any(aligned for aligned, _, _ in items)
+        lines: List[str] = []
+        targets: List[str] = []
+        assignments: List[str] = []
+        for k, (aligned, nbytes, fields) in enumerate(items):
+            if aligned:
+                targets.append(fields[0][0])
+                continue
+            n = f"n{k}"
+            if not use_struct:
+                data = self.format_struct_slice(o, nbytes)
+                assignments.append(f'{n} = int.from_bytes({data}, "little")')
+            elif (nbytes << 3) in STRUCT_FORMATS:
+                targets.append(n)
+            else:
+                targets.append(f"b{k}")
+                assignments.append(f'{n} = int.from_bytes(b{k}, "little")')
+            for v, t, i in fields:
+                value = self.format_struct_segment_value(n, t, i)
+                assignments.append(f"{v} = {value}")
+
+        if use_struct:
+            struct_name = self.format_struct_name(message)
+            lines.append("(")
+            lines.extend(f"    {target}," for target in targets)
+            lines.append(f") = {struct_name}.unpack_from(s, {o})")
+        return lines + assignments
+
+    def format_struct_codec_name(self, message: Message, encoding: bool) -> str:
+        """Formats the name of the generated function encoding or decoding given
+        message by its struct layout.
+        """
+        message_name = self.format_message_name(message)
+        if encoding:
+            return f"bp_struct_encode_{message_name}"
+        return f"bp_struct_decode_{message_name}"
+
+    ###################
+    # Optimization Mode.
+    ###################
+
+    def format_op_mode_int_caster(self, t: Type) -> str:
+        """Returns the name of the generated function to cast given integer type to
+        signed integer in optimization mode. Returns empty string if t is not signed.
+        """
+        if isinstance(t, Alias):
+            return self.format_op_mode_int_caster(t.type)
+        if isinstance(t, Int):
+            return "bp_int{0}".format(self.get_nbits_of_integer(t))
+        return ""
+
+    def is_op_mode_bool(self, t: Type) -> bool:
+        """Returns True if given type is bool or an alias to bool."""
+        if isinstance(t, Alias):
+            return self.is_op_mode_bool(t.type)
+        return isinstance(t, Bool)
+
+
+class PyFormatterOpMode(PyFormatter):
+    """Formatter for Python language in optimization mode, where the generated code
+    doesn't import bitprotolib.
+    """
+
+    @override(PyFormatter)
+    def format_default_value_byte(self) -> str:
+        return "0"
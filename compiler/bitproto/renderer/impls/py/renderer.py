@@ -16,6 +16,7 @@ from bitproto._ast import (
     Message,
     MessageField,
     SingleType,
+    Type,
 )
 from bitproto.renderer.block import (
     Block,
@@ -32,8 +33,9 @@ from bitproto.renderer.block import (
     BlockWrapper,
 )
 from bitproto.renderer.impls.py.formatter import PyFormatter as F
+from bitproto.renderer.impls.py.formatter import PyFormatterOpMode
 from bitproto.renderer.renderer import Renderer
-from bitproto.utils import cached_property, override
+from bitproto.utils import cached_property, overridable, override
 
 
 class BlockProtoDocstring(BlockBindProto[F]):
@@ -46,8 +48,11 @@ class BlockGeneralImports(Block[F]):
     @override(Block)
     def render(self) -> None:
         self.push("import json")
+        self.push("import struct")
         self.push("from dataclasses import dataclass, field")
-        self.push("from typing import ClassVar, Dict, List")
+        self.push(
+            "from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Type"
+        )
         self.push_empty_line()
         self.push("from bitprotolib import bp")
 
@@ -202,6 +207,39 @@ class BlockEnumValueToNameMap(BlockBindEnum[F], BlockWrapper[F]):
         self.push("}")
 
 
+class BlockEnumNameToValueMapItem(BlockBindEnumField[F]):
+    @override(Block)
+    def render(self) -> None:
+        self.push(f'"{self.enum_field_name}": {self.enum_field_value},')
+
+
+class BlockEnumNameToValueMapItemList(BlockBindEnum[F], BlockComposition[F]):
+    @override(BlockComposition)
+    def blocks(self) -> List[Block]:
+        return [
+            BlockEnumNameToValueMapItem(field, indent=4) for field in self.d.fields()
+        ]
+
+    @override(BlockComposition)
+    def separator(self) -> str:
+        return "\n"
+
+
+class BlockEnumNameToValueMap(BlockBindEnum[F], BlockWrapper[F]):
+    @override(BlockWrapper)
+    def wraps(self) -> Block:
+        return BlockEnumNameToValueMapItemList(self.d)
+
+    @override(BlockWrapper)
+    def before(self) -> None:
+        map_name = self.formatter.format_enum_name_to_value_map_name(self.d)
+        self.push(f"{map_name}: Dict[str, {self.enum_name}] = {{")
+
+    @override(BlockWrapper)
+    def after(self) -> None:
+        self.push("}")
+
+
 class BlockEnumMethodProcessor(BlockBindEnum[F]):
     @override(Block)
     def render(self) -> None:
@@ -217,6 +255,7 @@ class BlockEnum(BlockBindEnum[F], BlockComposition[F]):
         return [
             BlockEnumFieldListWrapper(self.d),
             BlockEnumValueToNameMap(self.d),
+            BlockEnumNameToValueMap(self.d),
             BlockEnumMethodProcessor(self.d),
         ]
 
@@ -251,6 +290,14 @@ class BlockMessageSize(BlockMessageBase):
         )
 
 
+class BlockMessageTypeId(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        type_id = self.formatter.format_message_type_id(self.d)
+        self.push_comment(f"Type id of class {self.message_name} in framing")
+        self.push(f"BP_TYPE_ID: ClassVar[int] = {type_id}")
+
+
 class BlockMessageFieldList(BlockMessageBase, BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block]:
@@ -269,6 +316,7 @@ class BlockMessageClassDefs(BlockMessageBase, BlockComposition[F]):
     def blocks(self) -> List[Block]:
         return [
             BlockMessageSize(self.d, indent=self.indent),
+            BlockMessageTypeId(self.d, indent=self.indent),
             BlockMessageFieldList(self.d, indent=self.indent),
         ]
 
@@ -284,6 +332,8 @@ class BlockMessageClass(BlockMessageBase, BlockWrapper[F]):
 
     @override(BlockWrapper)
     def before(self) -> None:
+        if self.d.bound.get_option_as_bool_or_raise("py.slots"):
+            self.push("@bp.add_slots")
         self.push("@dataclass")
         self.push(f"class {self.message_name}(bp.MessageBase):")
         self.push_definition_docstring(indent=4)
@@ -317,7 +367,8 @@ class BlockMessageMethodProcessor(BlockMessageBase, BlockWrapper[F]):
 
     @override(BlockWrapper)
     def before(self) -> None:
-        self.push("def bp_processor(self) -> bp.Processor:")
+        self.push("@classmethod")
+        self.push("def bp_build_processor(cls) -> bp.Processor:")
         self.push("field_processors: List[bp.Processor] = [", indent=self.indent + 4)
 
     @override(BlockWrapper)
@@ -335,301 +386,827 @@ class BlockMessageMethodProcessor(BlockMessageBase, BlockWrapper[F]):
         )
 
 
-class BlockMessageMethodGetSetByteItemBase(BlockBindMessageField[F]):
-    def __init__(
-        self,
-        *args: Any,
-        **kwds: Any,
-    ) -> None:
-        super().__init__(*args, **kwds)
-        self.array_depth: int = 0
+class BlockMessageMethodBatchLayout(BlockMessageBase):
+    def render_list(self, name: str, type_name: str, items: List[str]) -> None:
+        if not items:
+            self.push(f"{name}: List[{type_name}] = []", indent=self.indent + 4)
+            return
+        self.push(f"{name}: List[{type_name}] = [", indent=self.indent + 4)
+        for item in items:
+            self.push(f"{item},", indent=self.indent + 8)
+        self.push("]", indent=self.indent + 4)
+
+    @override(Block)
+    def render(self) -> None:
+        fields, aheads = self.formatter.format_batch_layout(self.d)
+        self.push("@classmethod")
+        self.push("def bp_build_batch_layout(cls) -> bp.BatchLayout:")
+        self.render_list("fields", "bp.BatchField", fields)
+        if aheads:
+            self.render_list("aheads", "bp.BatchAhead", aheads)
+            layout = f"bp.BatchLayout({self.message_nbytes}, fields, aheads)"
+        else:
+            layout = f"bp.BatchLayout({self.message_nbytes}, fields)"
+        self.push(f"return {layout}", indent=self.indent + 4)
+
+
+# Messages dispatching on more fields than this threshold use a class level dispatch
+# table of per-field methods, others use an if-elif chain.
+DISPATCH_TABLE_NFIELDS_THRESHOLD = 8
+
+
+def get_underlying_type(t: Type) -> Type:
+    """Returns the underlying type of given type t, by unwrapping aliases and arrays."""
+    while True:
+        if isinstance(t, Alias):
+            t = t.type
+        elif isinstance(t, Array):
+            t = t.element_type
+        else:
+            return t
+
+
+def get_array_depth(t: Type) -> int:
+    """Returns the number of array levels to index before reaching the underlying
+    type of given type t."""
+    depth = 0
+    while True:
+        if isinstance(t, Alias):
+            t = t.type
+        elif isinstance(t, Array):
+            t = t.element_type
+            depth += 1
+        else:
+            return depth
+
+
+class BlockMessageMethodDispatchItemBase(BlockBindMessageField[F]):
+    """Renders a field's case body of a dispatching method."""
 
     def format_data_ref(self) -> str:
-        array_indexing = "".join(f"[di.i({i})]" for i in range(self.array_depth))
+        depth = get_array_depth(self.d.type)
+        array_indexing = "".join(f"[di.i({i})]" for i in range(depth))
         return f"self.{self.message_field_name}" + array_indexing
 
-    def render_case(self) -> None:
-        field_number = self.formatter.format_int_value(self.d.number)
-        self.push(f"if di.field_number == {field_number}:")
+
+class BlockMessageMethodDispatchBase(BlockMessageBase):
+    """Renders a method dispatching on di.field_number, as an if-elif chain ordered by
+    field number, or a dispatch table for messages with many fields.
+    """
 
     @abstractmethod
-    def render_single(self, single: SingleType) -> None:
+    def method_name(self) -> str:
         raise NotImplementedError
 
-    def render_array(self, array: Array) -> None:
-        try:
-            self.array_depth += 1
-            if isinstance(array.element_type, SingleType):
-                return self.render_single(array.element_type)
-            if isinstance(array.element_type, Alias):
-                return self.render_alias(array.element_type)
-        finally:
-            self.array_depth -= 1
+    @abstractmethod
+    def method_params(self) -> str:
+        """Returns the parameters of the method, without self and their annotations."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def method_annotated_params(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def method_return_type(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def method_default(self) -> str:
+        """Returns the statement to run if no field matches."""
+        raise NotImplementedError
 
-    def render_alias(self, alias: Alias) -> None:
-        if isinstance(alias.type, SingleType):
-            return self.render_single(alias.type)
-        if isinstance(alias.type, Array):
-            return self.render_array(alias.type)
+    @abstractmethod
+    def dispatch_table_name(self) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def is_dispatched(self, field: MessageField) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def item(self, field: MessageField, indent: int) -> Block[F]:
+        raise NotImplementedError
+
+    def format_signature(self, name: str) -> str:
+        params = self.method_annotated_params()
+        return_type = self.method_return_type()
+        return f"def {name}(self, {params}) -> {return_type}:"
+
+    def format_field_method_name(self, field: MessageField) -> str:
+        field_number = self.formatter.format_int_value(field.number)
+        return f"_{self.method_name()}_{field_number}"
+
+    def render_chain(self, fields: List[MessageField]) -> None:
+        self.push(self.format_signature(self.method_name()))
+        for i, field in enumerate(fields):
+            keyword = "if" if i == 0 else "elif"
+            field_number = self.formatter.format_int_value(field.number)
+            self.push(
+                f"{keyword} di.field_number == {field_number}:",
+                indent=self.indent + 4,
+            )
+            self._render_from_block(self.item(field, indent=self.indent + 8))
+        self.push(self.method_default(), indent=self.indent + 4)
+
+    def render_table(self, fields: List[MessageField]) -> None:
+        for field in fields:
+            self.push(self.format_signature(self.format_field_method_name(field)))
+            self._render_from_block(self.item(field, indent=self.indent + 4))
+            self.push("", indent=0)
+
+        table_name = self.dispatch_table_name()
+        return_type = self.method_return_type()
+        self.push(
+            f"{table_name}: ClassVar[Dict[int, Callable[..., {return_type}]]] = {{"
+        )
+        for field in fields:
+            field_number = self.formatter.format_int_value(field.number)
+            method_name = self.format_field_method_name(field)
+            self.push(f"{field_number}: {method_name},", indent=self.indent + 4)
+        self.push("}")
+        self.push("", indent=0)
+
+        # Unknown field numbers run the same default as the if-elif chain.
+        self.push(self.format_signature(self.method_name()))
+        self.push(
+            f"method = self.{table_name}.get(di.field_number)", indent=self.indent + 4
+        )
+        self.push("if method is None:", indent=self.indent + 4)
+        self.push(self.method_default(), indent=self.indent + 8)
+        call = f"method(self, {self.method_params()})"
+        if return_type != "None":
+            call = f"return {call}"
+        self.push(call, indent=self.indent + 4)
 
     @override(Block)
     def render(self) -> None:
-        if isinstance(self.d.type, SingleType):
-            return self.render_single(self.d.type)
-        if isinstance(self.d.type, Array):
-            return self.render_array(self.d.type)
-        if isinstance(self.d.type, Alias):
-            return self.render_alias(self.d.type)
+        fields = [f for f in self.d.sorted_fields() if self.is_dispatched(f)]
+        if len(fields) > DISPATCH_TABLE_NFIELDS_THRESHOLD:
+            self.render_table(fields)
+        else:
+            self.render_chain(fields)
 
 
-class BlockMessageMethodSetByteItem(BlockMessageMethodGetSetByteItemBase):
-    @override(BlockMessageMethodGetSetByteItemBase)
-    def render_single(self, single: SingleType) -> None:
+class BlockMessageMethodSetValueItem(BlockMessageMethodDispatchItemBase):
+    @override(Block)
+    def render(self) -> None:
+        single = get_underlying_type(self.d.type)
         left = self.format_data_ref()
-        assign = "|="
-        type_name = self.formatter.format_type(single)
-        shift = "<< lshift"
-        caster = ""
+        right = "v"
 
         if isinstance(single, Bool):
-            assign = "="
-            type_name = "bool"
-            shift = ""
-        if isinstance(single, Int):
+            right = "bool(v)"
+        elif isinstance(single, Int):
             # Cast to signed-int if overflows
             # Python dosen't have a type for int8, int16..
-            caster = "bp.int{}".format(self.formatter.get_nbits_of_integer(single))
+            nbits = self.formatter.get_nbits_of_integer(single)
+            right = f"bp.int{nbits}(v)"
+
+        self.push(f"{left} = {right}")
+
+
+class BlockMessageMethodSetValue(BlockMessageMethodDispatchBase):
+    @override(BlockMessageMethodDispatchBase)
+    def method_name(self) -> str:
+        return "bp_set_value"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_params(self) -> str:
+        return "di, v"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_annotated_params(self) -> str:
+        return "di: bp.DataIndexer, v: int"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_return_type(self) -> str:
+        return "None"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_default(self) -> str:
+        return "return"
+
+    @override(BlockMessageMethodDispatchBase)
+    def dispatch_table_name(self) -> str:
+        return "_BP_VALUE_SETTERS"
+
+    @override(BlockMessageMethodDispatchBase)
+    def is_dispatched(self, field: MessageField) -> bool:
+        return isinstance(get_underlying_type(field.type), SingleType)
+
+    @override(BlockMessageMethodDispatchBase)
+    def item(self, field: MessageField, indent: int) -> Block[F]:
+        return BlockMessageMethodSetValueItem(field, indent=indent)
+
+
+class BlockMessageMethodGetValueItem(BlockMessageMethodDispatchItemBase):
+    @override(Block)
+    def render(self) -> None:
+        single = get_underlying_type(self.d.type)
+        value = data = self.format_data_ref()
+
+        if isinstance(single, Bool):
+            value = f"int({data})"
+
+        self.push(f"return {value}")
+
+
+class BlockMessageMethodGetValue(BlockMessageMethodDispatchBase):
+    @override(BlockMessageMethodDispatchBase)
+    def method_name(self) -> str:
+        return "bp_get_value"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_params(self) -> str:
+        return "di"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_annotated_params(self) -> str:
+        return "di: bp.DataIndexer"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_return_type(self) -> str:
+        return "int"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_default(self) -> str:
+        return "return 0  # Won't reached"
+
+    @override(BlockMessageMethodDispatchBase)
+    def dispatch_table_name(self) -> str:
+        return "_BP_VALUE_GETTERS"
+
+    @override(BlockMessageMethodDispatchBase)
+    def is_dispatched(self, field: MessageField) -> bool:
+        return isinstance(get_underlying_type(field.type), SingleType)
+
+    @override(BlockMessageMethodDispatchBase)
+    def item(self, field: MessageField, indent: int) -> Block[F]:
+        return BlockMessageMethodGetValueItem(field, indent=indent)
+
+
+class BlockMessageMethodGetAccessorItem(BlockMessageMethodDispatchItemBase):
+    @override(Block)
+    def render(self) -> None:
+        data = self.format_data_ref()
+        self.push(f"return {data}")
+
+
+class BlockMessageMethodGetAccessor(BlockMessageMethodDispatchBase):
+    @override(BlockMessageMethodDispatchBase)
+    def method_name(self) -> str:
+        return "bp_get_accessor"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_params(self) -> str:
+        return "di"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_annotated_params(self) -> str:
+        return "di: bp.DataIndexer"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_return_type(self) -> str:
+        return "bp.Accessor"
+
+    @override(BlockMessageMethodDispatchBase)
+    def method_default(self) -> str:
+        return "return bp.NilAccessor() # Won't reached"
+
+    @override(BlockMessageMethodDispatchBase)
+    def dispatch_table_name(self) -> str:
+        return "_BP_ACCESSOR_GETTERS"
 
-        right = value = f"{type_name}(b)"
+    @override(BlockMessageMethodDispatchBase)
+    def is_dispatched(self, field: MessageField) -> bool:
+        return isinstance(get_underlying_type(field.type), Message)
 
-        if shift:
-            right = f"({value} {shift})"
+    @override(BlockMessageMethodDispatchBase)
+    def item(self, field: MessageField, indent: int) -> Block[F]:
+        return BlockMessageMethodGetAccessorItem(field, indent=indent)
 
-        self.render_case()
 
-        if caster:
-            self.push(f"{left} {assign} {caster}({right})", indent=self.indent + 4)
+class BlockMessageMethodEncode(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        self.push(f"def encode(self) -> bytearray:")
+        self.push_docstring("Encode this object to bytearray.", indent=self.indent + 4)
+        self.push(f"s = bytearray(self.BYTES_LENGTH)", indent=self.indent + 4)
+        if self.formatter.has_struct_layout(self.d):
+            encoder = self.formatter.format_struct_codec_name(self.d, True)
+            self.push(f"{encoder}(self, s, 0)", indent=self.indent + 4)
+            self.push(f"return s", indent=self.indent + 4)
+            return
+        self.push(f"ctx = bp.ProcessContext(True, s)", indent=self.indent + 4)
+        self.push(f"self.bp_plan().process(ctx, self)", indent=self.indent + 4)
+        self.push(f"return ctx.s", indent=self.indent + 4)
+
+
+class BlockMessageMethodDecode(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        self.push(
+            f"def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:"
+        )
+        self.push_docstring(
+            "Decode given bytearray s to this object.",
+            ":param s: A bytearray with length at least `BYTES_LENGTH`.",
+            ":param fields: Optional dotted paths of the fields to decode, e.g.",
+            '   ["status", "power.battery"], other fields are skipped.',
+            indent=self.indent + 4,
+        )
+        self.push(
+            f"assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()",
+            indent=self.indent + 4,
+        )
+        if self.formatter.has_struct_layout(self.d):
+            decoder = self.formatter.format_struct_codec_name(self.d, False)
+            self.push(f"if fields is None:", indent=self.indent + 4)
+            self.push(f"{decoder}(self, s, 0)", indent=self.indent + 8)
+            self.push(f"else:", indent=self.indent + 4)
+            self.push(f"ctx = bp.ProcessContext(False, s)", indent=self.indent + 8)
+            self.push(
+                f"self.bp_partial_plan(fields).process(ctx, self)",
+                indent=self.indent + 8,
+            )
+            return
+        self.push(f"ctx = bp.ProcessContext(False, s)", indent=self.indent + 4)
+        self.push(f"if fields is None:", indent=self.indent + 4)
+        self.push(f"self.bp_plan().process(ctx, self)", indent=self.indent + 8)
+        self.push(f"else:", indent=self.indent + 4)
+        self.push(
+            f"self.bp_partial_plan(fields).process(ctx, self)", indent=self.indent + 8
+        )
+
+
+class BlockMessageMethodStructCodecs(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        if not self.formatter.has_struct_layout(self.d):
+            return
+        encoder = self.formatter.format_struct_codec_name(self.d, True)
+        decoder = self.formatter.format_struct_codec_name(self.d, False)
+        self.push("@classmethod")
+        self.push(
+            "def bp_struct_codecs(cls) -> Tuple[Optional[bp.Codec], Optional[bp.Codec]]:"
+        )
+        self.push(f"return {encoder}, {decoder}", indent=self.indent + 4)
+
+
+class BlockMessageMethodToDict(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        self.push("def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:")
+        self.push_docstring(
+            "Converts this message to a dict.",
+            ":param enum_names: Whether to convert enum values to their names.",
+            indent=self.indent + 4,
+        )
+        items = self.formatter.format_to_dict_items(self.d)
+        if not items:
+            self.push("return {}", indent=self.indent + 4)
+            return
+        self.push("return {", indent=self.indent + 4)
+        for key, value in items:
+            self.push(f"{key}: {value},", indent=self.indent + 8)
+        self.push("}", indent=self.indent + 4)
+
+
+class BlockMessageMethodFromDict(BlockMessageBase):
+    @overridable
+    def checker(self, function: str) -> str:
+        """Returns the reference to given checking function in bitprotolib."""
+        return f"bp.{function}"
+
+    @override(Block)
+    def render(self) -> None:
+        self.push("@classmethod")
+        self.push(
+            f'def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "{self.message_name}":'
+        )
+        self.push_docstring(
+            "Constructs a message from given dict, the inverse of to_dict.",
+            "Missing keys take default values, enums accept both values and names.",
+            ":param validate: Whether to check values are in the range of the bits of",
+            "   their fields, raises ValueError otherwise.",
+            indent=self.indent + 4,
+        )
+        items = self.formatter.format_from_dict_items(self.d)
+        checks = self.formatter.format_from_dict_checks(self.d)
+        if not items:
+            self.push("return cls()", indent=self.indent + 4)
+            return
+        self.push("m = cls(", indent=self.indent + 4)
+        for name, value in items:
+            self.push(f"{name}={value},", indent=self.indent + 8)
+        self.push(")", indent=self.indent + 4)
+        if checks:
+            self.push("if validate:", indent=self.indent + 4)
+            for function, args in checks:
+                self.push(f"{self.checker(function)}({args})", indent=self.indent + 8)
+        self.push("return m", indent=self.indent + 4)
+
+
+class BlockMessageStructs(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        if not self.formatter.has_struct_layout(self.d):
+            return
+        self.push_comment(
+            f"Structs of message {self.message_name}, for the fast path of encoding "
+            "and decoding."
+        )
+        name = self.formatter.format_struct_name(self.d)
+        format_s = self.formatter.format_struct_format(self.d)
+        self.push(f"{name} = struct.Struct({format_s})")
+
+        encoding_name = self.formatter.format_struct_name(self.d, True)
+        encoding_format_s = self.formatter.format_struct_format(self.d, True)
+        if encoding_format_s == format_s:  # No signed byte-aligned integers.
+            self.push(f"{encoding_name} = {name}")
+        else:
+            self.push(f"{encoding_name} = struct.Struct({encoding_format_s})")
+
+
+class BlockMessageStructCodec(BlockMessageBase):
+    """Renders the function encoding or decoding a message by its struct layout, with
+    the signature of codecs in bitprotolib, see MessageBase.bp_struct_codecs.
+    """
+
+    def __init__(self, d: Message, encoding: bool, indent: int = 0) -> None:
+        super().__init__(d, indent=indent)
+        self.encoding = encoding
+
+    @override(Block)
+    def render(self) -> None:
+        if not self.formatter.has_struct_layout(self.d):
+            return
+        name = self.formatter.format_struct_codec_name(self.d, self.encoding)
+        self.push(
+            f'def {name}(m: "{self.message_name}", s: bp.Buffer, o: int) -> bool:'
+        )
+        self.push(f"if len(s) - o < {self.d.nbytes()}:", indent=4)
+        self.push("return False", indent=8)
+        if self.encoding:
+            lines = self.formatter.format_struct_encoder(self.d, "m", "o")
         else:
-            self.push(f"{left} {assign} {right}", indent=self.indent + 4)
+            lines = self.formatter.format_struct_decoder(self.d, "m", "o")
+        for line in lines:
+            self.push(line, indent=4)
+        self.push("return True", indent=4)
 
 
-class BlockMessageMethodSetByteItemDefault(Block[F]):
+class BlockMessageViewConstants(BlockMessageBase):
     @override(Block)
     def render(self) -> None:
-        self.push(f"return")
+        self.push("__slots__ = ()")
+        self.push(f"BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = {self.message_name}")
 
+        aheads = self.formatter.format_view_aheads(self.d)
+        if aheads:
+            self.push("BP_AHEADS: ClassVar[Tuple[Tuple[int, int], ...]] = (")
+            for offset, value in aheads:
+                self.push(f"({offset}, {value}),", indent=self.indent + 4)
+            self.push(")")
 
-class BlockMessageMethodSetByteItemList(BlockMessageBase, BlockComposition[F]):
+
+class BlockMessageViewProperty(Block[F]):
+    def __init__(self, name: str, annotation: str, getter: str, indent: int = 0):
+        super().__init__(indent=indent)
+        self.name = name
+        self.annotation = annotation
+        self.getter = getter
+
+    @override(Block)
+    def render(self) -> None:
+        self.push("@property")
+        self.push(f"def {self.name}(self) -> {self.annotation}:")
+        self.push(f"return {self.getter}", indent=self.indent + 4)
+
+
+class BlockMessageViewClassDefs(BlockMessageBase, BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block[F]]:
-        b: List[Block[F]] = [
-            BlockMessageMethodSetByteItem(field, indent=self.indent)
-            for field in self.d.sorted_fields()
-        ]
-        b.append(BlockMessageMethodSetByteItemDefault(indent=self.indent))
-        return b
+        blocks: List[Block[F]] = [BlockMessageViewConstants(self.d, indent=self.indent)]
+        for name, annotation, getter in self.formatter.format_view_fields(self.d):
+            blocks.append(
+                BlockMessageViewProperty(name, annotation, getter, indent=self.indent)
+            )
+        return blocks
 
     @override(BlockComposition)
     def separator(self) -> str:
-        return "\n"
+        return "\n\n"
 
 
-class BlockMessageMethodSetByte(BlockBindMessage[F], BlockWrapper[F]):
+class BlockMessageView(BlockMessageBase, BlockWrapper[F]):
     @override(BlockWrapper)
     def wraps(self) -> Block[F]:
-        return BlockMessageMethodSetByteItemList(self.d, indent=self.indent + 4)
+        return BlockMessageViewClassDefs(self.d, indent=4)
 
     @override(BlockWrapper)
     def before(self) -> None:
-        self.push(
-            f"def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:"
+        view_name = self.formatter.format_view_name(self.d)
+        self.push(f"class {view_name}(bp.MessageView):")
+        self.push_docstring(
+            f"Read-only view of {self.message_name} in a buffer, "
+            "decodes fields on access.",
+            indent=4,
         )
 
 
-class BlockMessageMethodGetByteItem(BlockMessageMethodGetSetByteItemBase):
-    @override(BlockMessageMethodGetSetByteItemBase)
-    def render_single(self, single: SingleType) -> None:
-        shift = ">> rshift"
-        value = data = self.format_data_ref()
+class BlockMessage(BlockMessageBase, BlockComposition[F]):
+    @override(BlockComposition)
+    def blocks(self) -> List[Block[F]]:
+        return [
+            BlockMessageClass(self.d),
+            BlockMessageMethodProcessor(self.d, indent=4),
+            BlockMessageMethodSetValue(self.d, indent=4),
+            BlockMessageMethodGetValue(self.d, indent=4),
+            BlockMessageMethodGetAccessor(self.d, indent=4),
+            BlockMessageMethodEncode(self.d, indent=4),
+            BlockMessageMethodDecode(self.d, indent=4),
+            BlockMessageMethodStructCodecs(self.d, indent=4),
+            BlockMessageMethodToDict(self.d, indent=4),
+            BlockMessageMethodFromDict(self.d, indent=4),
+            BlockMessageMethodBatchLayout(self.d, indent=4),
+            BlockMessageView(self.d),
+            BlockMessageStructs(self.d),
+            BlockMessageStructCodec(self.d, True),
+            BlockMessageStructCodec(self.d, False),
+        ]
 
-        if isinstance(single, Bool):
-            value = f"int({data})"
+    @override(BlockComposition)
+    def separator(self) -> str:
+        return "\n\n"
+
+
+class BlockBoundDefinitionList(BlockBoundDefinitionDispatcher):
+    @override(BlockBoundDefinitionDispatcher)
+    def dispatch(self, d: BoundDefinition) -> Optional[Block[F]]:
+        if isinstance(d, Alias):
+            return BlockAlias(d)
+        if isinstance(d, Constant):
+            return BlockConstant(d)
+        if isinstance(d, Enum):
+            return BlockEnum(d)
+        if isinstance(d, Message):
+            return BlockMessage(d)
+        return None
+
+    @override(BlockComposition)
+    def separator(self) -> str:
+        return "\n\n\n"
 
-        self.render_case()
-        self.push(f"return ({value} {shift}) & 255", indent=self.indent + 4)
 
+class BlockMessageRegistryItem(BlockBindMessage[F]):
+    def __init__(self, d: Message, collides: bool, indent: int = 0) -> None:
+        super().__init__(d, indent=indent)
+        self.collides = collides
 
-class BlockMessageMethodGetByteItemDefault(Block[F]):
     @override(Block)
     def render(self) -> None:
-        self.push(f"return bp.byte(0)  # Won't reached")
+        type_id = self.formatter.format_message_type_id(self.d)
+        if self.collides:
+            # Left out, registering both colliding classes raises ValueError.
+            self.push_comment(
+                f"{self.message_name}: type id {type_id} collides, set option type_id"
+            )
+            return
+        self.push(f"{type_id}: {self.message_name},")
 
 
-class BlockMessageMethodGetByteItemList(BlockMessageBase, BlockComposition[F]):
+class BlockMessageRegistryItemList(BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block[F]]:
-        b: List[Block[F]] = [
-            BlockMessageMethodGetByteItem(field, indent=self.indent)
-            for field in self.d.sorted_fields()
+        messages = [
+            message
+            for _, message in self.bound.messages(recursive=True, bound=self.bound)
+        ]
+        type_ids = [message.type_id() for message in messages]
+        return [
+            BlockMessageRegistryItem(
+                message, type_ids.count(message.type_id()) > 1, indent=4
+            )
+            for message in messages
         ]
-        b.append(BlockMessageMethodGetByteItemDefault(indent=self.indent))
-        return b
 
     @override(BlockComposition)
     def separator(self) -> str:
         return "\n"
 
 
-class BlockMessageMethodGetByte(BlockMessageBase, BlockWrapper[F]):
+class BlockMessageRegistry(BlockWrapper[F]):
     @override(BlockWrapper)
     def wraps(self) -> Block[F]:
-        return BlockMessageMethodGetByteItemList(self.d, indent=self.indent + 4)
+        return BlockMessageRegistryItemList()
 
     @override(BlockWrapper)
     def before(self) -> None:
-        self.push(f"def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:")
+        self.push_comment(
+            "Message classes of this proto keyed by type id, for framing."
+        )
+        self.push("BP_MESSAGES: Dict[int, Type[bp.MessageBase]] = {")
 
+    @override(BlockWrapper)
+    def after(self) -> None:
+        self.push("}")
 
-class BlockMessageMethodGetAccessorItem(BlockBindMessageField[F]):
-    def __init__(
-        self,
-        *args: Any,
-        **kwds: Any,
-    ) -> None:
-        super().__init__(*args, **kwds)
-        self.array_depth: int = 0
 
-    def format_data_ref(self) -> str:
-        array_indexing = "".join(f"[di.i({i})]" for i in range(self.array_depth))
-        return f"self.{self.message_field_name}" + array_indexing
+class BlockList(BlockComposition[F]):
+    @override(BlockComposition)
+    def blocks(self) -> List[Block[F]]:
+        return [
+            BlockAheadNotice(),
+            BlockProtoDocstring(self.bound),
+            BlockImportList(),
+            BlockBoundDefinitionList(),
+            BlockMessageRegistry(),
+        ]
 
-    def render_case(self) -> None:
-        field_number = self.formatter.format_int_value(self.d.number)
-        self.push(f"if di.field_number == {field_number}:")
-
-    def render_array(self, array: Array) -> None:
-        try:
-            self.array_depth += 1
-            if isinstance(array.element_type, Message):
-                return self.render_message(array.element_type)
-            if isinstance(array.element_type, Alias):
-                return self.render_alias(array.element_type)
-        finally:
-            self.array_depth -= 1
-
-    def render_alias(self, alias: Alias) -> None:
-        if isinstance(alias.type, Array):
-            return self.render_array(alias.type)
-
-    def render_message(self, message: Message) -> None:
-        self.render_case()
-        data = self.format_data_ref()
-        self.push(f"return {data}", indent=self.indent + 4)
+    @override(BlockComposition)
+    def separator(self) -> str:
+        return "\n\n\n"
 
+
+class BlockGeneralImportsOpMode(Block[F]):
     @override(Block)
     def render(self) -> None:
-        if isinstance(self.d.type, Message):
-            return self.render_message(self.d.type)
-        if isinstance(self.d.type, Array):
-            return self.render_array(self.d.type)
-        if isinstance(self.d.type, Alias):
-            return self.render_alias(self.d.type)
+        self.push("import json")
+        self.push("import struct")
+        self.push("from dataclasses import dataclass, field, fields")
+        self.push("from typing import Any, ClassVar, Dict, List, Optional, Tuple")
 
 
-class BlockMessageMethodGetAccessorItemDefault(Block[F]):
-    @override(Block)
-    def render(self) -> None:
-        self.push(f"return bp.NilAccessor() # Won't reached")
+class BlockImportListOpMode(BlockComposition[F]):
+    @override(BlockComposition)
+    def blocks(self) -> List[Block]:
+        return [
+            BlockGeneralImportsOpMode(),
+            BlockImportChildProtoList(),
+        ]
+
+    @override(BlockComposition)
+    def separator(self) -> str:
+        return "\n\n"
 
 
-class BlockMessageMethodGetAccessorList(BlockBindMessage[F], BlockComposition[F]):
+class BlockAliasOpMode(BlockBindAlias[F], BlockComposition):
     @override(BlockComposition)
-    def blocks(self) -> List[Block[F]]:
-        b: List[Block[F]] = [
-            BlockMessageMethodGetAccessorItem(field, indent=self.indent)
-            for field in self.d.sorted_fields()
+    def blocks(self) -> List[Block]:
+        return [
+            BlockAliasDef(self.d),
+            BlockAliasMethodDefaultFactory(self.d),
         ]
-        b.append(BlockMessageMethodGetAccessorItemDefault(indent=self.indent))
-        return b
 
     @override(BlockComposition)
     def separator(self) -> str:
-        return "\n"
+        return "\n\n"
 
 
-class BlockMessageMethodGetAccessor(BlockMessageBase, BlockWrapper[F]):
+class BlockEnumOpMode(BlockBindEnum[F], BlockComposition[F]):
+    @override(BlockComposition[F])
+    def blocks(self) -> List[Block]:
+        return [
+            BlockEnumFieldListWrapper(self.d),
+            BlockEnumValueToNameMap(self.d),
+            BlockEnumNameToValueMap(self.d),
+        ]
+
+
+class BlockMessageClassOpMode(BlockMessageBase, BlockWrapper[F]):
     @override(BlockWrapper)
     def wraps(self) -> Block[F]:
-        return BlockMessageMethodGetAccessorList(self.d, indent=self.indent + 4)
+        return BlockMessageClassDefs(self.d, indent=4)
 
     @override(BlockWrapper)
     def before(self) -> None:
-        self.push(f"def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:")
+        if self.d.bound.get_option_as_bool_or_raise("py.slots"):
+            self.push("@bp_add_slots")
+        self.push("@dataclass")
+        self.push(f"class {self.message_name}:")
+        self.push_definition_docstring(indent=4)
 
 
-class BlockMessageMethodEncode(BlockMessageBase):
+class BlockMessageMethodToJsonOpMode(BlockMessageBase):
     @override(Block)
     def render(self) -> None:
-        self.push(f"def encode(self) -> bytearray:")
-        self.push_docstring("Encode this object to bytearray.", indent=self.indent + 4)
-        self.push(f"s = bytearray(self.BYTES_LENGTH)", indent=self.indent + 4)
-        self.push(f"ctx = bp.ProcessContext(True, s)", indent=self.indent + 4)
+        self.push("def to_json(")
+        self.push("self,", indent=self.indent + 4)
+        self.push("indent: Optional[int] = None,", indent=self.indent + 4)
         self.push(
-            f"self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)",
+            "separators: Optional[Tuple[str, str]] = None,", indent=self.indent + 4
+        )
+        self.push("enum_names: bool = False,", indent=self.indent + 4)
+        self.push(") -> str:")
+        self.push_docstring(
+            "Dumps this message to a json string.",
+            ":param enum_names: Whether to convert enum values to their names.",
+            indent=self.indent + 4,
+        )
+        self.push(
+            "return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)",
             indent=self.indent + 4,
         )
-        self.push(f"return ctx.s", indent=self.indent + 4)
 
 
-class BlockMessageMethodDecode(BlockMessageBase):
+class BlockMessageMethodFromDictOpMode(BlockMessageMethodFromDict):
+    @override(BlockMessageMethodFromDict)
+    def checker(self, function: str) -> str:
+        return f"bp_{function}"
+
+
+class BlockMessageMethodFromJsonOpMode(BlockMessageBase):
     @override(Block)
     def render(self) -> None:
-        self.push(f"def decode(self, s: bytearray) -> None:")
+        self.push("@classmethod")
+        self.push(
+            f'def from_json(cls, s: str, validate: bool = False) -> "{self.message_name}":'
+        )
         self.push_docstring(
-            "Decode given bytearray s to this object.",
-            ":param s: A bytearray with length at least `BYTES_LENGTH`.",
+            "Loads a message from given json string, see from_dict.",
             indent=self.indent + 4,
         )
         self.push(
-            f"assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()",
+            "return cls.from_dict(json.loads(s), validate)", indent=self.indent + 4
+        )
+
+
+class BlockMessageMethodEncodeOpMode(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        self.push(f"def encode(self) -> bytearray:")
+        self.push_docstring("Encode this object to bytearray.", indent=self.indent + 4)
+        self.push(f"s = bytearray(self.BYTES_LENGTH)", indent=self.indent + 4)
+        # Messages without fields have nothing to encode or decode.
+        if self.formatter.format_struct_layout(self.d, "self"):
+            for line in self.formatter.format_struct_encoder(self.d, "self", "0"):
+                self.push(line, indent=self.indent + 4)
+        self.push(f"return s", indent=self.indent + 4)
+
+
+class BlockMessageMethodDecodeOpMode(BlockMessageBase):
+    @override(Block)
+    def render(self) -> None:
+        self.push(f"def decode(self, s: bytearray) -> None:")
+        self.push_docstring(
+            "Decode given bytearray s to this object.",
+            ":param s: A bytearray with length at least `BYTES_LENGTH`.",
             indent=self.indent + 4,
         )
-        self.push(f"ctx = bp.ProcessContext(False, s)", indent=self.indent + 4)
         self.push(
-            f"self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)",
+            f'assert len(s) >= self.BYTES_LENGTH, ValueError("not enough bytes")',
             indent=self.indent + 4,
         )
+        if self.formatter.format_struct_layout(self.d, "self"):
+            for line in self.formatter.format_struct_decoder(self.d, "self", "0"):
+                self.push(line, indent=self.indent + 4)
 
 
-class BlockMessage(BlockMessageBase, BlockComposition[F]):
+class BlockMessageOpMode(BlockMessageBase, BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block[F]]:
-        return [
-            BlockMessageClass(self.d),
-            BlockMessageMethodProcessor(self.d, indent=4),
-            BlockMessageMethodSetByte(self.d, indent=4),
-            BlockMessageMethodGetByte(self.d, indent=4),
-            BlockMessageMethodGetAccessor(self.d, indent=4),
-            BlockMessageMethodEncode(self.d, indent=4),
-            BlockMessageMethodDecode(self.d, indent=4),
+        bs: List[Block[F]] = [
+            BlockMessageClassOpMode(self.d),
+            BlockMessageMethodToDict(self.d, indent=4),
+            BlockMessageMethodToJsonOpMode(self.d, indent=4),
+            BlockMessageMethodFromDictOpMode(self.d, indent=4),
+            BlockMessageMethodFromJsonOpMode(self.d, indent=4),
         ]
 
+        # Won't render encoder and decoder if not filtered
+        render_ctx = self._get_ctx_or_raise()
+        filter_messages = render_ctx.optimization_mode_filter_messages
+        if filter_messages:
+            if self.d.name not in filter_messages:
+                return bs
+
+        bs.extend(
+            [
+                BlockMessageMethodEncodeOpMode(self.d, indent=4),
+                BlockMessageMethodDecodeOpMode(self.d, indent=4),
+                BlockMessageStructs(self.d),
+            ]
+        )
+        return bs
+
     @override(BlockComposition)
     def separator(self) -> str:
         return "\n\n"
 
 
-class BlockBoundDefinitionList(BlockBoundDefinitionDispatcher):
+class BlockBoundDefinitionListOpMode(BlockBoundDefinitionDispatcher):
     @override(BlockBoundDefinitionDispatcher)
     def dispatch(self, d: BoundDefinition) -> Optional[Block[F]]:
         if isinstance(d, Alias):
-            return BlockAlias(d)
+            return BlockAliasOpMode(d)
         if isinstance(d, Constant):
             return BlockConstant(d)
         if isinstance(d, Enum):
-            return BlockEnum(d)
+            return BlockEnumOpMode(d)
         if isinstance(d, Message):
-            return BlockMessage(d)
+            return BlockMessageOpMode(d)
         return None
 
     @override(BlockComposition)
@@ -637,14 +1214,89 @@ class BlockBoundDefinitionList(BlockBoundDefinitionDispatcher):
         return "\n\n\n"
 
 
-class BlockList(BlockComposition[F]):
+class BlockGeneralFunctionIntOpMode(Block[F]):
+    def __init__(self, nbits: int, indent: int = 0) -> None:
+        super().__init__(indent=indent)
+        self.nbits = nbits
+
+    @override(Block)
+    def render(self) -> None:
+        upper = self.formatter.format_int_value(1 << (self.nbits - 1))
+        delta = self.formatter.format_int_value(1 << self.nbits)
+        self.push(f"def bp_int{self.nbits}(i: int) -> int:")
+        self.push(f"return i if i < {upper} else i - {delta}", indent=4)
+
+
+class BlockGeneralFunctionIntListOpMode(BlockComposition[F]):
+    @override(BlockComposition)
+    def blocks(self) -> List[Block[F]]:
+        return [BlockGeneralFunctionIntOpMode(nbits) for nbits in (8, 16, 32, 64)]
+
+    @override(BlockComposition)
+    def separator(self) -> str:
+        return "\n\n"
+
+
+class BlockGeneralFunctionCheckOpMode(Block[F]):
+    @override(Block)
+    def render(self) -> None:
+        self.push("def bp_check_range(name: str, v: Any, lo: int, hi: int) -> None:")
+        self.push("if not (isinstance(v, int) and lo <= v <= hi):", indent=4)
+        self.push(
+            'raise ValueError(f"{name} {v!r} out of range [{lo}, {hi}]")', indent=8
+        )
+        self.push_empty_line()
+        self.push_empty_line()
+        self.push(
+            "def bp_check_array(name: str, v: Any, shape: Tuple[int, ...], "
+            "lo: Optional[int] = None, hi: Optional[int] = None) -> None:"
+        )
+        self.push("if len(v) != shape[0]:", indent=4)
+        self.push(
+            'raise ValueError(f"{name} requires {shape[0]} elements, got {len(v)}")',
+            indent=8,
+        )
+        self.push("for x in v:", indent=4)
+        self.push("if len(shape) > 1:", indent=8)
+        self.push("bp_check_array(name, x, shape[1:], lo, hi)", indent=12)
+        self.push("elif lo is not None and hi is not None:", indent=8)
+        self.push("bp_check_range(name, x, lo, hi)", indent=12)
+
+
+class BlockGeneralFunctionAddSlotsOpMode(Block[F]):
+    @override(Block)
+    def render(self) -> None:
+        if not self.bound.get_option_as_bool_or_raise("py.slots"):
+            return
+        self.push("def bp_add_slots(cls: Any) -> Any:")
+        self.push_docstring(
+            "Returns a copy of given dataclass with __slots__.", indent=4
+        )
+        self.push("cls_dict = dict(cls.__dict__)", indent=4)
+        self.push("field_names = tuple(f.name for f in fields(cls))", indent=4)
+        self.push('cls_dict["__slots__"] = field_names', indent=4)
+        self.push("for name in field_names:", indent=4)
+        self.push("cls_dict.pop(name, None)", indent=8)
+        self.push('cls_dict.pop("__dict__", None)', indent=4)
+        self.push('cls_dict.pop("__weakref__", None)', indent=4)
+        self.push(
+            "slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)", indent=4
+        )
+        self.push("slotted_cls.__qualname__ = cls.__qualname__", indent=4)
+        self.push("return slotted_cls", indent=4)
+
+
+class BlockListOpMode(BlockComposition[F]):
     @override(BlockComposition)
     def blocks(self) -> List[Block[F]]:
         return [
             BlockAheadNotice(),
             BlockProtoDocstring(self.bound),
-            BlockImportList(),
-            BlockBoundDefinitionList(),
+            BlockImportListOpMode(),
+            BlockGeneralFunctionIntListOpMode(),
+            BlockGeneralFunctionCheckOpMode(),
+            BlockGeneralFunctionAddSlotsOpMode(),
+            BlockBoundDefinitionListOpMode(),
         ]
 
     @override(BlockComposition)
@@ -663,10 +1315,18 @@ class RendererPy(Renderer[F]):
     def file_extension(self) -> str:
         return ".py"
 
+    @override(Renderer)
+    def support_optimization(self) -> bool:
+        return True
+
     @override(Renderer)
     def formatter(self) -> F:
+        if self.optimization_mode:
+            return PyFormatterOpMode()
         return F()
 
     @override(Renderer)
     def block(self) -> Block[F]:
+        if self.optimization_mode:
+            return BlockListOpMode()
         return BlockList()
@@ -73,6 +73,21 @@ int JsonPropeller(struct Propeller *m, char *s) {
     return ctx.n;
 }
 
+void PatchPropeller_Id(unsigned char *s, uint8_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = x;
+}
+
+void PatchPropeller_Status(unsigned char *s, PropellerStatus v) {
+    uint64_t x = (uint64_t)v;
+    s[1] = (s[1] & 252) | (x & 3);
+}
+
+void PatchPropeller_Direction(unsigned char *s, RotatingDirection v) {
+    uint64_t x = (uint64_t)v;
+    s[1] = (s[1] & 243) | ((x << 2) & 12);
+}
+
 void BpFieldDescriptorsInitPower(struct Power *m, struct BpMessageFieldDescriptor *fds) {
     fds[0] = BpMessageFieldDescriptor((void *)&(m->battery), BpUint(8, sizeof(uint8_t)), "battery");
     fds[1] = BpMessageFieldDescriptor((void *)&(m->status), BpEnum(2, sizeof(PowerStatus)), "status");
@@ -113,6 +128,21 @@ int JsonPower(struct Power *m, char *s) {
     return ctx.n;
 }
 
+void PatchPower_Battery(unsigned char *s, uint8_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = x;
+}
+
+void PatchPower_Status(unsigned char *s, PowerStatus v) {
+    uint64_t x = (uint64_t)v;
+    s[1] = (s[1] & 252) | (x & 3);
+}
+
+void PatchPower_IsCharging(unsigned char *s, bool v) {
+    uint64_t x = (uint64_t)v;
+    s[1] = (s[1] & 251) | ((x << 2) & 4);
+}
+
 void BpFieldDescriptorsInitNetwork(struct Network *m, struct BpMessageFieldDescriptor *fds) {
     fds[0] = BpMessageFieldDescriptor((void *)&(m->signal), BpUint(4, sizeof(uint8_t)), "signal");
     fds[1] = BpMessageFieldDescriptor((void *)&(m->heartbeat_at), BpAlias(64, sizeof(Timestamp), BpXXXProcessTimestamp, BpXXXJsonFormatTimestamp), "heartbeat_at");
@@ -152,6 +182,24 @@ int JsonNetwork(struct Network *m, char *s) {
     return ctx.n;
 }
 
+void PatchNetwork_Signal(unsigned char *s, uint8_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = (s[0] & 240) | (x & 15);
+}
+
+void PatchNetwork_HeartbeatAt(unsigned char *s, Timestamp v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = (s[0] & 15) | ((x << 4) & 240);
+    s[1] = (x >> 4);
+    s[2] = (x >> 12);
+    s[3] = (x >> 20);
+    s[4] = (x >> 28);
+    s[5] = (x >> 36);
+    s[6] = (x >> 44);
+    s[7] = (x >> 52);
+    s[8] = (s[8] & 240) | ((x >> 60) & 15);
+}
+
 void BpFieldDescriptorsInitLandingGear(struct LandingGear *m, struct BpMessageFieldDescriptor *fds) {
     fds[0] = BpMessageFieldDescriptor((void *)&(m->status), BpEnum(2, sizeof(LandingGearStatus)), "status");
 }
@@ -190,6 +238,11 @@ int JsonLandingGear(struct LandingGear *m, char *s) {
     return ctx.n;
 }
 
+void PatchLandingGear_Status(unsigned char *s, LandingGearStatus v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = (s[0] & 252) | (x & 3);
+}
+
 void BpFieldDescriptorsInitPosition(struct Position *m, struct BpMessageFieldDescriptor *fds) {
     fds[0] = BpMessageFieldDescriptor((void *)&(m->latitude), BpUint(32, sizeof(uint32_t)), "latitude");
     fds[1] = BpMessageFieldDescriptor((void *)&(m->longitude), BpUint(32, sizeof(uint32_t)), "longitude");
@@ -230,6 +283,30 @@ int JsonPosition(struct Position *m, char *s) {
     return ctx.n;
 }
 
+void PatchPosition_Latitude(unsigned char *s, uint32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = x;
+    s[1] = (x >> 8);
+    s[2] = (x >> 16);
+    s[3] = (x >> 24);
+}
+
+void PatchPosition_Longitude(unsigned char *s, uint32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[4] = x;
+    s[5] = (x >> 8);
+    s[6] = (x >> 16);
+    s[7] = (x >> 24);
+}
+
+void PatchPosition_Altitude(unsigned char *s, uint32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[8] = x;
+    s[9] = (x >> 8);
+    s[10] = (x >> 16);
+    s[11] = (x >> 24);
+}
+
 void BpFieldDescriptorsInitPose(struct Pose *m, struct BpMessageFieldDescriptor *fds) {
     fds[0] = BpMessageFieldDescriptor((void *)&(m->yaw), BpInt(32, sizeof(int32_t)), "yaw");
     fds[1] = BpMessageFieldDescriptor((void *)&(m->pitch), BpInt(32, sizeof(int32_t)), "pitch");
@@ -270,6 +347,30 @@ int JsonPose(struct Pose *m, char *s) {
     return ctx.n;
 }
 
+void PatchPose_Yaw(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = x;
+    s[1] = (x >> 8);
+    s[2] = (x >> 16);
+    s[3] = (x >> 24);
+}
+
+void PatchPose_Pitch(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[4] = x;
+    s[5] = (x >> 8);
+    s[6] = (x >> 16);
+    s[7] = (x >> 24);
+}
+
+void PatchPose_Roll(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[8] = x;
+    s[9] = (x >> 8);
+    s[10] = (x >> 16);
+    s[11] = (x >> 24);
+}
+
 void BpFieldDescriptorsInitFlight(struct Flight *m, struct BpMessageFieldDescriptor *fds) {
     fds[0] = BpMessageFieldDescriptor((void *)&(m->pose), BpMessage(96, sizeof(struct Pose), BpXXXProcessPose, BpXXXJsonFormatPose), "pose");
     fds[1] = BpMessageFieldDescriptor((void *)&(m->velocity), BpAlias(96, sizeof(TernaryInt32), BpXXXProcessTernaryInt32, BpXXXJsonFormatTernaryInt32), "velocity");
@@ -310,6 +411,38 @@ int JsonFlight(struct Flight *m, char *s) {
     return ctx.n;
 }
 
+void PatchFlight_Pose_Yaw(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = x;
+    s[1] = (x >> 8);
+    s[2] = (x >> 16);
+    s[3] = (x >> 24);
+}
+
+void PatchFlight_Pose_Pitch(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[4] = x;
+    s[5] = (x >> 8);
+    s[6] = (x >> 16);
+    s[7] = (x >> 24);
+}
+
+void PatchFlight_Pose_Roll(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[8] = x;
+    s[9] = (x >> 8);
+    s[10] = (x >> 16);
+    s[11] = (x >> 24);
+}
+
+void PatchFlight_Velocity(unsigned char *s, int k0, int32_t v) {
+    BpPatchBits(s, 96 + k0 * 32, 32, (uint64_t)v);
+}
+
+void PatchFlight_Acceleration(unsigned char *s, int k0, int32_t v) {
+    BpPatchBits(s, 192 + k0 * 32, 32, (uint64_t)v);
+}
+
 void BpXXXProcessArrayDrone4(void *data, struct BpProcessorContext *ctx) {
     struct BpArrayDescriptor descriptor = BpArrayDescriptor(false, 4, BpMessage(12, sizeof(struct Propeller), BpXXXProcessPropeller, BpXXXJsonFormatPropeller));
     BpEndecodeArray(&descriptor, ctx, data);
@@ -362,4 +495,123 @@ int JsonDrone(struct Drone *m, char *s) {
     struct BpJsonFormatContext ctx = BpJsonFormatContext(s);
     BpXXXJsonFormatDrone((void *)m, &ctx);
     return ctx.n;
+}
+
+void PatchDrone_Status(unsigned char *s, DroneStatus v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = (s[0] & 248) | (x & 7);
+}
+
+void PatchDrone_Position_Latitude(unsigned char *s, uint32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[0] = (s[0] & 7) | ((x << 3) & 248);
+    s[1] = (x >> 5);
+    s[2] = (x >> 13);
+    s[3] = (x >> 21);
+    s[4] = (s[4] & 248) | ((x >> 29) & 7);
+}
+
+void PatchDrone_Position_Longitude(unsigned char *s, uint32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[4] = (s[4] & 7) | ((x << 3) & 248);
+    s[5] = (x >> 5);
+    s[6] = (x >> 13);
+    s[7] = (x >> 21);
+    s[8] = (s[8] & 248) | ((x >> 29) & 7);
+}
+
+void PatchDrone_Position_Altitude(unsigned char *s, uint32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[8] = (s[8] & 7) | ((x << 3) & 248);
+    s[9] = (x >> 5);
+    s[10] = (x >> 13);
+    s[11] = (x >> 21);
+    s[12] = (s[12] & 248) | ((x >> 29) & 7);
+}
+
+void PatchDrone_Flight_Pose_Yaw(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[12] = (s[12] & 7) | ((x << 3) & 248);
+    s[13] = (x >> 5);
+    s[14] = (x >> 13);
+    s[15] = (x >> 21);
+    s[16] = (s[16] & 248) | ((x >> 29) & 7);
+}
+
+void PatchDrone_Flight_Pose_Pitch(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[16] = (s[16] & 7) | ((x << 3) & 248);
+    s[17] = (x >> 5);
+    s[18] = (x >> 13);
+    s[19] = (x >> 21);
+    s[20] = (s[20] & 248) | ((x >> 29) & 7);
+}
+
+void PatchDrone_Flight_Pose_Roll(unsigned char *s, int32_t v) {
+    uint64_t x = (uint64_t)v;
+    s[20] = (s[20] & 7) | ((x << 3) & 248);
+    s[21] = (x >> 5);
+    s[22] = (x >> 13);
+    s[23] = (x >> 21);
+    s[24] = (s[24] & 248) | ((x >> 29) & 7);
+}
+
+void PatchDrone_Flight_Velocity(unsigned char *s, int k0, int32_t v) {
+    BpPatchBits(s, 195 + k0 * 32, 32, (uint64_t)v);
+}
+
+void PatchDrone_Flight_Acceleration(unsigned char *s, int k0, int32_t v) {
+    BpPatchBits(s, 291 + k0 * 32, 32, (uint64_t)v);
+}
+
+void PatchDrone_Propellers_Id(unsigned char *s, int k0, uint8_t v) {
+    BpPatchBits(s, 387 + k0 * 12, 8, (uint64_t)v);
+}
+
+void PatchDrone_Propellers_Status(unsigned char *s, int k0, PropellerStatus v) {
+    BpPatchBits(s, 395 + k0 * 12, 2, (uint64_t)v);
+}
+
+void PatchDrone_Propellers_Direction(unsigned char *s, int k0, RotatingDirection v) {
+    BpPatchBits(s, 397 + k0 * 12, 2, (uint64_t)v);
+}
+
+void PatchDrone_Power_Battery(unsigned char *s, uint8_t v) {
+    uint64_t x = (uint64_t)v;
+    s[54] = (s[54] & 7) | ((x << 3) & 248);
+    s[55] = (s[55] & 248) | ((x >> 5) & 7);
+}
+
+void PatchDrone_Power_Status(unsigned char *s, PowerStatus v) {
+    uint64_t x = (uint64_t)v;
+    s[55] = (s[55] & 231) | ((x << 3) & 24);
+}
+
+void PatchDrone_Power_IsCharging(unsigned char *s, bool v) {
+    uint64_t x = (uint64_t)v;
+    s[55] = (s[55] & 223) | ((x << 5) & 32);
+}
+
+void PatchDrone_Network_Signal(unsigned char *s, uint8_t v) {
+    uint64_t x = (uint64_t)v;
+    s[55] = (s[55] & 63) | ((x << 6) & 192);
+    s[56] = (s[56] & 252) | ((x >> 2) & 3);
+}
+
+void PatchDrone_Network_HeartbeatAt(unsigned char *s, Timestamp v) {
+    uint64_t x = (uint64_t)v;
+    s[56] = (s[56] & 3) | ((x << 2) & 252);
+    s[57] = (x >> 6);
+    s[58] = (x >> 14);
+    s[59] = (x >> 22);
+    s[60] = (x >> 30);
+    s[61] = (x >> 38);
+    s[62] = (x >> 46);
+    s[63] = (x >> 54);
+    s[64] = (s[64] & 252) | ((x >> 62) & 3);
+}
+
+void PatchDrone_LandingGear_Status(unsigned char *s, LandingGearStatus v) {
+    uint64_t x = (uint64_t)v;
+    s[64] = (s[64] & 243) | ((x << 2) & 12);
 }
\ No newline at end of file
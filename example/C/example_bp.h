@@ -138,6 +138,12 @@ int EncodePropeller(struct Propeller *m, unsigned char *s);
 int DecodePropeller(struct Propeller *m, unsigned char *s);
 // Format struct Propeller to a json format string.
 int JsonPropeller(struct Propeller *m, char *s);
+// Patch field id of encoded struct Propeller in given buffer s.
+void PatchPropeller_Id(unsigned char *s, uint8_t v);
+// Patch field status of encoded struct Propeller in given buffer s.
+void PatchPropeller_Status(unsigned char *s, PropellerStatus v);
+// Patch field direction of encoded struct Propeller in given buffer s.
+void PatchPropeller_Direction(unsigned char *s, RotatingDirection v);
 
 // Encode struct Power to given buffer s.
 int EncodePower(struct Power *m, unsigned char *s);
@@ -145,6 +151,12 @@ int EncodePower(struct Power *m, unsigned char *s);
 int DecodePower(struct Power *m, unsigned char *s);
 // Format struct Power to a json format string.
 int JsonPower(struct Power *m, char *s);
+// Patch field battery of encoded struct Power in given buffer s.
+void PatchPower_Battery(unsigned char *s, uint8_t v);
+// Patch field status of encoded struct Power in given buffer s.
+void PatchPower_Status(unsigned char *s, PowerStatus v);
+// Patch field is_charging of encoded struct Power in given buffer s.
+void PatchPower_IsCharging(unsigned char *s, bool v);
 
 // Encode struct Network to given buffer s.
 int EncodeNetwork(struct Network *m, unsigned char *s);
@@ -152,6 +164,10 @@ int EncodeNetwork(struct Network *m, unsigned char *s);
 int DecodeNetwork(struct Network *m, unsigned char *s);
 // Format struct Network to a json format string.
 int JsonNetwork(struct Network *m, char *s);
+// Patch field signal of encoded struct Network in given buffer s.
+void PatchNetwork_Signal(unsigned char *s, uint8_t v);
+// Patch field heartbeat_at of encoded struct Network in given buffer s.
+void PatchNetwork_HeartbeatAt(unsigned char *s, Timestamp v);
 
 // Encode struct LandingGear to given buffer s.
 int EncodeLandingGear(struct LandingGear *m, unsigned char *s);
@@ -159,6 +175,8 @@ int EncodeLandingGear(struct LandingGear *m, unsigned char *s);
 int DecodeLandingGear(struct LandingGear *m, unsigned char *s);
 // Format struct LandingGear to a json format string.
 int JsonLandingGear(struct LandingGear *m, char *s);
+// Patch field status of encoded struct LandingGear in given buffer s.
+void PatchLandingGear_Status(unsigned char *s, LandingGearStatus v);
 
 // Encode struct Position to given buffer s.
 int EncodePosition(struct Position *m, unsigned char *s);
@@ -166,6 +184,12 @@ int EncodePosition(struct Position *m, unsigned char *s);
 int DecodePosition(struct Position *m, unsigned char *s);
 // Format struct Position to a json format string.
 int JsonPosition(struct Position *m, char *s);
+// Patch field latitude of encoded struct Position in given buffer s.
+void PatchPosition_Latitude(unsigned char *s, uint32_t v);
+// Patch field longitude of encoded struct Position in given buffer s.
+void PatchPosition_Longitude(unsigned char *s, uint32_t v);
+// Patch field altitude of encoded struct Position in given buffer s.
+void PatchPosition_Altitude(unsigned char *s, uint32_t v);
 
 // Encode struct Pose to given buffer s.
 int EncodePose(struct Pose *m, unsigned char *s);
@@ -173,6 +197,12 @@ int EncodePose(struct Pose *m, unsigned char *s);
 int DecodePose(struct Pose *m, unsigned char *s);
 // Format struct Pose to a json format string.
 int JsonPose(struct Pose *m, char *s);
+// Patch field yaw of encoded struct Pose in given buffer s.
+void PatchPose_Yaw(unsigned char *s, int32_t v);
+// Patch field pitch of encoded struct Pose in given buffer s.
+void PatchPose_Pitch(unsigned char *s, int32_t v);
+// Patch field roll of encoded struct Pose in given buffer s.
+void PatchPose_Roll(unsigned char *s, int32_t v);
 
 // Encode struct Flight to given buffer s.
 int EncodeFlight(struct Flight *m, unsigned char *s);
@@ -180,6 +210,16 @@ int EncodeFlight(struct Flight *m, unsigned char *s);
 int DecodeFlight(struct Flight *m, unsigned char *s);
 // Format struct Flight to a json format string.
 int JsonFlight(struct Flight *m, char *s);
+// Patch field pose.yaw of encoded struct Flight in given buffer s.
+void PatchFlight_Pose_Yaw(unsigned char *s, int32_t v);
+// Patch field pose.pitch of encoded struct Flight in given buffer s.
+void PatchFlight_Pose_Pitch(unsigned char *s, int32_t v);
+// Patch field pose.roll of encoded struct Flight in given buffer s.
+void PatchFlight_Pose_Roll(unsigned char *s, int32_t v);
+// Patch field velocity[k0] of encoded struct Flight in given buffer s.
+void PatchFlight_Velocity(unsigned char *s, int k0, int32_t v);
+// Patch field acceleration[k0] of encoded struct Flight in given buffer s.
+void PatchFlight_Acceleration(unsigned char *s, int k0, int32_t v);
 
 // Encode struct Drone to given buffer s.
 int EncodeDrone(struct Drone *m, unsigned char *s);
@@ -187,6 +227,42 @@ int EncodeDrone(struct Drone *m, unsigned char *s);
 int DecodeDrone(struct Drone *m, unsigned char *s);
 // Format struct Drone to a json format string.
 int JsonDrone(struct Drone *m, char *s);
+// Patch field status of encoded struct Drone in given buffer s.
+void PatchDrone_Status(unsigned char *s, DroneStatus v);
+// Patch field position.latitude of encoded struct Drone in given buffer s.
+void PatchDrone_Position_Latitude(unsigned char *s, uint32_t v);
+// Patch field position.longitude of encoded struct Drone in given buffer s.
+void PatchDrone_Position_Longitude(unsigned char *s, uint32_t v);
+// Patch field position.altitude of encoded struct Drone in given buffer s.
+void PatchDrone_Position_Altitude(unsigned char *s, uint32_t v);
+// Patch field flight.pose.yaw of encoded struct Drone in given buffer s.
+void PatchDrone_Flight_Pose_Yaw(unsigned char *s, int32_t v);
+// Patch field flight.pose.pitch of encoded struct Drone in given buffer s.
+void PatchDrone_Flight_Pose_Pitch(unsigned char *s, int32_t v);
+// Patch field flight.pose.roll of encoded struct Drone in given buffer s.
+void PatchDrone_Flight_Pose_Roll(unsigned char *s, int32_t v);
+// Patch field flight.velocity[k0] of encoded struct Drone in given buffer s.
+void PatchDrone_Flight_Velocity(unsigned char *s, int k0, int32_t v);
+// Patch field flight.acceleration[k0] of encoded struct Drone in given buffer s.
+void PatchDrone_Flight_Acceleration(unsigned char *s, int k0, int32_t v);
+// Patch field propellers[k0].id of encoded struct Drone in given buffer s.
+void PatchDrone_Propellers_Id(unsigned char *s, int k0, uint8_t v);
+// Patch field propellers[k0].status of encoded struct Drone in given buffer s.
+void PatchDrone_Propellers_Status(unsigned char *s, int k0, PropellerStatus v);
+// Patch field propellers[k0].direction of encoded struct Drone in given buffer s.
+void PatchDrone_Propellers_Direction(unsigned char *s, int k0, RotatingDirection v);
+// Patch field power.battery of encoded struct Drone in given buffer s.
+void PatchDrone_Power_Battery(unsigned char *s, uint8_t v);
+// Patch field power.status of encoded struct Drone in given buffer s.
+void PatchDrone_Power_Status(unsigned char *s, PowerStatus v);
+// Patch field power.is_charging of encoded struct Drone in given buffer s.
+void PatchDrone_Power_IsCharging(unsigned char *s, bool v);
+// Patch field network.signal of encoded struct Drone in given buffer s.
+void PatchDrone_Network_Signal(unsigned char *s, uint8_t v);
+// Patch field network.heartbeat_at of encoded struct Drone in given buffer s.
+void PatchDrone_Network_HeartbeatAt(unsigned char *s, Timestamp v);
+// Patch field landing_gear.status of encoded struct Drone in given buffer s.
+void PatchDrone_LandingGear_Status(unsigned char *s, LandingGearStatus v);
 
 void BpXXXProcessTimestamp(void *data, struct BpProcessorContext *ctx);
 void BpXXXJsonFormatTimestamp(void *data, struct BpJsonFormatContext *ctx);
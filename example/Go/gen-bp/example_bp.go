@@ -234,6 +234,24 @@ func (m *Propeller) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field id of encoded struct Propeller in given buffer s.
+func PatchPropeller_Id(s []byte, v uint8) {
+	x := uint64(v)
+	s[0] = byte(x)
+}
+
+// Patch field status of encoded struct Propeller in given buffer s.
+func PatchPropeller_Status(s []byte, v PropellerStatus) {
+	x := uint64(v)
+	s[1] = (s[1] & 252) | (byte(x) & 3)
+}
+
+// Patch field direction of encoded struct Propeller in given buffer s.
+func PatchPropeller_Direction(s []byte, v RotatingDirection) {
+	x := uint64(v)
+	s[1] = (s[1] & 243) | (byte(x << 2) & 12)
+}
+
 type Power struct {
 	Battery uint8 `json:"battery"` // 8bit
 	Status PowerStatus `json:"status"` // 2bit
@@ -305,6 +323,24 @@ func (m *Power) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field battery of encoded struct Power in given buffer s.
+func PatchPower_Battery(s []byte, v uint8) {
+	x := uint64(v)
+	s[0] = byte(x)
+}
+
+// Patch field status of encoded struct Power in given buffer s.
+func PatchPower_Status(s []byte, v PowerStatus) {
+	x := uint64(v)
+	s[1] = (s[1] & 252) | (byte(x) & 3)
+}
+
+// Patch field is_charging of encoded struct Power in given buffer s.
+func PatchPower_IsCharging(s []byte, v bool) {
+	x := uint64(bp.Bool2byte(v))
+	s[1] = (s[1] & 251) | (byte(x << 2) & 4)
+}
+
 type Network struct {
 	// Degree of signal, between 1~10.
 	Signal uint8 `json:"signal"` // 4bit
@@ -372,6 +408,26 @@ func (m *Network) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field signal of encoded struct Network in given buffer s.
+func PatchNetwork_Signal(s []byte, v uint8) {
+	x := uint64(v)
+	s[0] = (s[0] & 240) | (byte(x) & 15)
+}
+
+// Patch field heartbeat_at of encoded struct Network in given buffer s.
+func PatchNetwork_HeartbeatAt(s []byte, v Timestamp) {
+	x := uint64(v)
+	s[0] = (s[0] & 15) | (byte(x << 4) & 240)
+	s[1] = byte(x >> 4)
+	s[2] = byte(x >> 12)
+	s[3] = byte(x >> 20)
+	s[4] = byte(x >> 28)
+	s[5] = byte(x >> 36)
+	s[6] = byte(x >> 44)
+	s[7] = byte(x >> 52)
+	s[8] = (s[8] & 240) | (byte(x >> 60) & 15)
+}
+
 type LandingGear struct {
 	Status LandingGearStatus `json:"status"` // 2bit
 }
@@ -431,6 +487,12 @@ func (m *LandingGear) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field status of encoded struct LandingGear in given buffer s.
+func PatchLandingGear_Status(s []byte, v LandingGearStatus) {
+	x := uint64(v)
+	s[0] = (s[0] & 252) | (byte(x) & 3)
+}
+
 type Position struct {
 	Latitude uint32 `json:"latitude"` // 32bit
 	Longitude uint32 `json:"longitude"` // 32bit
@@ -502,6 +564,33 @@ func (m *Position) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field latitude of encoded struct Position in given buffer s.
+func PatchPosition_Latitude(s []byte, v uint32) {
+	x := uint64(v)
+	s[0] = byte(x)
+	s[1] = byte(x >> 8)
+	s[2] = byte(x >> 16)
+	s[3] = byte(x >> 24)
+}
+
+// Patch field longitude of encoded struct Position in given buffer s.
+func PatchPosition_Longitude(s []byte, v uint32) {
+	x := uint64(v)
+	s[4] = byte(x)
+	s[5] = byte(x >> 8)
+	s[6] = byte(x >> 16)
+	s[7] = byte(x >> 24)
+}
+
+// Patch field altitude of encoded struct Position in given buffer s.
+func PatchPosition_Altitude(s []byte, v uint32) {
+	x := uint64(v)
+	s[8] = byte(x)
+	s[9] = byte(x >> 8)
+	s[10] = byte(x >> 16)
+	s[11] = byte(x >> 24)
+}
+
 // Pose in flight. https://en.wikipedia.org/wiki/Aircraft_principal_axes
 type Pose struct {
 	Yaw int32 `json:"yaw"` // 32bit
@@ -574,6 +663,33 @@ func (m *Pose) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field yaw of encoded struct Pose in given buffer s.
+func PatchPose_Yaw(s []byte, v int32) {
+	x := uint64(v)
+	s[0] = byte(x)
+	s[1] = byte(x >> 8)
+	s[2] = byte(x >> 16)
+	s[3] = byte(x >> 24)
+}
+
+// Patch field pitch of encoded struct Pose in given buffer s.
+func PatchPose_Pitch(s []byte, v int32) {
+	x := uint64(v)
+	s[4] = byte(x)
+	s[5] = byte(x >> 8)
+	s[6] = byte(x >> 16)
+	s[7] = byte(x >> 24)
+}
+
+// Patch field roll of encoded struct Pose in given buffer s.
+func PatchPose_Roll(s []byte, v int32) {
+	x := uint64(v)
+	s[8] = byte(x)
+	s[9] = byte(x >> 8)
+	s[10] = byte(x >> 16)
+	s[11] = byte(x >> 24)
+}
+
 type Flight struct {
 	Pose Pose `json:"pose"` // 96bit
 	// Velocity at X, Y, Z axis.
@@ -645,6 +761,43 @@ func (m *Flight) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 	}
 }
 
+// Patch field pose.yaw of encoded struct Flight in given buffer s.
+func PatchFlight_Pose_Yaw(s []byte, v int32) {
+	x := uint64(v)
+	s[0] = byte(x)
+	s[1] = byte(x >> 8)
+	s[2] = byte(x >> 16)
+	s[3] = byte(x >> 24)
+}
+
+// Patch field pose.pitch of encoded struct Flight in given buffer s.
+func PatchFlight_Pose_Pitch(s []byte, v int32) {
+	x := uint64(v)
+	s[4] = byte(x)
+	s[5] = byte(x >> 8)
+	s[6] = byte(x >> 16)
+	s[7] = byte(x >> 24)
+}
+
+// Patch field pose.roll of encoded struct Flight in given buffer s.
+func PatchFlight_Pose_Roll(s []byte, v int32) {
+	x := uint64(v)
+	s[8] = byte(x)
+	s[9] = byte(x >> 8)
+	s[10] = byte(x >> 16)
+	s[11] = byte(x >> 24)
+}
+
+// Patch field velocity[k0] of encoded struct Flight in given buffer s.
+func PatchFlight_Velocity(s []byte, k0 int, v int32) {
+	bp.PatchBits(s, 96+k0*32, 32, uint64(v))
+}
+
+// Patch field acceleration[k0] of encoded struct Flight in given buffer s.
+func PatchFlight_Acceleration(s []byte, k0 int, v int32) {
+	bp.PatchBits(s, 192+k0*32, 32, uint64(v))
+}
+
 type Drone struct {
 	Status DroneStatus `json:"status"` // 3bit
 	Position Position `json:"position"` // 96bit
@@ -726,4 +879,141 @@ func (m *Drone) BpGetByte(di *bp.DataIndexer, rshift int) byte {
 		default:
 			return byte(0) // Won't reached
 	}
+}
+
+// Patch field status of encoded struct Drone in given buffer s.
+func PatchDrone_Status(s []byte, v DroneStatus) {
+	x := uint64(v)
+	s[0] = (s[0] & 248) | (byte(x) & 7)
+}
+
+// Patch field position.latitude of encoded struct Drone in given buffer s.
+func PatchDrone_Position_Latitude(s []byte, v uint32) {
+	x := uint64(v)
+	s[0] = (s[0] & 7) | (byte(x << 3) & 248)
+	s[1] = byte(x >> 5)
+	s[2] = byte(x >> 13)
+	s[3] = byte(x >> 21)
+	s[4] = (s[4] & 248) | (byte(x >> 29) & 7)
+}
+
+// Patch field position.longitude of encoded struct Drone in given buffer s.
+func PatchDrone_Position_Longitude(s []byte, v uint32) {
+	x := uint64(v)
+	s[4] = (s[4] & 7) | (byte(x << 3) & 248)
+	s[5] = byte(x >> 5)
+	s[6] = byte(x >> 13)
+	s[7] = byte(x >> 21)
+	s[8] = (s[8] & 248) | (byte(x >> 29) & 7)
+}
+
+// Patch field position.altitude of encoded struct Drone in given buffer s.
+func PatchDrone_Position_Altitude(s []byte, v uint32) {
+	x := uint64(v)
+	s[8] = (s[8] & 7) | (byte(x << 3) & 248)
+	s[9] = byte(x >> 5)
+	s[10] = byte(x >> 13)
+	s[11] = byte(x >> 21)
+	s[12] = (s[12] & 248) | (byte(x >> 29) & 7)
+}
+
+// Patch field flight.pose.yaw of encoded struct Drone in given buffer s.
+func PatchDrone_Flight_Pose_Yaw(s []byte, v int32) {
+	x := uint64(v)
+	s[12] = (s[12] & 7) | (byte(x << 3) & 248)
+	s[13] = byte(x >> 5)
+	s[14] = byte(x >> 13)
+	s[15] = byte(x >> 21)
+	s[16] = (s[16] & 248) | (byte(x >> 29) & 7)
+}
+
+// Patch field flight.pose.pitch of encoded struct Drone in given buffer s.
+func PatchDrone_Flight_Pose_Pitch(s []byte, v int32) {
+	x := uint64(v)
+	s[16] = (s[16] & 7) | (byte(x << 3) & 248)
+	s[17] = byte(x >> 5)
+	s[18] = byte(x >> 13)
+	s[19] = byte(x >> 21)
+	s[20] = (s[20] & 248) | (byte(x >> 29) & 7)
+}
+
+// Patch field flight.pose.roll of encoded struct Drone in given buffer s.
+func PatchDrone_Flight_Pose_Roll(s []byte, v int32) {
+	x := uint64(v)
+	s[20] = (s[20] & 7) | (byte(x << 3) & 248)
+	s[21] = byte(x >> 5)
+	s[22] = byte(x >> 13)
+	s[23] = byte(x >> 21)
+	s[24] = (s[24] & 248) | (byte(x >> 29) & 7)
+}
+
+// Patch field flight.velocity[k0] of encoded struct Drone in given buffer s.
+func PatchDrone_Flight_Velocity(s []byte, k0 int, v int32) {
+	bp.PatchBits(s, 195+k0*32, 32, uint64(v))
+}
+
+// Patch field flight.acceleration[k0] of encoded struct Drone in given buffer s.
+func PatchDrone_Flight_Acceleration(s []byte, k0 int, v int32) {
+	bp.PatchBits(s, 291+k0*32, 32, uint64(v))
+}
+
+// Patch field propellers[k0].id of encoded struct Drone in given buffer s.
+func PatchDrone_Propellers_Id(s []byte, k0 int, v uint8) {
+	bp.PatchBits(s, 387+k0*12, 8, uint64(v))
+}
+
+// Patch field propellers[k0].status of encoded struct Drone in given buffer s.
+func PatchDrone_Propellers_Status(s []byte, k0 int, v PropellerStatus) {
+	bp.PatchBits(s, 395+k0*12, 2, uint64(v))
+}
+
+// Patch field propellers[k0].direction of encoded struct Drone in given buffer s.
+func PatchDrone_Propellers_Direction(s []byte, k0 int, v RotatingDirection) {
+	bp.PatchBits(s, 397+k0*12, 2, uint64(v))
+}
+
+// Patch field power.battery of encoded struct Drone in given buffer s.
+func PatchDrone_Power_Battery(s []byte, v uint8) {
+	x := uint64(v)
+	s[54] = (s[54] & 7) | (byte(x << 3) & 248)
+	s[55] = (s[55] & 248) | (byte(x >> 5) & 7)
+}
+
+// Patch field power.status of encoded struct Drone in given buffer s.
+func PatchDrone_Power_Status(s []byte, v PowerStatus) {
+	x := uint64(v)
+	s[55] = (s[55] & 231) | (byte(x << 3) & 24)
+}
+
+// Patch field power.is_charging of encoded struct Drone in given buffer s.
+func PatchDrone_Power_IsCharging(s []byte, v bool) {
+	x := uint64(bp.Bool2byte(v))
+	s[55] = (s[55] & 223) | (byte(x << 5) & 32)
+}
+
+// Patch field network.signal of encoded struct Drone in given buffer s.
+func PatchDrone_Network_Signal(s []byte, v uint8) {
+	x := uint64(v)
+	s[55] = (s[55] & 63) | (byte(x << 6) & 192)
+	s[56] = (s[56] & 252) | (byte(x >> 2) & 3)
+}
+
+// Patch field network.heartbeat_at of encoded struct Drone in given buffer s.
+func PatchDrone_Network_HeartbeatAt(s []byte, v Timestamp) {
+	x := uint64(v)
+	s[56] = (s[56] & 3) | (byte(x << 2) & 252)
+	s[57] = byte(x >> 6)
+	s[58] = byte(x >> 14)
+	s[59] = byte(x >> 22)
+	s[60] = byte(x >> 30)
+	s[61] = byte(x >> 38)
+	s[62] = byte(x >> 46)
+	s[63] = byte(x >> 54)
+	s[64] = (s[64] & 252) | (byte(x >> 62) & 3)
+}
+
+// Patch field landing_gear.status of encoded struct Drone in given buffer s.
+func PatchDrone_LandingGear_Status(s []byte, v LandingGearStatus) {
+	x := uint64(v)
+	s[64] = (s[64] & 243) | (byte(x << 2) & 12)
 }
\ No newline at end of file
@@ -0,0 +1,697 @@
+# Code generated by bitproto. DO NOT EDIT.
+
+
+"""
+Proto drone describes the structure of the drone.
+"""
+
+
+import json
+import struct
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+
+
+def bp_int8(i: int) -> int:
+    return i if i < 128 else i - 256
+
+def bp_int16(i: int) -> int:
+    return i if i < 32768 else i - 65536
+
+def bp_int32(i: int) -> int:
+    return i if i < 2147483648 else i - 4294967296
+
+def bp_int64(i: int) -> int:
+    return i if i < 9223372036854775808 else i - 18446744073709551616
+
+
+def bp_check_range(name: str, v: Any, lo: int, hi: int) -> None:
+    if not (isinstance(v, int) and lo <= v <= hi):
+        raise ValueError(f"{name} {v!r} out of range [{lo}, {hi}]")
+
+
+def bp_check_array(name: str, v: Any, shape: Tuple[int, ...], lo: Optional[int] = None, hi: Optional[int] = None) -> None:
+    if len(v) != shape[0]:
+        raise ValueError(f"{name} requires {shape[0]} elements, got {len(v)}")
+    for x in v:
+        if len(shape) > 1:
+            bp_check_array(name, x, shape[1:], lo, hi)
+        elif lo is not None and hi is not None:
+            bp_check_range(name, x, lo, hi)
+
+
+Timestamp = int # 64bit
+
+def bp_default_factory_Timestamp() -> Timestamp:
+    return 0
+
+
+TernaryInt32 = List[int] # 96bit
+
+def bp_default_factory_TernaryInt32() -> TernaryInt32:
+    return [0 for _ in range(3)]
+
+
+DroneStatus = int # 3bit
+DRONE_STATUS_UNKNOWN: DroneStatus = 0
+DRONE_STATUS_STANDBY: DroneStatus = 1
+DRONE_STATUS_RISING: DroneStatus = 2
+DRONE_STATUS_LANDING: DroneStatus = 3
+DRONE_STATUS_FLYING: DroneStatus = 4
+
+_DRONESTATUS_VALUE_TO_NAME_MAP: Dict[DroneStatus, str] = {
+    0: "DRONE_STATUS_UNKNOWN",
+    1: "DRONE_STATUS_STANDBY",
+    2: "DRONE_STATUS_RISING",
+    3: "DRONE_STATUS_LANDING",
+    4: "DRONE_STATUS_FLYING",
+}
+
+_DRONESTATUS_NAME_TO_VALUE_MAP: Dict[str, DroneStatus] = {
+    "DRONE_STATUS_UNKNOWN": 0,
+    "DRONE_STATUS_STANDBY": 1,
+    "DRONE_STATUS_RISING": 2,
+    "DRONE_STATUS_LANDING": 3,
+    "DRONE_STATUS_FLYING": 4,
+}
+
+
+PropellerStatus = int # 2bit
+PROPELLER_STATUS_UNKNOWN: PropellerStatus = 0
+PROPELLER_STATUS_IDLE: PropellerStatus = 1
+PROPELLER_STATUS_ROTATING: PropellerStatus = 2
+
+_PROPELLERSTATUS_VALUE_TO_NAME_MAP: Dict[PropellerStatus, str] = {
+    0: "PROPELLER_STATUS_UNKNOWN",
+    1: "PROPELLER_STATUS_IDLE",
+    2: "PROPELLER_STATUS_ROTATING",
+}
+
+_PROPELLERSTATUS_NAME_TO_VALUE_MAP: Dict[str, PropellerStatus] = {
+    "PROPELLER_STATUS_UNKNOWN": 0,
+    "PROPELLER_STATUS_IDLE": 1,
+    "PROPELLER_STATUS_ROTATING": 2,
+}
+
+
+RotatingDirection = int # 2bit
+ROTATING_DIRECTION_UNKNOWN: RotatingDirection = 0
+ROTATING_DIRECTION_CLOCK_WISE: RotatingDirection = 1
+ROTATING_DIRECTION_ANTI_CLOCK_WISE: RotatingDirection = 2
+
+_ROTATINGDIRECTION_VALUE_TO_NAME_MAP: Dict[RotatingDirection, str] = {
+    0: "ROTATING_DIRECTION_UNKNOWN",
+    1: "ROTATING_DIRECTION_CLOCK_WISE",
+    2: "ROTATING_DIRECTION_ANTI_CLOCK_WISE",
+}
+
+_ROTATINGDIRECTION_NAME_TO_VALUE_MAP: Dict[str, RotatingDirection] = {
+    "ROTATING_DIRECTION_UNKNOWN": 0,
+    "ROTATING_DIRECTION_CLOCK_WISE": 1,
+    "ROTATING_DIRECTION_ANTI_CLOCK_WISE": 2,
+}
+
+
+PowerStatus = int # 2bit
+POWER_STATUS_UNKNOWN: PowerStatus = 0
+POWER_STATUS_OFF: PowerStatus = 1
+POWER_STATUS_ON: PowerStatus = 2
+
+_POWERSTATUS_VALUE_TO_NAME_MAP: Dict[PowerStatus, str] = {
+    0: "POWER_STATUS_UNKNOWN",
+    1: "POWER_STATUS_OFF",
+    2: "POWER_STATUS_ON",
+}
+
+_POWERSTATUS_NAME_TO_VALUE_MAP: Dict[str, PowerStatus] = {
+    "POWER_STATUS_UNKNOWN": 0,
+    "POWER_STATUS_OFF": 1,
+    "POWER_STATUS_ON": 2,
+}
+
+
+LandingGearStatus = int # 2bit
+LANDING_GEAR_STATUS_UNKNOWN: LandingGearStatus = 0
+LANDING_GEAR_STATUS_UNFOLDED: LandingGearStatus = 1
+LANDING_GEAR_STATUS_FOLDED: LandingGearStatus = 2
+
+_LANDINGGEARSTATUS_VALUE_TO_NAME_MAP: Dict[LandingGearStatus, str] = {
+    0: "LANDING_GEAR_STATUS_UNKNOWN",
+    1: "LANDING_GEAR_STATUS_UNFOLDED",
+    2: "LANDING_GEAR_STATUS_FOLDED",
+}
+
+_LANDINGGEARSTATUS_NAME_TO_VALUE_MAP: Dict[str, LandingGearStatus] = {
+    "LANDING_GEAR_STATUS_UNKNOWN": 0,
+    "LANDING_GEAR_STATUS_UNFOLDED": 1,
+    "LANDING_GEAR_STATUS_FOLDED": 2,
+}
+
+
+@dataclass
+class Propeller:
+    # Number of bytes to serialize class Propeller
+    BYTES_LENGTH: ClassVar[int] = 2
+
+    # Type id of class Propeller in framing
+    BP_TYPE_ID: ClassVar[int] = 0x068D
+
+    id: int = 0 # 8bit
+    status: PropellerStatus = 0 # 2bit
+    direction: RotatingDirection = 0 # 2bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "id": self.id,
+            "status": (_PROPELLERSTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+            "direction": (_ROTATINGDIRECTION_VALUE_TO_NAME_MAP.get(self.direction, self.direction) if enum_names else self.direction),
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Propeller":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            id=d.get("id", 0),
+            status=_PROPELLERSTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+            direction=_ROTATINGDIRECTION_NAME_TO_VALUE_MAP.get(d["direction"], d["direction"]) if "direction" in d else 0,
+        )
+        if validate:
+            bp_check_range("Propeller.id", m.id, 0, 255)
+            bp_check_range("Propeller.status", m.status, 0, 3)
+            bp_check_range("Propeller.direction", m.direction, 0, 3)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Propeller":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class Power:
+    # Number of bytes to serialize class Power
+    BYTES_LENGTH: ClassVar[int] = 2
+
+    # Type id of class Power in framing
+    BP_TYPE_ID: ClassVar[int] = 0x23B2
+
+    battery: int = 0 # 8bit
+    status: PowerStatus = 0 # 2bit
+    is_charging: bool = False # 1bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "battery": self.battery,
+            "status": (_POWERSTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+            "is_charging": self.is_charging,
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Power":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            battery=d.get("battery", 0),
+            status=_POWERSTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+            is_charging=d.get("is_charging", False),
+        )
+        if validate:
+            bp_check_range("Power.battery", m.battery, 0, 255)
+            bp_check_range("Power.status", m.status, 0, 3)
+            bp_check_range("Power.is_charging", m.is_charging, 0, 1)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Power":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class Network:
+    # Number of bytes to serialize class Network
+    BYTES_LENGTH: ClassVar[int] = 9
+
+    # Type id of class Network in framing
+    BP_TYPE_ID: ClassVar[int] = 0x6ACD
+
+    # Degree of signal, between 1~10.
+    signal: int = 0 # 4bit
+    # The timestamp of the last time received heartbeat packet.
+    heartbeat_at: Timestamp = field(default_factory=bp_default_factory_Timestamp) # 64bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "signal": self.signal,
+            "heartbeat_at": self.heartbeat_at,
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Network":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            signal=d.get("signal", 0),
+            heartbeat_at=d["heartbeat_at"] if "heartbeat_at" in d else bp_default_factory_Timestamp(),
+        )
+        if validate:
+            bp_check_range("Network.signal", m.signal, 0, 15)
+            bp_check_range("Network.heartbeat_at", m.heartbeat_at, -9223372036854775808, 9223372036854775807)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Network":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class LandingGear:
+    # Number of bytes to serialize class LandingGear
+    BYTES_LENGTH: ClassVar[int] = 1
+
+    # Type id of class LandingGear in framing
+    BP_TYPE_ID: ClassVar[int] = 0xD593
+
+    status: LandingGearStatus = 0 # 2bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "status": (_LANDINGGEARSTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "LandingGear":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            status=_LANDINGGEARSTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+        )
+        if validate:
+            bp_check_range("LandingGear.status", m.status, 0, 3)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "LandingGear":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class Position:
+    # Number of bytes to serialize class Position
+    BYTES_LENGTH: ClassVar[int] = 12
+
+    # Type id of class Position in framing
+    BP_TYPE_ID: ClassVar[int] = 0x31B2
+
+    latitude: int = 0 # 32bit
+    longitude: int = 0 # 32bit
+    altitude: int = 0 # 32bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "altitude": self.altitude,
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Position":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            latitude=d.get("latitude", 0),
+            longitude=d.get("longitude", 0),
+            altitude=d.get("altitude", 0),
+        )
+        if validate:
+            bp_check_range("Position.latitude", m.latitude, 0, 4294967295)
+            bp_check_range("Position.longitude", m.longitude, 0, 4294967295)
+            bp_check_range("Position.altitude", m.altitude, 0, 4294967295)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Position":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class Pose:
+    """
+    Pose in flight. https://en.wikipedia.org/wiki/Aircraft_principal_axes
+    """
+    # Number of bytes to serialize class Pose
+    BYTES_LENGTH: ClassVar[int] = 12
+
+    # Type id of class Pose in framing
+    BP_TYPE_ID: ClassVar[int] = 0x9151
+
+    yaw: int = 0 # 32bit
+    pitch: int = 0 # 32bit
+    roll: int = 0 # 32bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "yaw": self.yaw,
+            "pitch": self.pitch,
+            "roll": self.roll,
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Pose":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            yaw=d.get("yaw", 0),
+            pitch=d.get("pitch", 0),
+            roll=d.get("roll", 0),
+        )
+        if validate:
+            bp_check_range("Pose.yaw", m.yaw, -2147483648, 2147483647)
+            bp_check_range("Pose.pitch", m.pitch, -2147483648, 2147483647)
+            bp_check_range("Pose.roll", m.roll, -2147483648, 2147483647)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Pose":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class Flight:
+    # Number of bytes to serialize class Flight
+    BYTES_LENGTH: ClassVar[int] = 36
+
+    # Type id of class Flight in framing
+    BP_TYPE_ID: ClassVar[int] = 0xD164
+
+    pose: Pose = field(default_factory=Pose) # 96bit
+    # Velocity at X, Y, Z axis.
+    velocity: TernaryInt32 = field(default_factory=bp_default_factory_TernaryInt32) # 96bit
+    # Acceleration at X, Y, Z axis.
+    acceleration: TernaryInt32 = field(default_factory=bp_default_factory_TernaryInt32) # 96bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "pose": self.pose.to_dict(enum_names),
+            "velocity": list(self.velocity),
+            "acceleration": list(self.acceleration),
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Flight":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            pose=Pose.from_dict(d["pose"], validate) if "pose" in d else Pose(),
+            velocity=list(d["velocity"]) if "velocity" in d else bp_default_factory_TernaryInt32(),
+            acceleration=list(d["acceleration"]) if "acceleration" in d else bp_default_factory_TernaryInt32(),
+        )
+        if validate:
+            bp_check_array("Flight.velocity", m.velocity, (3,), -2147483648, 2147483647)
+            bp_check_array("Flight.acceleration", m.acceleration, (3,), -2147483648, 2147483647)
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Flight":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+
+@dataclass
+class Drone:
+    # Number of bytes to serialize class Drone
+    BYTES_LENGTH: ClassVar[int] = 65
+
+    # Type id of class Drone in framing
+    BP_TYPE_ID: ClassVar[int] = 0x3376
+
+    status: DroneStatus = 0 # 3bit
+    position: Position = field(default_factory=Position) # 96bit
+    flight: Flight = field(default_factory=Flight) # 288bit
+    propellers: List[Propeller] = field(default_factory=lambda: [Propeller() for _ in range(4)]) # 48bit
+    power: Power = field(default_factory=Power) # 11bit
+    network: Network = field(default_factory=Network) # 68bit
+    landing_gear: LandingGear = field(default_factory=LandingGear) # 2bit
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "status": (_DRONESTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+            "position": self.position.to_dict(enum_names),
+            "flight": self.flight.to_dict(enum_names),
+            "propellers": [x0.to_dict(enum_names) for x0 in self.propellers],
+            "power": self.power.to_dict(enum_names),
+            "network": self.network.to_dict(enum_names),
+            "landing_gear": self.landing_gear.to_dict(enum_names),
+        }
+
+    def to_json(
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
+    ) -> str:
+        """
+        Dumps this message to a json string.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return json.dumps(self.to_dict(enum_names), indent=indent, separators=separators)
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Drone":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            status=_DRONESTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+            position=Position.from_dict(d["position"], validate) if "position" in d else Position(),
+            flight=Flight.from_dict(d["flight"], validate) if "flight" in d else Flight(),
+            propellers=[Propeller.from_dict(x0, validate) for x0 in d["propellers"]] if "propellers" in d else [Propeller() for _ in range(4)],
+            power=Power.from_dict(d["power"], validate) if "power" in d else Power(),
+            network=Network.from_dict(d["network"], validate) if "network" in d else Network(),
+            landing_gear=LandingGear.from_dict(d["landing_gear"], validate) if "landing_gear" in d else LandingGear(),
+        )
+        if validate:
+            bp_check_range("Drone.status", m.status, 0, 7)
+            bp_check_array("Drone.propellers", m.propellers, (4,))
+        return m
+
+    @classmethod
+    def from_json(cls, s: str, validate: bool = False) -> "Drone":
+        """
+        Loads a message from given json string, see from_dict.
+        """
+        return cls.from_dict(json.loads(s), validate)
+
+    def encode(self) -> bytearray:
+        """
+        Encode this object to bytearray.
+        """
+        s = bytearray(self.BYTES_LENGTH)
+        n0 = (self.status & 7) | (self.position.latitude & 4294967295) << 3 | (self.position.longitude & 4294967295) << 35 | (self.position.altitude & 4294967295) << 67 | (self.flight.pose.yaw & 4294967295) << 99 | (self.flight.pose.pitch & 4294967295) << 131 | (self.flight.pose.roll & 4294967295) << 163 | (self.flight.velocity[0] & 4294967295) << 195 | (self.flight.velocity[1] & 4294967295) << 227 | (self.flight.velocity[2] & 4294967295) << 259 | (self.flight.acceleration[0] & 4294967295) << 291 | (self.flight.acceleration[1] & 4294967295) << 323 | (self.flight.acceleration[2] & 4294967295) << 355 | (self.propellers[0].id & 255) << 387 | (self.propellers[0].status & 3) << 395 | (self.propellers[0].direction & 3) << 397 | (self.propellers[1].id & 255) << 399 | (self.propellers[1].status & 3) << 407 | (self.propellers[1].direction & 3) << 409 | (self.propellers[2].id & 255) << 411 | (self.propellers[2].status & 3) << 419 | (self.propellers[2].direction & 3) << 421 | (self.propellers[3].id & 255) << 423 | (self.propellers[3].status & 3) << 431 | (self.propellers[3].direction & 3) << 433 | (self.power.battery & 255) << 435 | (self.power.status & 3) << 443 | (self.power.is_charging & 1) << 445 | (self.network.signal & 15) << 446 | (self.network.heartbeat_at & 18446744073709551615) << 450 | (self.landing_gear.status & 3) << 514
+        s[:65] = n0.to_bytes(65, "little")
+        return s
+
+    def decode(self, s: bytearray) -> None:
+        """
+        Decode given bytearray s to this object.
+        :param s: A bytearray with length at least `BYTES_LENGTH`.
+        """
+        assert len(s) >= self.BYTES_LENGTH, ValueError("not enough bytes")
+        n0 = int.from_bytes(s[:65], "little")
+        self.status = n0 & 7
+        self.position.latitude = (n0 >> 3) & 4294967295
+        self.position.longitude = (n0 >> 35) & 4294967295
+        self.position.altitude = (n0 >> 67) & 4294967295
+        self.flight.pose.yaw = (((n0 >> 99) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.pose.pitch = (((n0 >> 131) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.pose.roll = (((n0 >> 163) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.velocity[0] = (((n0 >> 195) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.velocity[1] = (((n0 >> 227) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.velocity[2] = (((n0 >> 259) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.acceleration[0] = (((n0 >> 291) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.acceleration[1] = (((n0 >> 323) & 4294967295) ^ 2147483648) - 2147483648
+        self.flight.acceleration[2] = (((n0 >> 355) & 4294967295) ^ 2147483648) - 2147483648
+        self.propellers[0].id = (n0 >> 387) & 255
+        self.propellers[0].status = (n0 >> 395) & 3
+        self.propellers[0].direction = (n0 >> 397) & 3
+        self.propellers[1].id = (n0 >> 399) & 255
+        self.propellers[1].status = (n0 >> 407) & 3
+        self.propellers[1].direction = (n0 >> 409) & 3
+        self.propellers[2].id = (n0 >> 411) & 255
+        self.propellers[2].status = (n0 >> 419) & 3
+        self.propellers[2].direction = (n0 >> 421) & 3
+        self.propellers[3].id = (n0 >> 423) & 255
+        self.propellers[3].status = (n0 >> 431) & 3
+        self.propellers[3].direction = (n0 >> 433) & 3
+        self.power.battery = (n0 >> 435) & 255
+        self.power.status = (n0 >> 443) & 3
+        self.power.is_charging = bool((n0 >> 445) & 1)
+        self.network.signal = (n0 >> 446) & 15
+        self.network.heartbeat_at = (((n0 >> 450) & 18446744073709551615) ^ 9223372036854775808) - 9223372036854775808
+        self.landing_gear.status = (n0 >> 514) & 3
\ No newline at end of file
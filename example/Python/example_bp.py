@@ -7,8 +7,9 @@ Proto drone describes the structure of the drone.
 
 
 import json
+import struct
 from dataclasses import dataclass, field
-from typing import ClassVar, Dict, List
+from typing import Any, Callable, ClassVar, Dict, Iterable, List, Optional, Tuple, Type
 
 from bitprotolib import bp
 
@@ -46,6 +47,14 @@ _DRONESTATUS_VALUE_TO_NAME_MAP: Dict[DroneStatus, str] = {
     4: "DRONE_STATUS_FLYING",
 }
 
+_DRONESTATUS_NAME_TO_VALUE_MAP: Dict[str, DroneStatus] = {
+    "DRONE_STATUS_UNKNOWN": 0,
+    "DRONE_STATUS_STANDBY": 1,
+    "DRONE_STATUS_RISING": 2,
+    "DRONE_STATUS_LANDING": 3,
+    "DRONE_STATUS_FLYING": 4,
+}
+
 def bp_processor_DroneStatus() -> bp.Processor:
     return bp.EnumProcessor(bp.Uint(3))
 
@@ -61,6 +70,12 @@ _PROPELLERSTATUS_VALUE_TO_NAME_MAP: Dict[PropellerStatus, str] = {
     2: "PROPELLER_STATUS_ROTATING",
 }
 
+_PROPELLERSTATUS_NAME_TO_VALUE_MAP: Dict[str, PropellerStatus] = {
+    "PROPELLER_STATUS_UNKNOWN": 0,
+    "PROPELLER_STATUS_IDLE": 1,
+    "PROPELLER_STATUS_ROTATING": 2,
+}
+
 def bp_processor_PropellerStatus() -> bp.Processor:
     return bp.EnumProcessor(bp.Uint(2))
 
@@ -76,6 +91,12 @@ _ROTATINGDIRECTION_VALUE_TO_NAME_MAP: Dict[RotatingDirection, str] = {
     2: "ROTATING_DIRECTION_ANTI_CLOCK_WISE",
 }
 
+_ROTATINGDIRECTION_NAME_TO_VALUE_MAP: Dict[str, RotatingDirection] = {
+    "ROTATING_DIRECTION_UNKNOWN": 0,
+    "ROTATING_DIRECTION_CLOCK_WISE": 1,
+    "ROTATING_DIRECTION_ANTI_CLOCK_WISE": 2,
+}
+
 def bp_processor_RotatingDirection() -> bp.Processor:
     return bp.EnumProcessor(bp.Uint(2))
 
@@ -91,6 +112,12 @@ _POWERSTATUS_VALUE_TO_NAME_MAP: Dict[PowerStatus, str] = {
     2: "POWER_STATUS_ON",
 }
 
+_POWERSTATUS_NAME_TO_VALUE_MAP: Dict[str, PowerStatus] = {
+    "POWER_STATUS_UNKNOWN": 0,
+    "POWER_STATUS_OFF": 1,
+    "POWER_STATUS_ON": 2,
+}
+
 def bp_processor_PowerStatus() -> bp.Processor:
     return bp.EnumProcessor(bp.Uint(2))
 
@@ -106,6 +133,12 @@ _LANDINGGEARSTATUS_VALUE_TO_NAME_MAP: Dict[LandingGearStatus, str] = {
     2: "LANDING_GEAR_STATUS_FOLDED",
 }
 
+_LANDINGGEARSTATUS_NAME_TO_VALUE_MAP: Dict[str, LandingGearStatus] = {
+    "LANDING_GEAR_STATUS_UNKNOWN": 0,
+    "LANDING_GEAR_STATUS_UNFOLDED": 1,
+    "LANDING_GEAR_STATUS_FOLDED": 2,
+}
+
 def bp_processor_LandingGearStatus() -> bp.Processor:
     return bp.EnumProcessor(bp.Uint(2))
 
@@ -115,11 +148,15 @@ class Propeller(bp.MessageBase):
     # Number of bytes to serialize class Propeller
     BYTES_LENGTH: ClassVar[int] = 2
 
+    # Type id of class Propeller in framing
+    BP_TYPE_ID: ClassVar[int] = 0x068D
+
     id: int = 0 # 8bit
     status: PropellerStatus = 0 # 2bit
     direction: RotatingDirection = 0 # 2bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp.Uint(8)),
             bp.MessageFieldProcessor(2, bp_processor_PropellerStatus()),
@@ -127,23 +164,23 @@ class Propeller(bp.MessageBase):
         ]
         return bp.MessageProcessor(False, 12, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.id |= (int(b) << lshift)
-        if di.field_number == 2:
-            self.status |= (PropellerStatus(b) << lshift)
-        if di.field_number == 3:
-            self.direction |= (RotatingDirection(b) << lshift)
+            self.id = v
+        elif di.field_number == 2:
+            self.status = v
+        elif di.field_number == 3:
+            self.direction = v
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.id >> rshift) & 255
-        if di.field_number == 2:
-            return (self.status >> rshift) & 255
-        if di.field_number == 3:
-            return (self.direction >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.id
+        elif di.field_number == 2:
+            return self.status
+        elif di.field_number == 3:
+            return self.direction
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         return bp.NilAccessor() # Won't reached
@@ -153,18 +190,111 @@ class Propeller(bp.MessageBase):
         Encode this object to bytearray.
         """
         s = bytearray(self.BYTES_LENGTH)
-        ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
-        return ctx.s
+        bp_struct_encode_Propeller(self, s, 0)
+        return s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
-        ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            bp_struct_decode_Propeller(self, s, 0)
+        else:
+            ctx = bp.ProcessContext(False, s)
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    @classmethod
+    def bp_struct_codecs(cls) -> Tuple[Optional[bp.Codec], Optional[bp.Codec]]:
+        return bp_struct_encode_Propeller, bp_struct_decode_Propeller
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "id": self.id,
+            "status": (_PROPELLERSTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+            "direction": (_ROTATINGDIRECTION_VALUE_TO_NAME_MAP.get(self.direction, self.direction) if enum_names else self.direction),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Propeller":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            id=d.get("id", 0),
+            status=_PROPELLERSTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+            direction=_ROTATINGDIRECTION_NAME_TO_VALUE_MAP.get(d["direction"], d["direction"]) if "direction" in d else 0,
+        )
+        if validate:
+            bp.check_range("Propeller.id", m.id, 0, 255)
+            bp.check_range("Propeller.status", m.status, 0, 3)
+            bp.check_range("Propeller.direction", m.direction, 0, 3)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("id", bp.FLAG_UINT, 8, 0),
+            bp.BatchField("status", bp.FLAG_ENUM, 2, 8),
+            bp.BatchField("direction", bp.FLAG_ENUM, 2, 10),
+        ]
+        return bp.BatchLayout(2, fields)
+
+class PropellerView(bp.MessageView):
+    """
+    Read-only view of Propeller in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Propeller
+
+    @property
+    def id(self) -> int:
+        return self.bp_uint(0, 8)
+
+    @property
+    def status(self) -> PropellerStatus:
+        return self.bp_uint(8, 2)
+
+    @property
+    def direction(self) -> RotatingDirection:
+        return self.bp_uint(10, 2)
+
+# Structs of message Propeller, for the fast path of encoding and decoding.
+_PROPELLER_STRUCT = struct.Struct("<BB")
+_PROPELLER_ENCODING_STRUCT = _PROPELLER_STRUCT
+
+def bp_struct_encode_Propeller(m: "Propeller", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 2:
+        return False
+    n1 = (m.status & 3) | (m.direction & 3) << 2
+    _PROPELLER_ENCODING_STRUCT.pack_into(
+        s,
+        o,
+        m.id & 255,
+        n1,
+    )
+    return True
+
+def bp_struct_decode_Propeller(m: "Propeller", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 2:
+        return False
+    (
+        m.id,
+        n1,
+    ) = _PROPELLER_STRUCT.unpack_from(s, o)
+    m.status = n1 & 3
+    m.direction = (n1 >> 2) & 3
+    return True
 
 
 @dataclass
@@ -172,11 +302,15 @@ class Power(bp.MessageBase):
     # Number of bytes to serialize class Power
     BYTES_LENGTH: ClassVar[int] = 2
 
+    # Type id of class Power in framing
+    BP_TYPE_ID: ClassVar[int] = 0x23B2
+
     battery: int = 0 # 8bit
     status: PowerStatus = 0 # 2bit
     is_charging: bool = False # 1bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp.Uint(8)),
             bp.MessageFieldProcessor(2, bp_processor_PowerStatus()),
@@ -184,23 +318,23 @@ class Power(bp.MessageBase):
         ]
         return bp.MessageProcessor(False, 11, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.battery |= (int(b) << lshift)
-        if di.field_number == 2:
-            self.status |= (PowerStatus(b) << lshift)
-        if di.field_number == 3:
-            self.is_charging = bool(b)
+            self.battery = v
+        elif di.field_number == 2:
+            self.status = v
+        elif di.field_number == 3:
+            self.is_charging = bool(v)
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.battery >> rshift) & 255
-        if di.field_number == 2:
-            return (self.status >> rshift) & 255
-        if di.field_number == 3:
-            return (int(self.is_charging) >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.battery
+        elif di.field_number == 2:
+            return self.status
+        elif di.field_number == 3:
+            return int(self.is_charging)
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         return bp.NilAccessor() # Won't reached
@@ -210,18 +344,111 @@ class Power(bp.MessageBase):
         Encode this object to bytearray.
         """
         s = bytearray(self.BYTES_LENGTH)
-        ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
-        return ctx.s
+        bp_struct_encode_Power(self, s, 0)
+        return s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
-        ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            bp_struct_decode_Power(self, s, 0)
+        else:
+            ctx = bp.ProcessContext(False, s)
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    @classmethod
+    def bp_struct_codecs(cls) -> Tuple[Optional[bp.Codec], Optional[bp.Codec]]:
+        return bp_struct_encode_Power, bp_struct_decode_Power
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "battery": self.battery,
+            "status": (_POWERSTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+            "is_charging": self.is_charging,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Power":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            battery=d.get("battery", 0),
+            status=_POWERSTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+            is_charging=d.get("is_charging", False),
+        )
+        if validate:
+            bp.check_range("Power.battery", m.battery, 0, 255)
+            bp.check_range("Power.status", m.status, 0, 3)
+            bp.check_range("Power.is_charging", m.is_charging, 0, 1)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("battery", bp.FLAG_UINT, 8, 0),
+            bp.BatchField("status", bp.FLAG_ENUM, 2, 8),
+            bp.BatchField("is_charging", bp.FLAG_BOOL, 1, 10),
+        ]
+        return bp.BatchLayout(2, fields)
+
+class PowerView(bp.MessageView):
+    """
+    Read-only view of Power in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Power
+
+    @property
+    def battery(self) -> int:
+        return self.bp_uint(0, 8)
+
+    @property
+    def status(self) -> PowerStatus:
+        return self.bp_uint(8, 2)
+
+    @property
+    def is_charging(self) -> bool:
+        return self.bp_bool(10)
+
+# Structs of message Power, for the fast path of encoding and decoding.
+_POWER_STRUCT = struct.Struct("<BB")
+_POWER_ENCODING_STRUCT = _POWER_STRUCT
+
+def bp_struct_encode_Power(m: "Power", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 2:
+        return False
+    n1 = (m.status & 3) | (m.is_charging & 1) << 2
+    _POWER_ENCODING_STRUCT.pack_into(
+        s,
+        o,
+        m.battery & 255,
+        n1,
+    )
+    return True
+
+def bp_struct_decode_Power(m: "Power", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 2:
+        return False
+    (
+        m.battery,
+        n1,
+    ) = _POWER_STRUCT.unpack_from(s, o)
+    m.status = n1 & 3
+    m.is_charging = bool((n1 >> 2) & 1)
+    return True
 
 
 @dataclass
@@ -229,31 +456,35 @@ class Network(bp.MessageBase):
     # Number of bytes to serialize class Network
     BYTES_LENGTH: ClassVar[int] = 9
 
+    # Type id of class Network in framing
+    BP_TYPE_ID: ClassVar[int] = 0x6ACD
+
     # Degree of signal, between 1~10.
     signal: int = 0 # 4bit
     # The timestamp of the last time received heartbeat packet.
     heartbeat_at: Timestamp = field(default_factory=bp_default_factory_Timestamp) # 64bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp.Uint(4)),
             bp.MessageFieldProcessor(2, bp_processor_Timestamp()),
         ]
         return bp.MessageProcessor(False, 68, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.signal |= (int(b) << lshift)
-        if di.field_number == 2:
-            self.heartbeat_at |= bp.int64((int(b) << lshift))
+            self.signal = v
+        elif di.field_number == 2:
+            self.heartbeat_at = bp.int64(v)
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.signal >> rshift) & 255
-        if di.field_number == 2:
-            return (self.heartbeat_at >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.signal
+        elif di.field_number == 2:
+            return self.heartbeat_at
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         return bp.NilAccessor() # Won't reached
@@ -264,17 +495,72 @@ class Network(bp.MessageBase):
         """
         s = bytearray(self.BYTES_LENGTH)
         ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        self.bp_plan().process(ctx, self)
         return ctx.s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
         ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            self.bp_plan().process(ctx, self)
+        else:
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "signal": self.signal,
+            "heartbeat_at": self.heartbeat_at,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Network":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            signal=d.get("signal", 0),
+            heartbeat_at=d["heartbeat_at"] if "heartbeat_at" in d else bp_default_factory_Timestamp(),
+        )
+        if validate:
+            bp.check_range("Network.signal", m.signal, 0, 15)
+            bp.check_range("Network.heartbeat_at", m.heartbeat_at, -9223372036854775808, 9223372036854775807)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("signal", bp.FLAG_UINT, 4, 0),
+            bp.BatchField("heartbeat_at", bp.FLAG_INT, 64, 4),
+        ]
+        return bp.BatchLayout(9, fields)
+
+class NetworkView(bp.MessageView):
+    """
+    Read-only view of Network in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Network
+
+    @property
+    def signal(self) -> int:
+        return self.bp_uint(0, 4)
+
+    @property
+    def heartbeat_at(self) -> int:
+        return self.bp_int(4, 64)
 
 
 @dataclass
@@ -282,23 +568,27 @@ class LandingGear(bp.MessageBase):
     # Number of bytes to serialize class LandingGear
     BYTES_LENGTH: ClassVar[int] = 1
 
+    # Type id of class LandingGear in framing
+    BP_TYPE_ID: ClassVar[int] = 0xD593
+
     status: LandingGearStatus = 0 # 2bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp_processor_LandingGearStatus()),
         ]
         return bp.MessageProcessor(False, 2, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.status |= (LandingGearStatus(b) << lshift)
+            self.status = v
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.status >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.status
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         return bp.NilAccessor() # Won't reached
@@ -309,17 +599,64 @@ class LandingGear(bp.MessageBase):
         """
         s = bytearray(self.BYTES_LENGTH)
         ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        self.bp_plan().process(ctx, self)
         return ctx.s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
         ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            self.bp_plan().process(ctx, self)
+        else:
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "status": (_LANDINGGEARSTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "LandingGear":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            status=_LANDINGGEARSTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+        )
+        if validate:
+            bp.check_range("LandingGear.status", m.status, 0, 3)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("status", bp.FLAG_ENUM, 2, 0),
+        ]
+        return bp.BatchLayout(1, fields)
+
+class LandingGearView(bp.MessageView):
+    """
+    Read-only view of LandingGear in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = LandingGear
+
+    @property
+    def status(self) -> LandingGearStatus:
+        return self.bp_uint(0, 2)
 
 
 @dataclass
@@ -327,11 +664,15 @@ class Position(bp.MessageBase):
     # Number of bytes to serialize class Position
     BYTES_LENGTH: ClassVar[int] = 12
 
+    # Type id of class Position in framing
+    BP_TYPE_ID: ClassVar[int] = 0x31B2
+
     latitude: int = 0 # 32bit
     longitude: int = 0 # 32bit
     altitude: int = 0 # 32bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp.Uint(32)),
             bp.MessageFieldProcessor(2, bp.Uint(32)),
@@ -339,23 +680,23 @@ class Position(bp.MessageBase):
         ]
         return bp.MessageProcessor(False, 96, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.latitude |= (int(b) << lshift)
-        if di.field_number == 2:
-            self.longitude |= (int(b) << lshift)
-        if di.field_number == 3:
-            self.altitude |= (int(b) << lshift)
+            self.latitude = v
+        elif di.field_number == 2:
+            self.longitude = v
+        elif di.field_number == 3:
+            self.altitude = v
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.latitude >> rshift) & 255
-        if di.field_number == 2:
-            return (self.longitude >> rshift) & 255
-        if di.field_number == 3:
-            return (self.altitude >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.latitude
+        elif di.field_number == 2:
+            return self.longitude
+        elif di.field_number == 3:
+            return self.altitude
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         return bp.NilAccessor() # Won't reached
@@ -365,18 +706,110 @@ class Position(bp.MessageBase):
         Encode this object to bytearray.
         """
         s = bytearray(self.BYTES_LENGTH)
-        ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
-        return ctx.s
+        bp_struct_encode_Position(self, s, 0)
+        return s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
-        ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            bp_struct_decode_Position(self, s, 0)
+        else:
+            ctx = bp.ProcessContext(False, s)
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    @classmethod
+    def bp_struct_codecs(cls) -> Tuple[Optional[bp.Codec], Optional[bp.Codec]]:
+        return bp_struct_encode_Position, bp_struct_decode_Position
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "altitude": self.altitude,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Position":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            latitude=d.get("latitude", 0),
+            longitude=d.get("longitude", 0),
+            altitude=d.get("altitude", 0),
+        )
+        if validate:
+            bp.check_range("Position.latitude", m.latitude, 0, 4294967295)
+            bp.check_range("Position.longitude", m.longitude, 0, 4294967295)
+            bp.check_range("Position.altitude", m.altitude, 0, 4294967295)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("latitude", bp.FLAG_UINT, 32, 0),
+            bp.BatchField("longitude", bp.FLAG_UINT, 32, 32),
+            bp.BatchField("altitude", bp.FLAG_UINT, 32, 64),
+        ]
+        return bp.BatchLayout(12, fields)
+
+class PositionView(bp.MessageView):
+    """
+    Read-only view of Position in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Position
+
+    @property
+    def latitude(self) -> int:
+        return self.bp_uint(0, 32)
+
+    @property
+    def longitude(self) -> int:
+        return self.bp_uint(32, 32)
+
+    @property
+    def altitude(self) -> int:
+        return self.bp_uint(64, 32)
+
+# Structs of message Position, for the fast path of encoding and decoding.
+_POSITION_STRUCT = struct.Struct("<III")
+_POSITION_ENCODING_STRUCT = _POSITION_STRUCT
+
+def bp_struct_encode_Position(m: "Position", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 12:
+        return False
+    _POSITION_ENCODING_STRUCT.pack_into(
+        s,
+        o,
+        m.latitude & 4294967295,
+        m.longitude & 4294967295,
+        m.altitude & 4294967295,
+    )
+    return True
+
+def bp_struct_decode_Position(m: "Position", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 12:
+        return False
+    (
+        m.latitude,
+        m.longitude,
+        m.altitude,
+    ) = _POSITION_STRUCT.unpack_from(s, o)
+    return True
 
 
 @dataclass
@@ -387,11 +820,15 @@ class Pose(bp.MessageBase):
     # Number of bytes to serialize class Pose
     BYTES_LENGTH: ClassVar[int] = 12
 
+    # Type id of class Pose in framing
+    BP_TYPE_ID: ClassVar[int] = 0x9151
+
     yaw: int = 0 # 32bit
     pitch: int = 0 # 32bit
     roll: int = 0 # 32bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp.Int(32)),
             bp.MessageFieldProcessor(2, bp.Int(32)),
@@ -399,23 +836,23 @@ class Pose(bp.MessageBase):
         ]
         return bp.MessageProcessor(False, 96, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.yaw |= bp.int32((int(b) << lshift))
-        if di.field_number == 2:
-            self.pitch |= bp.int32((int(b) << lshift))
-        if di.field_number == 3:
-            self.roll |= bp.int32((int(b) << lshift))
+            self.yaw = bp.int32(v)
+        elif di.field_number == 2:
+            self.pitch = bp.int32(v)
+        elif di.field_number == 3:
+            self.roll = bp.int32(v)
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.yaw >> rshift) & 255
-        if di.field_number == 2:
-            return (self.pitch >> rshift) & 255
-        if di.field_number == 3:
-            return (self.roll >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.yaw
+        elif di.field_number == 2:
+            return self.pitch
+        elif di.field_number == 3:
+            return self.roll
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         return bp.NilAccessor() # Won't reached
@@ -425,18 +862,110 @@ class Pose(bp.MessageBase):
         Encode this object to bytearray.
         """
         s = bytearray(self.BYTES_LENGTH)
-        ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
-        return ctx.s
+        bp_struct_encode_Pose(self, s, 0)
+        return s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
-        ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            bp_struct_decode_Pose(self, s, 0)
+        else:
+            ctx = bp.ProcessContext(False, s)
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    @classmethod
+    def bp_struct_codecs(cls) -> Tuple[Optional[bp.Codec], Optional[bp.Codec]]:
+        return bp_struct_encode_Pose, bp_struct_decode_Pose
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "yaw": self.yaw,
+            "pitch": self.pitch,
+            "roll": self.roll,
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Pose":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            yaw=d.get("yaw", 0),
+            pitch=d.get("pitch", 0),
+            roll=d.get("roll", 0),
+        )
+        if validate:
+            bp.check_range("Pose.yaw", m.yaw, -2147483648, 2147483647)
+            bp.check_range("Pose.pitch", m.pitch, -2147483648, 2147483647)
+            bp.check_range("Pose.roll", m.roll, -2147483648, 2147483647)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("yaw", bp.FLAG_INT, 32, 0),
+            bp.BatchField("pitch", bp.FLAG_INT, 32, 32),
+            bp.BatchField("roll", bp.FLAG_INT, 32, 64),
+        ]
+        return bp.BatchLayout(12, fields)
+
+class PoseView(bp.MessageView):
+    """
+    Read-only view of Pose in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Pose
+
+    @property
+    def yaw(self) -> int:
+        return self.bp_int(0, 32)
+
+    @property
+    def pitch(self) -> int:
+        return self.bp_int(32, 32)
+
+    @property
+    def roll(self) -> int:
+        return self.bp_int(64, 32)
+
+# Structs of message Pose, for the fast path of encoding and decoding.
+_POSE_STRUCT = struct.Struct("<iii")
+_POSE_ENCODING_STRUCT = struct.Struct("<III")
+
+def bp_struct_encode_Pose(m: "Pose", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 12:
+        return False
+    _POSE_ENCODING_STRUCT.pack_into(
+        s,
+        o,
+        m.yaw & 4294967295,
+        m.pitch & 4294967295,
+        m.roll & 4294967295,
+    )
+    return True
+
+def bp_struct_decode_Pose(m: "Pose", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 12:
+        return False
+    (
+        m.yaw,
+        m.pitch,
+        m.roll,
+    ) = _POSE_STRUCT.unpack_from(s, o)
+    return True
 
 
 @dataclass
@@ -444,33 +973,37 @@ class Flight(bp.MessageBase):
     # Number of bytes to serialize class Flight
     BYTES_LENGTH: ClassVar[int] = 36
 
+    # Type id of class Flight in framing
+    BP_TYPE_ID: ClassVar[int] = 0xD164
+
     pose: Pose = field(default_factory=Pose) # 96bit
     # Velocity at X, Y, Z axis.
     velocity: TernaryInt32 = field(default_factory=bp_default_factory_TernaryInt32) # 96bit
     # Acceleration at X, Y, Z axis.
     acceleration: TernaryInt32 = field(default_factory=bp_default_factory_TernaryInt32) # 96bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
-            bp.MessageFieldProcessor(1, Pose().bp_processor()),
+            bp.MessageFieldProcessor(1, Pose.bp_processor()),
             bp.MessageFieldProcessor(2, bp_processor_TernaryInt32()),
             bp.MessageFieldProcessor(3, bp_processor_TernaryInt32()),
         ]
         return bp.MessageProcessor(False, 288, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 2:
-            self.velocity[di.i(0)] |= bp.int32((int(b) << lshift))
-        if di.field_number == 3:
-            self.acceleration[di.i(0)] |= bp.int32((int(b) << lshift))
+            self.velocity[di.i(0)] = bp.int32(v)
+        elif di.field_number == 3:
+            self.acceleration[di.i(0)] = bp.int32(v)
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 2:
-            return (self.velocity[di.i(0)] >> rshift) & 255
-        if di.field_number == 3:
-            return (self.acceleration[di.i(0)] >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.velocity[di.i(0)]
+        elif di.field_number == 3:
+            return self.acceleration[di.i(0)]
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         if di.field_number == 1:
@@ -482,18 +1015,123 @@ class Flight(bp.MessageBase):
         Encode this object to bytearray.
         """
         s = bytearray(self.BYTES_LENGTH)
-        ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
-        return ctx.s
+        bp_struct_encode_Flight(self, s, 0)
+        return s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
-        ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        if fields is None:
+            bp_struct_decode_Flight(self, s, 0)
+        else:
+            ctx = bp.ProcessContext(False, s)
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    @classmethod
+    def bp_struct_codecs(cls) -> Tuple[Optional[bp.Codec], Optional[bp.Codec]]:
+        return bp_struct_encode_Flight, bp_struct_decode_Flight
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "pose": self.pose.to_dict(enum_names),
+            "velocity": list(self.velocity),
+            "acceleration": list(self.acceleration),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Flight":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            pose=Pose.from_dict(d["pose"], validate) if "pose" in d else Pose(),
+            velocity=list(d["velocity"]) if "velocity" in d else bp_default_factory_TernaryInt32(),
+            acceleration=list(d["acceleration"]) if "acceleration" in d else bp_default_factory_TernaryInt32(),
+        )
+        if validate:
+            bp.check_array("Flight.velocity", m.velocity, (3,), -2147483648, 2147483647)
+            bp.check_array("Flight.acceleration", m.acceleration, (3,), -2147483648, 2147483647)
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("pose.yaw", bp.FLAG_INT, 32, 0),
+            bp.BatchField("pose.pitch", bp.FLAG_INT, 32, 32),
+            bp.BatchField("pose.roll", bp.FLAG_INT, 32, 64),
+            bp.BatchField("velocity", bp.FLAG_INT, 32, 96, (3,), (32,)),
+            bp.BatchField("acceleration", bp.FLAG_INT, 32, 192, (3,), (32,)),
+        ]
+        return bp.BatchLayout(36, fields)
+
+class FlightView(bp.MessageView):
+    """
+    Read-only view of Flight in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Flight
+
+    @property
+    def pose(self) -> PoseView:
+        return PoseView.bp_at(self.bp_s, self.bp_i + 0)
+
+    @property
+    def velocity(self) -> bp.ArrayView:
+        return bp.ArrayView(self.bp_s, self.bp_i + 96, 3, 32, bp.reader(bp.FLAG_INT, 32))
+
+    @property
+    def acceleration(self) -> bp.ArrayView:
+        return bp.ArrayView(self.bp_s, self.bp_i + 192, 3, 32, bp.reader(bp.FLAG_INT, 32))
+
+# Structs of message Flight, for the fast path of encoding and decoding.
+_FLIGHT_STRUCT = struct.Struct("<iiiiiiiii")
+_FLIGHT_ENCODING_STRUCT = struct.Struct("<IIIIIIIII")
+
+def bp_struct_encode_Flight(m: "Flight", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 36:
+        return False
+    _FLIGHT_ENCODING_STRUCT.pack_into(
+        s,
+        o,
+        m.pose.yaw & 4294967295,
+        m.pose.pitch & 4294967295,
+        m.pose.roll & 4294967295,
+        m.velocity[0] & 4294967295,
+        m.velocity[1] & 4294967295,
+        m.velocity[2] & 4294967295,
+        m.acceleration[0] & 4294967295,
+        m.acceleration[1] & 4294967295,
+        m.acceleration[2] & 4294967295,
+    )
+    return True
+
+def bp_struct_decode_Flight(m: "Flight", s: bp.Buffer, o: int) -> bool:
+    if len(s) - o < 36:
+        return False
+    (
+        m.pose.yaw,
+        m.pose.pitch,
+        m.pose.roll,
+        m.velocity[0],
+        m.velocity[1],
+        m.velocity[2],
+        m.acceleration[0],
+        m.acceleration[1],
+        m.acceleration[2],
+    ) = _FLIGHT_STRUCT.unpack_from(s, o)
+    return True
 
 
 @dataclass
@@ -501,6 +1139,9 @@ class Drone(bp.MessageBase):
     # Number of bytes to serialize class Drone
     BYTES_LENGTH: ClassVar[int] = 65
 
+    # Type id of class Drone in framing
+    BP_TYPE_ID: ClassVar[int] = 0x3376
+
     status: DroneStatus = 0 # 3bit
     position: Position = field(default_factory=Position) # 96bit
     flight: Flight = field(default_factory=Flight) # 288bit
@@ -509,40 +1150,41 @@ class Drone(bp.MessageBase):
     network: Network = field(default_factory=Network) # 68bit
     landing_gear: LandingGear = field(default_factory=LandingGear) # 2bit
 
-    def bp_processor(self) -> bp.Processor:
+    @classmethod
+    def bp_build_processor(cls) -> bp.Processor:
         field_processors: List[bp.Processor] = [
             bp.MessageFieldProcessor(1, bp_processor_DroneStatus()),
-            bp.MessageFieldProcessor(2, Position().bp_processor()),
-            bp.MessageFieldProcessor(3, Flight().bp_processor()),
-            bp.MessageFieldProcessor(4, bp.Array(False, 4, Propeller().bp_processor())),
-            bp.MessageFieldProcessor(5, Power().bp_processor()),
-            bp.MessageFieldProcessor(6, Network().bp_processor()),
-            bp.MessageFieldProcessor(7, LandingGear().bp_processor()),
+            bp.MessageFieldProcessor(2, Position.bp_processor()),
+            bp.MessageFieldProcessor(3, Flight.bp_processor()),
+            bp.MessageFieldProcessor(4, bp.Array(False, 4, Propeller.bp_processor())),
+            bp.MessageFieldProcessor(5, Power.bp_processor()),
+            bp.MessageFieldProcessor(6, Network.bp_processor()),
+            bp.MessageFieldProcessor(7, LandingGear.bp_processor()),
         ]
         return bp.MessageProcessor(False, 516, field_processors)
 
-    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+    def bp_set_value(self, di: bp.DataIndexer, v: int) -> None:
         if di.field_number == 1:
-            self.status |= (DroneStatus(b) << lshift)
+            self.status = v
         return
 
-    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+    def bp_get_value(self, di: bp.DataIndexer) -> int:
         if di.field_number == 1:
-            return (self.status >> rshift) & 255
-        return bp.byte(0)  # Won't reached
+            return self.status
+        return 0  # Won't reached
 
     def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
         if di.field_number == 2:
             return self.position
-        if di.field_number == 3:
+        elif di.field_number == 3:
             return self.flight
-        if di.field_number == 4:
+        elif di.field_number == 4:
             return self.propellers[di.i(0)]
-        if di.field_number == 5:
+        elif di.field_number == 5:
             return self.power
-        if di.field_number == 6:
+        elif di.field_number == 6:
             return self.network
-        if di.field_number == 7:
+        elif di.field_number == 7:
             return self.landing_gear
         return bp.NilAccessor() # Won't reached
 
@@ -552,14 +1194,128 @@ class Drone(bp.MessageBase):
         """
         s = bytearray(self.BYTES_LENGTH)
         ctx = bp.ProcessContext(True, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        self.bp_plan().process(ctx, self)
         return ctx.s
 
-    def decode(self, s: bytearray) -> None:
+    def decode(self, s: bytearray, fields: Optional[Iterable[str]] = None) -> None:
         """
         Decode given bytearray s to this object.
         :param s: A bytearray with length at least `BYTES_LENGTH`.
+        :param fields: Optional dotted paths of the fields to decode, e.g.
+           ["status", "power.battery"], other fields are skipped.
         """
         assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
         ctx = bp.ProcessContext(False, s)
-        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
\ No newline at end of file
+        if fields is None:
+            self.bp_plan().process(ctx, self)
+        else:
+            self.bp_partial_plan(fields).process(ctx, self)
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """
+        Converts this message to a dict.
+        :param enum_names: Whether to convert enum values to their names.
+        """
+        return {
+            "status": (_DRONESTATUS_VALUE_TO_NAME_MAP.get(self.status, self.status) if enum_names else self.status),
+            "position": self.position.to_dict(enum_names),
+            "flight": self.flight.to_dict(enum_names),
+            "propellers": [x0.to_dict(enum_names) for x0 in self.propellers],
+            "power": self.power.to_dict(enum_names),
+            "network": self.network.to_dict(enum_names),
+            "landing_gear": self.landing_gear.to_dict(enum_names),
+        }
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any], validate: bool = False) -> "Drone":
+        """
+        Constructs a message from given dict, the inverse of to_dict.
+        Missing keys take default values, enums accept both values and names.
+        :param validate: Whether to check values are in the range of the bits of
+           their fields, raises ValueError otherwise.
+        """
+        m = cls(
+            status=_DRONESTATUS_NAME_TO_VALUE_MAP.get(d["status"], d["status"]) if "status" in d else 0,
+            position=Position.from_dict(d["position"], validate) if "position" in d else Position(),
+            flight=Flight.from_dict(d["flight"], validate) if "flight" in d else Flight(),
+            propellers=[Propeller.from_dict(x0, validate) for x0 in d["propellers"]] if "propellers" in d else [Propeller() for _ in range(4)],
+            power=Power.from_dict(d["power"], validate) if "power" in d else Power(),
+            network=Network.from_dict(d["network"], validate) if "network" in d else Network(),
+            landing_gear=LandingGear.from_dict(d["landing_gear"], validate) if "landing_gear" in d else LandingGear(),
+        )
+        if validate:
+            bp.check_range("Drone.status", m.status, 0, 7)
+            bp.check_array("Drone.propellers", m.propellers, (4,))
+        return m
+
+    @classmethod
+    def bp_build_batch_layout(cls) -> bp.BatchLayout:
+        fields: List[bp.BatchField] = [
+            bp.BatchField("status", bp.FLAG_ENUM, 3, 0),
+            bp.BatchField("position.latitude", bp.FLAG_UINT, 32, 3),
+            bp.BatchField("position.longitude", bp.FLAG_UINT, 32, 35),
+            bp.BatchField("position.altitude", bp.FLAG_UINT, 32, 67),
+            bp.BatchField("flight.pose.yaw", bp.FLAG_INT, 32, 99),
+            bp.BatchField("flight.pose.pitch", bp.FLAG_INT, 32, 131),
+            bp.BatchField("flight.pose.roll", bp.FLAG_INT, 32, 163),
+            bp.BatchField("flight.velocity", bp.FLAG_INT, 32, 195, (3,), (32,)),
+            bp.BatchField("flight.acceleration", bp.FLAG_INT, 32, 291, (3,), (32,)),
+            bp.BatchField("propellers.id", bp.FLAG_UINT, 8, 387, (4,), (12,)),
+            bp.BatchField("propellers.status", bp.FLAG_ENUM, 2, 395, (4,), (12,)),
+            bp.BatchField("propellers.direction", bp.FLAG_ENUM, 2, 397, (4,), (12,)),
+            bp.BatchField("power.battery", bp.FLAG_UINT, 8, 435),
+            bp.BatchField("power.status", bp.FLAG_ENUM, 2, 443),
+            bp.BatchField("power.is_charging", bp.FLAG_BOOL, 1, 445),
+            bp.BatchField("network.signal", bp.FLAG_UINT, 4, 446),
+            bp.BatchField("network.heartbeat_at", bp.FLAG_INT, 64, 450),
+            bp.BatchField("landing_gear.status", bp.FLAG_ENUM, 2, 514),
+        ]
+        return bp.BatchLayout(65, fields)
+
+class DroneView(bp.MessageView):
+    """
+    Read-only view of Drone in a buffer, decodes fields on access.
+    """
+    __slots__ = ()
+    BP_MESSAGE: ClassVar[Type[bp.MessageBase]] = Drone
+
+    @property
+    def status(self) -> DroneStatus:
+        return self.bp_uint(0, 3)
+
+    @property
+    def position(self) -> PositionView:
+        return PositionView.bp_at(self.bp_s, self.bp_i + 3)
+
+    @property
+    def flight(self) -> FlightView:
+        return FlightView.bp_at(self.bp_s, self.bp_i + 99)
+
+    @property
+    def propellers(self) -> bp.ArrayView:
+        return bp.ArrayView(self.bp_s, self.bp_i + 387, 4, 12, PropellerView.bp_at)
+
+    @property
+    def power(self) -> PowerView:
+        return PowerView.bp_at(self.bp_s, self.bp_i + 435)
+
+    @property
+    def network(self) -> NetworkView:
+        return NetworkView.bp_at(self.bp_s, self.bp_i + 446)
+
+    @property
+    def landing_gear(self) -> LandingGearView:
+        return LandingGearView.bp_at(self.bp_s, self.bp_i + 514)
+
+
+# Message classes of this proto keyed by type id, for framing.
+BP_MESSAGES: Dict[int, Type[bp.MessageBase]] = {
+    0x068D: Propeller,
+    0x23B2: Power,
+    0x6ACD: Network,
+    0xD593: LandingGear,
+    0x31B2: Position,
+    0x9151: Pose,
+    0xD164: Flight,
+    0x3376: Drone,
+}
\ No newline at end of file
@@ -281,6 +281,26 @@ uint16_t BpDecodeMessageExtensibleAhead(struct BpMessageDescriptor *descriptor,
     return data;
 }
 
+// BpPatchBits copy number of nbits from given value v to buffer s starting at
+// bit index i. Unlike encoding, the bits around on the bytes spanned are kept,
+// so that a single field of an encoded buffer can be rewritten in place.
+void BpPatchBits(unsigned char *s, int i, int nbits, uint64_t v) {
+    // j is the number of bits patched.
+    int j = 0;
+    while (j < nbits) {
+        // Remainder of bit index on 8.
+        int k = i & 7;
+        // Number of bits to patch on current byte.
+        int c = (8 - k < nbits - j) ? (8 - k) : (nbits - j);
+        // Mask of the bits to patch, like 0b01111100.
+        unsigned char mask = (1 << (k + c)) - (1 << k);
+        unsigned char b = (unsigned char)((v >> j) << k);
+        s[i >> 3] = (s[i >> 3] & ~mask) | (b & mask);
+        j += c;
+        i += c;
+    }
+}
+
 // BpMinTriple returns the smaller one of given three integers.
 int BpMinTriple(int a, int b, int c) {
     return (a < b) ? ((a < c) ? a : c) : ((b < c) ? b : c);
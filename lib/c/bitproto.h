@@ -194,6 +194,10 @@ void BpEncodeMessageExtensibleAhead(struct BpMessageDescriptor *descriptor,
 uint16_t BpDecodeMessageExtensibleAhead(struct BpMessageDescriptor *descriptor,
                                         struct BpProcessorContext *ctx);
 
+// Patching
+
+void BpPatchBits(unsigned char *s, int i, int nbits, uint64_t v);
+
 // Json Formatting
 
 void BpJsonFormatString(struct BpJsonFormatContext *ctx, const char *format,
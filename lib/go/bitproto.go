@@ -422,6 +422,21 @@ func decodeSingleByte(ctx *ProcessContext, di *DataIndexer, accessor Accessor, j
 	accessor.BpSetByte(di, lshift, d)
 }
 
+// PatchBits copy number of nbits from given value v to buffer s starting at
+// bit index i. Unlike encoding, the bits around on the bytes spanned are kept,
+// so that a single field of an encoded buffer can be rewritten in place.
+func PatchBits(s []byte, i, nbits int, v uint64) {
+	for j := 0; j < nbits; {
+		// Number of bits to patch on current byte.
+		c := min(8-(i%8), nbits-j)
+		mask := byte(getMask(i%8, c)) // safe cast: i%8 and c always in [0,8]
+		s[int(i/8)] = (s[int(i/8)] &^ mask) | (byte((v>>j)<<(i%8)) & mask)
+		// Maintain trackers.
+		i += c
+		j += c
+	}
+}
+
 // Returns the number of bits to copy during a single byte process.
 // Argument i, j, n:
 //	i is the number of the total bits processed.
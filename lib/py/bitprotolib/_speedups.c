@@ -0,0 +1,305 @@
+// Copyright (c) 2021, hit9. https://github.com/hit9/bitproto
+// Optional C accelerator for bitprotolib, bitprotolib.bp falls back to pure
+// Python if this module is not built.
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+#include <string.h>
+
+// Flags, the same with bitprotolib.bp.
+#define BP_FLAG_BOOL 1
+#define BP_FLAG_INT 2
+
+// Number of bytes of a layout entry: uint32 offset, uint8 nbits, uint8 flag.
+#define BP_LAYOUT_ENTRY_SIZE 6
+
+///////////////////
+// Bits
+///////////////////
+
+// BpMask returns the mask of lowest n bits.
+static inline uint64_t BpMask(int n) {
+    return n >= 64 ? UINT64_MAX : (((uint64_t)1 << n) - 1);
+}
+
+// BpGetBits reads number of nbits starting at bit index i from buffer p, as an
+// unsigned integer. The bit i locates at byte i / 8, bit i % 8 of the byte.
+static uint64_t BpGetBits(const unsigned char *p, Py_ssize_t i, int nbits) {
+    Py_ssize_t start = i >> 3;
+    int shift = (int)(i & 7);
+    int nbytes = (shift + nbits + 7) >> 3;
+    uint64_t v = 0;
+
+    for (int k = 0; k < nbytes && k < 8; k++) v |= (uint64_t)p[start + k] << (8 * k);
+    v >>= shift;
+    // The ninth byte, only if the bits span 9 bytes.
+    if (nbytes > 8) v |= (uint64_t)p[start + 8] << (64 - shift);
+    return v & BpMask(nbits);
+}
+
+// BpSetBits writes number of nbits of data v to buffer p starting at bit index
+// i. The bits before i on the first byte are kept, and the bits after the data
+// on the last byte are cleared.
+static void BpSetBits(unsigned char *p, Py_ssize_t i, int nbits, uint64_t v) {
+    Py_ssize_t start = i >> 3;
+    int shift = (int)(i & 7);
+    int nbytes = (shift + nbits + 7) >> 3;
+
+    v &= BpMask(nbits);
+
+    for (int k = 0; k < nbytes; k++) {
+        // Position of this byte's lowest bit in data v.
+        int d = 8 * k - shift;
+        unsigned char b;
+        if (d < 0) {
+            b = (unsigned char)(v << -d);
+            // Keeps the bits already processed on the first byte.
+            b |= p[start] & (unsigned char)((1 << shift) - 1);
+        } else {
+            b = d < 64 ? (unsigned char)(v >> d) : 0;
+        }
+        p[start + k] = b;
+    }
+}
+
+// BpOrBits ors number of nbits of data v to buffer p starting at bit index i.
+static void BpOrBits(unsigned char *p, Py_ssize_t i, int nbits, uint64_t v) {
+    Py_ssize_t start = i >> 3;
+    int shift = (int)(i & 7);
+    int nbytes = (shift + nbits + 7) >> 3;
+
+    v &= BpMask(nbits);
+
+    for (int k = 0; k < nbytes; k++) {
+        int d = 8 * k - shift;
+        if (d < 0)
+            p[start + k] |= (unsigned char)(v << -d);
+        else if (d < 64)
+            p[start + k] |= (unsigned char)(v >> d);
+    }
+}
+
+// BpCheckRange sets IndexError if number of nbits at bit index i is out of
+// buffer view.
+static int BpCheckRange(Py_buffer *view, Py_ssize_t i, int nbits) {
+    if (i < 0 || nbits < 0 || nbits > 64 || ((i + nbits + 7) >> 3) > view->len) {
+        PyErr_SetString(PyExc_IndexError, "bitprotolib: buffer index out of range");
+        return -1;
+    }
+    return 0;
+}
+
+// BpGetLayoutEntry reads the k'th entry of given layout, sets IndexError if the
+// entry is out of number of nbytes.
+static int BpGetLayoutEntry(Py_buffer *layout, Py_ssize_t k, Py_ssize_t nbytes,
+                            Py_ssize_t *offset, int *nbits, int *flag) {
+    const unsigned char *e = (const unsigned char *)layout->buf + k * BP_LAYOUT_ENTRY_SIZE;
+    *offset = (Py_ssize_t)((uint32_t)e[0] | ((uint32_t)e[1] << 8) |
+                           ((uint32_t)e[2] << 16) | ((uint32_t)e[3] << 24));
+    *nbits = e[4];
+    *flag = e[5];
+
+    if (*nbits < 1 || *nbits > 64 || ((*offset + *nbits + 7) >> 3) > nbytes) {
+        PyErr_SetString(PyExc_IndexError, "bitprotolib: layout entry out of range");
+        return -1;
+    }
+    return 0;
+}
+
+///////////////////
+// Functions
+///////////////////
+
+PyDoc_STRVAR(read_bits_at_doc,
+             "read_bits_at(s, i, nbits)\n\n"
+             "Decode number of nbits from buffer s at bit index i as an unsigned "
+             "integer.");
+
+static PyObject *read_bits_at(PyObject *self, PyObject *args) {
+    PyObject *s;
+    Py_ssize_t i;
+    int nbits;
+    Py_buffer view;
+
+    if (!PyArg_ParseTuple(args, "Oni", &s, &i, &nbits)) return NULL;
+    if (PyObject_GetBuffer(s, &view, PyBUF_SIMPLE) < 0) return NULL;
+
+    if (BpCheckRange(&view, i, nbits) < 0) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    uint64_t v = BpGetBits((const unsigned char *)view.buf, i, nbits);
+    PyBuffer_Release(&view);
+    return PyLong_FromUnsignedLongLong(v);
+}
+
+PyDoc_STRVAR(write_bits_at_doc,
+             "write_bits_at(s, i, nbits, data)\n\n"
+             "Encode number of nbits of given data to buffer s at bit index i.");
+
+static PyObject *write_bits_at(PyObject *self, PyObject *args) {
+    PyObject *s;
+    Py_ssize_t i;
+    int nbits;
+    PyObject *data;
+    Py_buffer view;
+
+    if (!PyArg_ParseTuple(args, "OniO", &s, &i, &nbits, &data)) return NULL;
+
+    uint64_t v = PyLong_AsUnsignedLongLongMask(data);
+    if (v == (uint64_t)-1 && PyErr_Occurred()) return NULL;
+
+    if (PyObject_GetBuffer(s, &view, PyBUF_WRITABLE) < 0) return NULL;
+
+    if (BpCheckRange(&view, i, nbits) < 0) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    BpSetBits((unsigned char *)view.buf, i, nbits, v);
+    PyBuffer_Release(&view);
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(unpack_doc,
+             "unpack(s, o, nbytes, layout)\n\n"
+             "Decode all values in given layout from number of nbytes of buffer s "
+             "starting at byte offset o, returns a tuple of the values.\n"
+             "The layout is a bytes of packed entries (uint32 offset, uint8 nbits, "
+             "uint8 flag), offset is relative to the bit index of o.");
+
+static PyObject *unpack(PyObject *self, PyObject *args) {
+    PyObject *s;
+    Py_ssize_t o;
+    Py_ssize_t nbytes;
+    Py_buffer layout;
+    Py_buffer view;
+
+    if (!PyArg_ParseTuple(args, "Onny*", &s, &o, &nbytes, &layout)) return NULL;
+    if (PyObject_GetBuffer(s, &view, PyBUF_SIMPLE) < 0) {
+        PyBuffer_Release(&layout);
+        return NULL;
+    }
+
+    PyObject *values = NULL;
+
+    if (o < 0 || view.len - o < nbytes) {
+        PyErr_SetString(PyExc_IndexError, "bitprotolib: buffer index out of range");
+        goto done;
+    }
+
+    Py_ssize_t n = layout.len / BP_LAYOUT_ENTRY_SIZE;
+    values = PyTuple_New(n);
+    if (values == NULL) goto done;
+
+    const unsigned char *p = (const unsigned char *)view.buf + o;
+
+    for (Py_ssize_t k = 0; k < n; k++) {
+        Py_ssize_t offset;
+        int nbits, flag;
+        if (BpGetLayoutEntry(&layout, k, nbytes, &offset, &nbits, &flag) < 0) {
+            Py_CLEAR(values);
+            goto done;
+        }
+
+        uint64_t v = BpGetBits(p, offset, nbits);
+        PyObject *value;
+
+        if (flag == BP_FLAG_BOOL) {
+            value = PyBool_FromLong((long)v);
+        } else if (flag == BP_FLAG_INT && nbits < 64 && (v >> (nbits - 1))) {
+            // Sign extension.
+            value = PyLong_FromLongLong((long long)(v | ~BpMask(nbits)));
+        } else if (flag == BP_FLAG_INT) {
+            value = PyLong_FromLongLong((long long)v);
+        } else {
+            value = PyLong_FromUnsignedLongLong(v);
+        }
+
+        if (value == NULL) {
+            Py_CLEAR(values);
+            goto done;
+        }
+        PyTuple_SET_ITEM(values, k, value);
+    }
+
+done:
+    PyBuffer_Release(&view);
+    PyBuffer_Release(&layout);
+    return values;
+}
+
+PyDoc_STRVAR(pack_doc,
+             "pack(s, o, nbytes, layout, values)\n\n"
+             "Encode given values by layout to number of nbytes of buffer s starting "
+             "at byte offset o, the bytes are cleared before.\n"
+             "The layout is in the same format with unpack.");
+
+static PyObject *pack(PyObject *self, PyObject *args) {
+    PyObject *s;
+    Py_ssize_t o;
+    Py_ssize_t nbytes;
+    Py_buffer layout;
+    PyObject *values;
+    Py_buffer view;
+    PyObject *result = NULL;
+
+    if (!PyArg_ParseTuple(args, "Onny*O!", &s, &o, &nbytes, &layout, &PyTuple_Type,
+                          &values))
+        return NULL;
+    if (PyObject_GetBuffer(s, &view, PyBUF_WRITABLE) < 0) {
+        PyBuffer_Release(&layout);
+        return NULL;
+    }
+
+    Py_ssize_t n = layout.len / BP_LAYOUT_ENTRY_SIZE;
+
+    if (o < 0 || view.len - o < nbytes) {
+        PyErr_SetString(PyExc_IndexError, "bitprotolib: buffer index out of range");
+        goto done;
+    }
+    if (PyTuple_GET_SIZE(values) != n) {
+        PyErr_SetString(PyExc_ValueError, "bitprotolib: values don't match layout");
+        goto done;
+    }
+
+    unsigned char *p = (unsigned char *)view.buf + o;
+    memset(p, 0, (size_t)nbytes);
+
+    for (Py_ssize_t k = 0; k < n; k++) {
+        Py_ssize_t offset;
+        int nbits, flag;
+        if (BpGetLayoutEntry(&layout, k, nbytes, &offset, &nbits, &flag) < 0)
+            goto done;
+
+        uint64_t v = PyLong_AsUnsignedLongLongMask(PyTuple_GET_ITEM(values, k));
+        if (v == (uint64_t)-1 && PyErr_Occurred()) goto done;
+        BpOrBits(p, offset, nbits, v);
+    }
+
+    Py_INCREF(Py_None);
+    result = Py_None;
+
+done:
+    PyBuffer_Release(&view);
+    PyBuffer_Release(&layout);
+    return result;
+}
+
+static PyMethodDef speedups_methods[] = {
+    {"read_bits_at", read_bits_at, METH_VARARGS, read_bits_at_doc},
+    {"write_bits_at", write_bits_at, METH_VARARGS, write_bits_at_doc},
+    {"unpack", unpack, METH_VARARGS, unpack_doc},
+    {"pack", pack, METH_VARARGS, pack_doc},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef speedups_module = {
+    PyModuleDef_HEAD_INIT,
+    "bitprotolib._speedups",
+    "Optional C accelerator for bitprotolib.",
+    -1,
+    speedups_methods,
+};
+
+PyMODINIT_FUNC PyInit__speedups(void) { return PyModule_Create(&speedups_module); }
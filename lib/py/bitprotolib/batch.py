@@ -0,0 +1,239 @@
+"""
+bitprotolib.batch
+~~~~~~~~~~~~~~~~~
+
+Batch encoding and decoding of contiguous message frames with numpy.
+
+Frames of a message are of fixed size, a batch of N frames is viewed as an uint8 array
+of shape (N, nbytes), and then every field is processed with vectorized shifts and
+masks, by the bit offsets in the message's BatchLayout.
+
+Numpy is an optional dependency, required only if this module is used.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+from bitprotolib.bp import (
+    FLAG_BOOL,
+    FLAG_INT,
+    BatchAhead,
+    BatchField,
+    BatchLayout,
+    Buffer,
+    MessageBase,
+    NotEnoughBytes,
+)
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "bitprotolib: numpy is required for batch encoding and decoding"
+        )
+
+
+def get_dtype(field: BatchField) -> Any:
+    """Returns the numpy dtype of the column of given field."""
+    if field.flag == FLAG_BOOL:
+        return np.bool_
+    for nbits in (8, 16, 32, 64):
+        if field.nbits <= nbits:
+            if field.flag == FLAG_INT:
+                return np.dtype(f"int{nbits}")
+            return np.dtype(f"uint{nbits}")
+
+
+def iter_elements(
+    item: Union[BatchField, BatchAhead]
+) -> Iterator[Tuple[Tuple[int, ...], int]]:
+    """Iterates the index and bit offset of each element of given field or ahead.
+    A non-array item yields a single element with empty index.
+    """
+    for index in np.ndindex(*item.shape):
+        offset = item.offset
+        for k, stride in zip(index, item.strides):
+            offset += k * stride
+        yield index, offset
+
+
+def extract_bits(frames: Any, i: int, n: int) -> Any:
+    """Extracts number of n bits starting at bit index i from all frames, returns an
+    uint64 array of length N.
+    """
+    start, end, shift = i >> 3, (i + n + 7) >> 3, i & 7
+    v = np.zeros(frames.shape[0], dtype=np.uint64)
+    for k in range(start, end):
+        b = frames[:, k].astype(np.uint64)
+        # Position of this byte's lowest bit in the value.
+        d = (k - start) * 8 - shift
+        if d >= 0:
+            v |= b << np.uint64(d)
+        else:
+            v |= b >> np.uint64(-d)
+    if n < 64:
+        v &= np.uint64((1 << n) - 1)
+    return v
+
+
+def insert_bits(frames: Any, i: int, n: int, v: Any) -> None:
+    """Inserts number of n bits of v at bit index i to all frames.
+    The argument v is an uint64 array of length N, or a numpy uint64 scalar, with no
+    bits set beyond n.
+    """
+    start, end, shift = i >> 3, (i + n + 7) >> 3, i & 7
+    for k in range(start, end):
+        # Position of this byte's lowest bit in the value.
+        d = (k - start) * 8 - shift
+        if d >= 0:
+            b = v >> np.uint64(d)
+        else:
+            b = v << np.uint64(-d)
+        frames[:, k] |= (b & np.uint64(255)).astype(np.uint8)
+
+
+def to_signed(v: Any, n: int) -> Any:
+    """Casts an uint64 array of n bits integers to int64 by sign extension."""
+    shift = np.uint64(64 - n)
+    return (v << shift).view(np.int64) >> np.int64(64 - n)
+
+
+def decode_batch(layout: BatchLayout, s: Buffer) -> Dict[str, Any]:
+    """Decode contiguous encoded frames in buffer s to numpy columns by given layout.
+
+    :param layout: The batch layout of the message to decode.
+    :param s: A buffer with a length of multiple of `layout.nbytes`.
+    """
+    require_numpy()
+
+    if layout.nbytes == 0:
+        return {}
+    if len(s) % layout.nbytes != 0:
+        raise NotEnoughBytes()
+
+    frames = np.frombuffer(s, dtype=np.uint8).reshape(-1, layout.nbytes)
+    n = frames.shape[0]
+
+    columns: Dict[str, Any] = {}
+    for field in layout.fields:
+        column = np.empty((n,) + field.shape, dtype=get_dtype(field))
+        for index, offset in iter_elements(field):
+            v = extract_bits(frames, offset, field.nbits)
+            if field.flag == FLAG_INT:
+                v = to_signed(v, field.nbits)
+            column[(slice(None),) + index] = v
+        columns[field.name] = column
+    return columns
+
+
+def get_attr_path(data: Any, path: List[str]) -> Any:
+    """Returns the value lookedup by given attribute path from data, arrays along the
+    path are mapped to nested lists.
+    """
+    if isinstance(data, (list, tuple)):
+        return [get_attr_path(e, path) for e in data]
+    if not path:
+        if isinstance(data, (bytes, bytearray)):
+            return list(data)
+        return data
+    return get_attr_path(getattr(data, path[0]), path[1:])
+
+
+def collect_columns(
+    layout: BatchLayout, messages: Iterable[MessageBase]
+) -> Tuple[int, Dict[str, Any]]:
+    """Collects numpy columns from given messages by layout.
+    Returns the number of messages and the columns.
+    """
+    messages = list(messages)
+    columns: Dict[str, Any] = {}
+    for field in layout.fields:
+        values = get_attr_path(messages, field.name.split("."))
+        columns[field.name] = np.array(values, dtype=get_dtype(field))
+    return len(messages), columns
+
+
+def collect_mapping_columns(
+    layout: BatchLayout, data: Mapping[str, Any], count: Optional[int]
+) -> Tuple[int, Dict[str, Any]]:
+    """Collects numpy columns from given mapping of columns by layout.
+    Returns the number of messages and the columns. Raises ValueError if any column is
+    not a field in layout, or the columns are of different lengths.
+    """
+    names = {field.name for field in layout.fields}
+    columns: Dict[str, Any] = {}
+    lengths = set()
+    for name, column in data.items():
+        if name not in names:
+            raise ValueError(f"bitprotolib: unknown column {name}")
+        column = np.asarray(column)
+        if column.ndim > 0:
+            lengths.add(len(column))
+        columns[name] = column
+
+    if count is not None:
+        lengths.add(count)
+    if not lengths:
+        raise ValueError("bitprotolib: count is required to encode without columns")
+    if len(lengths) > 1:
+        raise ValueError(
+            f"bitprotolib: columns should be of the same length, got {sorted(lengths)}"
+        )
+    return lengths.pop(), columns
+
+
+def encode_batch(
+    layout: BatchLayout,
+    data: Union[Mapping[str, Any], Iterable[MessageBase]],
+    count: Optional[int] = None,
+) -> bytes:
+    """Encode a batch of messages to contiguous encoded frames by given layout.
+
+    :param layout: The batch layout of the message to encode.
+    :param data: Either a mapping of columns keyed by field names in layout, or an
+       iterable of messages.
+    :param count: The number of messages to encode, checked against the length of
+       the columns or messages if given. Required for a mapping without columns, e.g.
+       of a message without fields.
+    """
+    require_numpy()
+
+    if isinstance(data, Mapping):
+        n, columns = collect_mapping_columns(layout, data, count)
+    else:
+        n, columns = collect_columns(layout, data)
+        if count is not None and count != n:
+            raise ValueError(f"bitprotolib: count {count} mismatches {n} messages")
+
+    if n == 0:
+        return b""
+
+    frames = np.zeros((n, layout.nbytes), dtype=np.uint8)
+
+    for ahead in layout.aheads:
+        value = np.uint64(ahead.value)
+        for _, offset in iter_elements(ahead):
+            insert_bits(frames, offset, 16, value)
+
+    for field in layout.fields:
+        column = columns.get(field.name, None)
+        if column is None:
+            continue
+        if column.shape != (n,) + field.shape:
+            raise ValueError(
+                f"bitprotolib: column {field.name} should be of shape {(n,) + field.shape}"
+            )
+        if field.flag == FLAG_INT:
+            v = column.astype(np.int64).view(np.uint64)
+        else:
+            v = column.astype(np.uint64)
+        if field.nbits < 64:
+            v &= np.uint64((1 << field.nbits) - 1)
+        for index, offset in iter_elements(field):
+            insert_bits(frames, offset, field.nbits, v[(slice(None),) + index])
+
+    return frames.tobytes()
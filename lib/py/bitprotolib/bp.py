@@ -8,11 +8,30 @@ Keep it simple:  No magic.
 """
 
 import json
+import os
+import re
 from abc import abstractmethod
-from contextlib import contextmanager
 from dataclasses import asdict, dataclass
 from dataclasses import field as dataclass_field
-from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dataclasses import fields as dataclass_fields
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 # Flags
 FLAG_BOOL: int = 1
@@ -28,6 +47,15 @@ FLAG_MESSAGE_FIELD: int = 9
 # Python dosen't have a byte type, using int instead.
 byte = int
 
+# Python dosen't have a type for objects supporting the buffer protocol, using Any
+# instead. e.g. bytes, bytearray, memoryview and mmap.
+Buffer = Any
+
+# Encoder and decoder take arguments (message, s, o), o is the byte offset to start at
+# in buffer s. They return False if the message can't be processed in the straight-line
+# way, i.e. buffer s is not long enough or decoded aheads differ from the message's.
+Codec = Callable[[Any, Buffer, int], bool]
+
 
 def int8(i: int) -> int:
     return i if i < 128 else i - 256
@@ -45,40 +73,57 @@ def int64(i: int) -> int:
     return i if i < 9223372036854775808 else i - 18446744073709551616
 
 
-class Error(Exception):
-    """Error occurred during bitproto encoding or decoding."""
+T = TypeVar("T")
 
 
-class NotEnoughBytes(Error):
-    """Given bytearray is not enough to process."""
+def add_slots(cls: Type[T]) -> Type[T]:
+    """Returns a new dataclass equivalent to given dataclass cls, but with __slots__ of
+    its fields, so that its instances have no per-instance __dict__.
+    The runtime context and processors are decorated with this, and so are the
+    generated message classes if option py.slots is set.
+    The slots argument of dataclass decorator is not used, since it requires Python 3.10.
+    """
+    cls_dict = dict(cls.__dict__)
+    field_names = tuple(f.name for f in dataclass_fields(cls))
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # Class variables of default values conflict with slots, the defaults are kept
+        # by the generated __init__.
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    metaclass: Any = type(cls)
+    slotted_cls: Type[T] = metaclass(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
 
 
-@dataclass
-class ProcessContext:
-    """ProcessContext is the context across all processor functions in a encoding or
-    decoding process.
+class Error(Exception):
+    """Error occurred during bitproto encoding or decoding."""
 
-    :param is_encode: Indicates whether current processing is encoding.
-    :param s: Bytes buffer processing. When encoding, s is the destination buffer to
-       write; When decoding, s is the source buffer to read.
-    :param i: Tracks the number of total bits processed.
-    """
 
-    is_encode: bool
-    s: bytearray
-    i: int = 0
+class NotEnoughBytes(Error):
+    """Given bytearray is not enough to process."""
 
 
+@add_slots
 @dataclass
 class DataIndexer:
     """DataIndexer contains the argument to index data from current accessor.
+    A single DataIndexer is created for each ProcessContext, and then mutated across all
+    processors, instead of creating one for every field.
 
     :param field_number: Current field number.
-    :param aistack: Array index stack in case of nested array in a single message.
+    :param aistack: Array index stack in case of nested array, preallocated and shared by
+       the nesting messages, each message uses the slice from index base to top.
+    :param base: The index in aistack where current message's array indexes start.
+    :param top: Number of array indexes in use in aistack.
     """
 
     field_number: int
-    aistack: List[int] = dataclass_field(default_factory=list)
+    aistack: List[int] = dataclass_field(default_factory=lambda: [0] * 8)
+    base: int = 0
+    top: int = 0
 
     def is_valid(self) -> bool:
         """If this data indexer valid."""
@@ -86,24 +131,38 @@ class DataIndexer:
 
     def i(self, n: int) -> int:
         """Returns array element index at depth n."""
-        return self.aistack[n]
+        return self.aistack[self.base + n]
 
     def index_stack_up(self) -> None:
-        self.aistack.append(0)
+        if self.top == len(self.aistack):
+            self.aistack.append(0)
+        self.top += 1
 
     def index_stack_down(self) -> None:
-        self.aistack.pop()
-
-    @contextmanager
-    def index_stack_maintain(self) -> Iterator[None]:
-        try:
-            self.index_stack_up()
-            yield
-        finally:
-            self.index_stack_down()
+        self.top -= 1
 
     def index_stack_replace(self, k: int) -> None:
-        self.aistack[-1] = k
+        self.aistack[self.top - 1] = k
+
+
+@add_slots
+@dataclass
+class ProcessContext:
+    """ProcessContext is the context across all processor functions in a encoding or
+    decoding process.
+
+    :param is_encode: Indicates whether current processing is encoding.
+    :param s: Bytes buffer processing. When encoding, s is the destination buffer to
+       write; When decoding, s is the source buffer to read.
+    :param i: Tracks the index of bit processing in s, starts from 0 by default, or the
+       bit index of the start offset when processing in the middle of s.
+    :param di: The data indexer shared by all processors in this process.
+    """
+
+    is_encode: bool
+    s: Buffer
+    i: int = 0
+    di: DataIndexer = dataclass_field(default_factory=lambda: DataIndexer(0))
 
 
 # NIL_DATA_INDEXER indicates this indexer is useless.
@@ -115,22 +174,46 @@ class Accessor:
     Assuming compiler generates these methods for messages.
     """
 
-    @abstractmethod
-    def bp_set_byte(self, di: DataIndexer, lshift: int, b: byte) -> None:
-        """Sets given byte to target data, where the data will be lookedup by given
+    __slots__ = ()
+
+    def bp_set_value(self, di: DataIndexer, v: int) -> None:
+        """Sets given value v to target data, where the data will be lookedup by given
         indexer di from this accessor.
         This method is called only if target data is a single type.
 
-        :param lshift: The number of bits to shift right on b before it's written onto the
-           indexed data.
+        :param v: The unsigned integer decoded, of the number of bits the target data
+           occupy. Signed integers and booleans should be casted from it.
+
+        Falls back to setting the value byte by byte via bp_set_byte, for classes
+        generated by older compilers.
+        """
+        for lshift in range(0, max(v.bit_length(), 1), 8):
+            self.bp_set_byte(di, lshift, (v >> lshift) & 255)
+
+    def bp_get_value(self, di: DataIndexer) -> int:
+        """Returns the value of the data lookedup by given indexer di from the accessor.
+        This method is called only if target data is a single type.
+
+        Falls back to collecting the value byte by byte via bp_get_byte, for classes
+        generated by older compilers. Bits beyond the target data are masked off by
+        the caller.
+        """
+        v = 0
+        for rshift in range(0, 64, 8):
+            v |= self.bp_get_byte(di, rshift) << rshift
+        return v
+
+    def bp_set_byte(self, di: DataIndexer, lshift: int, b: byte) -> None:
+        """Ors given byte b shifted left by lshift bits to target data, where the data
+        will be lookedup by given indexer di from this accessor.
+        Generated by older compilers only, see bp_set_value.
         """
         raise NotImplementedError
 
-    @abstractmethod
     def bp_get_byte(self, di: DataIndexer, rshift: int) -> byte:
-        """Returns the byte from the data lookedup by given indexer di from the accessor.
-        Argument rshift is the number of bits to shift left on the data before it's cast
-        to byte. This method is called only if target data is a single type.
+        """Returns the byte of the data lookedup by given indexer di from this
+        accessor, shifted right by rshift bits.
+        Generated by older compilers only, see bp_get_value.
         """
         raise NotImplementedError
 
@@ -147,52 +230,590 @@ class NilAccessor(Accessor):
     invalid and shouldn't be used further.
     """
 
-    def bp_set_byte(self, di: DataIndexer, lshift: int, b: byte) -> None:
+    def bp_set_value(self, di: DataIndexer, v: int) -> None:
         pass
 
-    def bp_get_byte(self, di: DataIndexer, rshift: int) -> byte:
-        return byte(0)
+    def bp_get_value(self, di: DataIndexer) -> int:
+        return 0
 
     def bp_get_accessor(self, di: DataIndexer) -> "Accessor":
         return self
 
 
-@dataclass
-class IntAccessor(Accessor):
-    """IntAccessor implements Accessor for int encoding and decoding."""
+M = TypeVar("M", bound="MessageBase")
 
-    data: int = 0
 
-    def bp_set_byte(self, di: DataIndexer, lshift: int, b: byte) -> None:
-        if di.field_number == 1:
-            self.data |= int(b) << lshift
+class MessageBase(Accessor):
+    """MessageBase is the base class for all bitproto message classes."""
 
-    def bp_get_byte(self, di: DataIndexer, rshift: int) -> byte:
-        if di.field_number == 1:
-            return (self.data >> rshift) & 255
-        return byte(0)
+    __slots__ = ()
 
-    def bp_get_accessor(self, di: DataIndexer) -> "Accessor":
-        return NilAccessor()
+    # Number of bytes to serialize, assuming compiler generates this for messages.
+    BYTES_LENGTH: ClassVar[int]
+    # Type id in framing, assuming compiler generates this for messages.
+    BP_TYPE_ID: ClassVar[int]
 
+    @classmethod
+    def bp_processor(cls) -> "Processor":
+        """Returns the processor of this message class.
+        The processor tree is built by bp_build_processor on the first call, and then
+        cached on the class, shared by all instances.
+        """
+        processor = cls.__dict__.get("_bp_processor", None)
+        if processor is None:
+            processor = cls.bp_build_processor()
+            setattr(cls, "_bp_processor", processor)
+        return processor
 
-class MessageBase(Accessor):
-    """MessageBase is the base class for all bitproto message classes."""
+    @classmethod
+    @abstractmethod
+    def bp_build_processor(cls) -> "Processor":
+        """Builds the processor tree of this message class.
+        Assuming compiler generates this method for messages.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def bp_plan(cls) -> "Plan":
+        """Returns the plan of this message class, flattened from the processor tree
+        on the first call, and then cached on the class like bp_processor.
+        The straight-line encoder and decoder of the plan are generated at the same time,
+        unless the class has struct codecs, see bp_struct_codecs.
+        """
+        plan = cls.__dict__.get("_bp_plan", None)
+        if plan is None:
+            plan = cls.bp_build_plan(cast(MessageProcessor, cls.bp_processor()))
+        return plan
+
+    @classmethod
+    def bp_build_plan(cls, processor: "MessageProcessor") -> "Plan":
+        """Builds the plan of this message class from given processor tree of it, and
+        then caches it on the class, see bp_plan.
+        """
+        from bitprotolib.codegen import build_codecs
+
+        plan = build_plan(processor)
+        plan.encoder, plan.decoder = cls.bp_struct_codecs()
+        if plan.encoder is None or plan.decoder is None:
+            plan.encoder, plan.decoder = build_codecs(cls, processor)
+        setattr(cls, "_bp_plan", plan)
+        return plan
+
+    @classmethod
+    def bp_struct_codecs(cls) -> Tuple[Optional[Codec], Optional[Codec]]:
+        """Returns the encoder and decoder of this message class by struct, which
+        compiler generates for byte-aligned messages, i.e. consist of only 8/16/32/64
+        bits integers. Returns (None, None) for others, the straight-line codecs are
+        generated at runtime instead, see bp_plan.
+        """
+        return None, None
+
+    @classmethod
+    def bp_partial_plan(cls, fields: Iterable[str]) -> "Plan":
+        """Returns the plan decoding only the fields of given dotted paths, e.g.
+        ["status", "power.battery"], other fields are skipped and left untouched.
+        Plans are reduced from bp_plan with a generated decoder of the fields, and
+        cached on the class per set of fields.
+        """
+        key = frozenset(fields)
+        plans = cls.__dict__.get("_bp_partial_plans", None)
+        if plans is None:
+            plans = {}
+            setattr(cls, "_bp_partial_plans", plans)
+        plan = plans.get(key, None)
+        if plan is None:
+            from bitprotolib.codegen import build_partial_decoder
+
+            tree = parse_field_paths(key)
+            plan = reduce_plan(cls.bp_plan(), cls, tree)
+            processor = cast(MessageProcessor, cls.bp_processor())
+            plan.decoder = build_partial_decoder(cls, processor, tree)
+            plans[key] = plan
+        return plan
+
+    @classmethod
+    def bp_batch_layout(cls) -> "BatchLayout":
+        """Returns the batch layout of this message class, cached on the class like
+        bp_processor.
+        """
+        layout = cls.__dict__.get("_bp_batch_layout", None)
+        if layout is None:
+            layout = cls.bp_build_batch_layout()
+            setattr(cls, "_bp_batch_layout", layout)
+        return layout
+
+    @classmethod
+    @abstractmethod
+    def bp_build_batch_layout(cls) -> "BatchLayout":
+        """Builds the batch layout of this message class.
+        Assuming compiler generates this method for messages.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def bp_patch_target(cls, path: str) -> Tuple[int, int, int]:
+        """Returns the index of bit, the number of bits and the flag of the base type
+        field of given path in the encoded buffer of this message, see patch. Resolved
+        from the batch layout, and cached on the class per path.
+        """
+        targets = cls.__dict__.get("_bp_patch_targets", None)
+        if targets is None:
+            targets = {}
+            setattr(cls, "_bp_patch_targets", targets)
+        target = targets.get(path, None)
+        if target is None:
+            target = resolve_patch_target(cls, path)
+            targets[path] = target
+        return target
+
+    @classmethod
+    def decode_batch(cls, s: Buffer) -> Dict[str, Any]:
+        """Decode given buffer s of contiguous encoded frames of this message to numpy
+        columns, keyed by the dotted path of each base type field, e.g. "pose.yaw".
+        The column of an array field is of shape (N, capacity). Requires numpy.
+        """
+        from bitprotolib.batch import decode_batch
+
+        return decode_batch(cls.bp_batch_layout(), s)
+
+    @classmethod
+    def encode_batch(
+        cls,
+        data: Union[Mapping[str, Any], Iterable["MessageBase"]],
+        count: Optional[int] = None,
+    ) -> bytes:
+        """Encode a batch of messages to contiguous encoded frames in one vectorized
+        pass. Requires numpy.
+
+        :param data: Either a mapping of columns keyed by the dotted path of each base
+           type field, in the same format as decode_batch returns, or an iterable of
+           messages of this class. Fields missing from the columns are encoded as zero,
+           unknown columns and columns of different lengths raise ValueError.
+        :param count: The number of messages to encode, checked against the data if
+           given. Required for columns of a message without fields.
+        """
+        from bitprotolib.batch import encode_batch
+
+        return encode_batch(cls.bp_batch_layout(), data, count)
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Converts this message to a dict."""
+    def encode_into(self, s: Buffer, offset: int = 0) -> int:
+        """Encode this message into given writable buffer s starting at byte offset,
+        without allocating a new buffer. Buffer s can be any object supports the buffer
+        protocol, e.g. bytearray, memoryview and mmap. Only the bytes to write are
+        touched, the buffer doesn't have to be cleared before. Raises TypeError for
+        read-only buffers, and ValueError for negative offset.
+        Returns the number of bytes written.
+        """
+        if type(s) is bytearray:
+            return encode_message_at(self, s, offset)
+        with memoryview(s) as m, m.cast("B") as view:
+            if view.readonly:
+                raise TypeError("bitprotolib: buffer to encode into is read-only")
+            return encode_message_at(self, view, offset)
+
+    def encode_scratch(self) -> memoryview:
+        """Encode this message into the scratch buffer of this message class, and
+        returns a memoryview of it. The scratch buffer is allocated once on the first
+        call and then reused, so the returned view is only valid until next call on the
+        same class, copy it via bytes() to keep it. Not thread safe.
+        """
+        cls = type(self)
+        scratch = cls.__dict__.get("_bp_scratch", None)
+        if scratch is None:
+            scratch = memoryview(bytearray(self.BYTES_LENGTH))
+            setattr(cls, "_bp_scratch", scratch)
+        encode_message_at(self, scratch, 0)
+        return scratch
+
+    def decode_from(
+        self, s: Buffer, offset: int = 0, fields: Optional[Iterable[str]] = None
+    ) -> int:
+        """Decode this message from given buffer s starting at byte offset, without
+        copying. Buffer s can be any object supports the buffer protocol, e.g. bytes,
+        bytearray, memoryview and mmap.
+        If fields is given, only the fields of these dotted paths are decoded, see
+        bp_partial_plan. Raises ValueError for negative offset.
+        Returns the number of bytes consumed.
+        """
+        if type(s) is bytes or type(s) is bytearray:
+            return decode_message_at(self, s, offset, fields)
+        with memoryview(s) as m, m.cast("B") as view:
+            return decode_message_at(self, view, offset, fields)
+
+    @classmethod
+    def patch(
+        cls,
+        s: Buffer,
+        path: str,
+        value: Any,
+        offset: int = 0,
+        validate: bool = False,
+    ) -> None:
+        """Patch the field of given path in the encoded buffer s of this message
+        starting at byte offset to given value in place, without decoding and encoding
+        the message, only the bits of the field are rewritten.
+
+        :param path: Dotted path to a base type field, with array indexes, e.g.
+           "flight.pose.yaw" and "propellers[2].direction".
+        :param validate: Whether to check the value is in range of the field's bits,
+           raises ValueError if not. Otherwise it's truncated, like encoding.
+
+        Like decode_batch, assuming the buffer is encoded by current bitproto.
+        Raises ValueError for negative offset.
+        """
+        if offset < 0:
+            raise ValueError(f"bitprotolib: negative offset {offset}")
+        if len(s) - offset < cls.BYTES_LENGTH:
+            raise NotEnoughBytes()
+        i, nbits, flag = cls.bp_patch_target(path)
+        if validate:
+            if flag == FLAG_INT:
+                check_range(path, value, -(1 << (nbits - 1)), (1 << (nbits - 1)) - 1)
+            else:
+                check_range(path, value, 0, (1 << nbits) - 1)
+        i += offset << 3
+        if type(s) is bytearray:
+            patch_bits_at(s, i, nbits, int(value))
+        else:
+            with memoryview(s) as m, m.cast("B") as view:
+                patch_bits_at(view, i, nbits, int(value))
+
+    def to_dict(self, enum_names: bool = False) -> Dict[str, Any]:
+        """Converts this message to a dict.
+        Compiler generates this method for messages to walk the fields directly, with
+        enum values converted to their names if enum_names is true. Falls back to
+        dataclasses.asdict for classes generated by older compilers, where enum_names
+        is ignored.
+        """
         return asdict(self)
 
     def to_json(
-        self, indent: Optional[int] = None, separators: Optional[Tuple[str, str]] = None
+        self,
+        indent: Optional[int] = None,
+        separators: Optional[Tuple[str, str]] = None,
+        enum_names: bool = False,
     ) -> str:
-        """Dumps this message to a json string."""
-        return json.dumps(self.to_dict(), indent=indent, separators=separators)
+        """Dumps this message to a json string, see to_dict for enum_names."""
+        return json.dumps(
+            self.to_dict(enum_names), indent=indent, separators=separators
+        )
+
+    @classmethod
+    def from_dict(cls: Type[M], d: Mapping[str, Any], validate: bool = False) -> M:
+        """Constructs a message of this class from given dict, the inverse of to_dict.
+        Assuming compiler generates this method for messages, see check_range for
+        validate.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def from_json(cls: Type[M], s: Union[str, bytes], validate: bool = False) -> M:
+        """Loads a message of this class from given json string, see from_dict."""
+        return cls.from_dict(json.loads(s), validate)
+
+
+def check_range(name: str, v: Any, lo: int, hi: int) -> None:
+    """Checks value v of the field of given name is an integer in range [lo, hi], the
+    range of the bits of the field, raises ValueError otherwise.
+    Generated from_dict methods call this for validation.
+    """
+    if not (isinstance(v, int) and lo <= v <= hi):
+        raise ValueError(f"bitprotolib: {name} {v!r} out of range [{lo}, {hi}]")
+
+
+def check_array(
+    name: str,
+    v: Any,
+    shape: Tuple[int, ...],
+    lo: Optional[int] = None,
+    hi: Optional[int] = None,
+) -> None:
+    """Checks value v of the array field of given name is of given shape, and its
+    elements in range [lo, hi] if given, raises ValueError otherwise.
+    """
+    if len(v) != shape[0]:
+        raise ValueError(
+            f"bitprotolib: {name} requires {shape[0]} elements, got {len(v)}"
+        )
+    for x in v:
+        if len(shape) > 1:
+            check_array(name, x, shape[1:], lo, hi)
+        elif lo is not None and hi is not None:
+            check_range(name, x, lo, hi)
+
+
+@dataclass
+class BatchField:
+    """BatchField describes where a base type field locates in the encoded buffer of a
+    message, for batch encoding and decoding.
+
+    :param name: Dotted path to the field from the message, e.g. "flight.pose.yaw".
+    :param flag: Flag of the field's base type, e.g. FLAG_INT.
+    :param nbits: Number of bits the field occupy.
+    :param offset: The index of bit the field starts at in the encoded buffer. For
+       fields in arrays, it's the index of the first element.
+    :param shape: Capacities of the arrays along the path, empty if not in an array.
+    :param strides: Number of bits between adjacent elements of each array in shape.
+    """
+
+    name: str
+    flag: int
+    nbits: int
+    offset: int
+    shape: Tuple[int, ...] = ()
+    strides: Tuple[int, ...] = ()
+
+
+@dataclass
+class BatchAhead:
+    """BatchAhead describes where an extensible ahead flag locates in the encoded buffer
+    of a message, for batch encoding.
+
+    :param value: Value of the ahead flag, the nbits of an extensible message, or the
+       capacity of an extensible array.
+    :param offset: The index of bit the ahead flag starts at in the encoded buffer.
+    :param shape: Capacities of the arrays along the path, empty if not in an array.
+    :param strides: Number of bits between adjacent elements of each array in shape.
+    """
+
+    value: int
+    offset: int
+    shape: Tuple[int, ...] = ()
+    strides: Tuple[int, ...] = ()
+
+
+@dataclass
+class BatchLayout:
+    """BatchLayout describes the fixed bits layout of a message's encoded buffer.
+    Assuming compiler generates Message a method: bp_build_batch_layout to returns this.
+
+    :param nbytes: Number of bytes of an encoded message.
+    :param fields: List of the message's base type fields, including nested ones.
+    :param aheads: List of the extensible ahead flags in the message.
+    """
+
+    nbytes: int
+    fields: List[BatchField] = dataclass_field(default_factory=list)
+    aheads: List[BatchAhead] = dataclass_field(default_factory=list)
+
+
+# Matches array indexes in field paths to patch, e.g. "[2]".
+PATCH_INDEX_PATTERN = re.compile(r"\[(\d+)\]")
+
+
+def resolve_patch_target(cls: Any, path: str) -> Tuple[int, int, int]:
+    """Resolves given field path to patch of message class cls to the index of bit, the
+    number of bits and the flag of the field in the encoded buffer, see
+    MessageBase.patch.
+    """
+    name = PATCH_INDEX_PATTERN.sub("", path)
+    index = [int(k) for k in PATCH_INDEX_PATTERN.findall(path)]
+    for field in cls.bp_batch_layout().fields:
+        if field.name == name:
+            break
+    else:
+        raise ValueError(
+            f"bitprotolib: {cls.__qualname__} has no base type field {path}"
+        )
+    if len(index) != len(field.shape):
+        raise ValueError(f"bitprotolib: field {path} requires {len(field.shape)} index")
+    i = field.offset
+    for k, cap, stride in zip(index, field.shape, field.strides):
+        if k >= cap:
+            raise IndexError(f"bitprotolib: index {k} out of capacity {cap} in {path}")
+        i += k * stride
+    return i, field.nbits, field.flag
+
+
+def encode_message_at(message: MessageBase, s: Buffer, offset: int) -> int:
+    """Encode given message into buffer s of bytes starting at byte offset.
+    Returns the number of bytes written.
+    """
+    if offset < 0:
+        raise ValueError(f"bitprotolib: negative offset {offset}")
+    if len(s) - offset < message.BYTES_LENGTH:
+        raise NotEnoughBytes()
+    ctx = ProcessContext(True, s, offset << 3)
+    message.bp_plan().process(ctx, message)
+    return ((ctx.i + 7) >> 3) - offset
+
+
+def decode_message_at(
+    message: MessageBase,
+    s: Buffer,
+    offset: int,
+    fields: Optional[Iterable[str]] = None,
+) -> int:
+    """Decode given message from buffer s of bytes starting at byte offset.
+    If fields is given, only the fields of these dotted paths are decoded.
+    Returns the number of bytes consumed.
+    """
+    if offset < 0:
+        raise ValueError(f"bitprotolib: negative offset {offset}")
+    if len(s) - offset < message.BYTES_LENGTH:
+        raise NotEnoughBytes()
+    if fields is None:
+        plan = message.bp_plan()
+    else:
+        plan = message.bp_partial_plan(fields)
+    # Tries the generated decoder first, without a context.
+    if plan.decoder is not None and plan.decoder(message, s, offset):
+        return (plan.nbits + 7) >> 3
+    ctx = ProcessContext(False, s, offset << 3)
+    plan.decode(ctx, message)
+    return ((ctx.i + 7) >> 3) - offset
+
+
+class LayoutMismatch(Error):
+    """The layout of given buffer differs from the view, i.e. extensible aheads differ
+    since the message is encoded by another version of bitproto."""
+
+
+V = TypeVar("V", bound="MessageView")
+
+
+class MessageView:
+    """MessageView is the base class for generated read-only views of messages.
+    Assuming compiler generates a view class {Message}View for each message.
+
+    A view wraps a buffer of an encoded message and decodes a field only when its
+    attribute is accessed, by the bit offsets of fields precomputed by the compiler.
+    Nested messages and arrays are returned as views on the same buffer, no bytes are
+    copied. The bit offsets assume the message is encoded by current bitproto, so
+    extensible aheads are checked on construction.
+
+    :param s: The buffer of an encoded message, any object supports the buffer protocol.
+    :param offset: The byte offset the message starts at in buffer s.
+    Raises LayoutMismatch if any extensible ahead in the buffer differs, such messages
+    should be decoded via decode_from instead.
+    """
+
+    __slots__ = ("bp_s", "bp_i")
+
+    # The message class to view.
+    BP_MESSAGE: ClassVar[Type[MessageBase]]
+    # Extensible aheads in the message as tuples (offset, value), including nested.
+    BP_AHEADS: ClassVar[Tuple[Tuple[int, int], ...]] = ()
+
+    def __init__(self, s: Buffer, offset: int = 0) -> None:
+        if len(s) - offset < self.BP_MESSAGE.BYTES_LENGTH:
+            raise NotEnoughBytes()
+        self.bp_s = s
+        self.bp_i = offset << 3
+        for o, value in self.BP_AHEADS:
+            if read_bits_at(s, self.bp_i + o, 16) != value:
+                raise LayoutMismatch()
+
+    @classmethod
+    def bp_at(cls: Type[V], s: Buffer, i: int) -> V:
+        """Returns a view of the message starting at bit index i of buffer s, without
+        checking. Used for nested messages of a view.
+        """
+        view = cls.__new__(cls)
+        view.bp_s = s
+        view.bp_i = i
+        return view
+
+    def bp_uint(self, offset: int, nbits: int) -> int:
+        return read_bits_at(self.bp_s, self.bp_i + offset, nbits)
+
+    def bp_int(self, offset: int, nbits: int) -> int:
+        v = read_bits_at(self.bp_s, self.bp_i + offset, nbits)
+        return v - (1 << nbits) if v >> (nbits - 1) else v
+
+    def bp_bool(self, offset: int) -> bool:
+        return read_bits_at(self.bp_s, self.bp_i + offset, 1) == 1
+
+    def decode(self) -> MessageBase:
+        """Decodes the whole message viewed."""
+        message = self.BP_MESSAGE()
+        ctx = ProcessContext(False, self.bp_s, self.bp_i)
+        message.bp_plan().process(ctx, message)
+        return message
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__qualname__} at bit {self.bp_i}>"
+
+
+@lru_cache(maxsize=None)
+def reader(flag: int, nbits: int) -> Callable[[Buffer, int], Any]:
+    """Returns a function reading a value of given base type flag and number of nbits
+    from a buffer at a bit index, for elements of array views.
+    """
+    if flag == FLAG_BOOL:
+        return lambda s, i: read_bits_at(s, i, 1) == 1
+    if flag == FLAG_INT:
+        sign, delta = 1 << (nbits - 1), 1 << nbits
+
+        def read_int(s: Buffer, i: int) -> int:
+            v = read_bits_at(s, i, nbits)
+            return v - delta if v >= sign else v
+
+        return read_int
+    return lambda s, i: read_bits_at(s, i, nbits)
+
+
+class ArrayView:
+    """ArrayView is a read-only view of an array in a buffer, elements are read on
+    access. Indexing by a slice returns a list.
+
+    :param s: The buffer.
+    :param i: The index of bit the first element starts at.
+    :param capacity: Capacity of the array.
+    :param stride: Number of bits of an element.
+    :param read: Function to read an element from (s, i).
+    """
+
+    __slots__ = ("s", "i", "capacity", "stride", "read")
+
+    def __init__(
+        self,
+        s: Buffer,
+        i: int,
+        capacity: int,
+        stride: int,
+        read: Callable[[Buffer, int], Any],
+    ) -> None:
+        self.s = s
+        self.i = i
+        self.capacity = capacity
+        self.stride = stride
+        self.read = read
+
+    def __len__(self) -> int:
+        return self.capacity
+
+    @overload
+    def __getitem__(self, k: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, k: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, k: Union[int, slice]) -> Any:
+        if isinstance(k, slice):
+            return [self[j] for j in range(*k.indices(self.capacity))]
+        if k < 0:
+            k += self.capacity
+        if not 0 <= k < self.capacity:
+            raise IndexError("bitprotolib: array view index out of range")
+        return self.read(self.s, self.i + k * self.stride)
+
+    def __iter__(self) -> Iterator[Any]:
+        for k in range(self.capacity):
+            yield self.read(self.s, self.i + k * self.stride)
+
+    def tolist(self) -> List[Any]:
+        """Returns the elements as a list."""
+        return list(self)
 
 
 class Processor:
     """Processor is the abstraction type the able to process encoding and decoding."""
 
+    __slots__ = ()
+
     @abstractmethod
     def flag(self) -> int:
         raise NotImplementedError
@@ -202,6 +823,7 @@ class Processor:
         raise NotImplementedError
 
 
+@add_slots
 @dataclass
 class Bool(Processor):
     """Bool implements Processor for bool type."""
@@ -213,6 +835,7 @@ class Bool(Processor):
         process_base_type(1, ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class Int(Processor):
     """Int implements Processor for int type.
@@ -229,6 +852,7 @@ class Int(Processor):
         process_base_type(self.nbits, ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class Uint(Processor):
     """Uint implements Processor for uint type.
@@ -245,6 +869,7 @@ class Uint(Processor):
         process_base_type(self.nbits, ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class Byte(Processor):
     """Byte implements Processor for byte type."""
@@ -256,6 +881,7 @@ class Byte(Processor):
         process_base_type(8, ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class Array(Processor):
     """Array implements Processor for array type.
@@ -273,45 +899,44 @@ class Array(Processor):
         return FLAG_ARRAY
 
     def process(self, ctx: ProcessContext, di: DataIndexer, accessor: Accessor) -> None:
-        with di.index_stack_maintain():
-            # Record current number of bits processed.
-            i = ctx.i
-            # Opponent array capacity if extensible set.
-            ahead = 0
-
-            if self.extensible:
-                if ctx.is_encode:
-                    # Encode extensible ahead  if extensible.
-                    self.encode_extensible_ahead(ctx)
-                else:
-                    # Decode extensible ahead  if extensible.
-                    ahead = self.decode_extensible_ahead(ctx)
-
-            # Process array elements.
-            for k in range(self.capacity):
-                di.index_stack_replace(k)
-                self.element_processor.process(ctx, di, accessor)
-
-            # Skip redundant bits post decoding.
-            if self.extensible and not ctx.is_encode:
-                ito = i + ahead * self.capacity
-                if ito >= ctx.i:
-                    ctx.i = ito
+        di.index_stack_up()
+
+        # Record current number of bits processed.
+        i = ctx.i
+        # Opponent array capacity if extensible set.
+        ahead = 0
+
+        if self.extensible:
+            if ctx.is_encode:
+                # Encode extensible ahead  if extensible.
+                self.encode_extensible_ahead(ctx)
+            else:
+                # Decode extensible ahead  if extensible.
+                ahead = self.decode_extensible_ahead(ctx)
+
+        # Process array elements.
+        for k in range(self.capacity):
+            di.index_stack_replace(k)
+            self.element_processor.process(ctx, di, accessor)
+
+        # Skip redundant bits post decoding.
+        if self.extensible and not ctx.is_encode:
+            ito = i + ahead * self.capacity
+            if ito >= ctx.i:
+                ctx.i = ito
+
+        di.index_stack_down()
 
     def encode_extensible_ahead(self, ctx: ProcessContext) -> None:
         """Encode the array capacity as the ahead flag to current bit encoding stream."""
-        accessor = IntAccessor(data=self.capacity)
-        di = DataIndexer(field_number=1)
-        process_base_type(16, ctx, di, accessor)
+        write_bits(ctx, 16, self.capacity)
 
     def decode_extensible_ahead(Self, ctx: ProcessContext) -> int:
         """Decode the ahead flag as the array capacity from current decoding stream."""
-        accessor = IntAccessor()
-        di = DataIndexer(field_number=1)
-        process_base_type(16, ctx, di, accessor)
-        return accessor.data
+        return read_bits(ctx, 16)
 
 
+@add_slots
 @dataclass
 class EnumProcessor(Processor):
     """Enum implements Processor for enum type.
@@ -330,6 +955,7 @@ class EnumProcessor(Processor):
         self.ut.process(ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class AliasProcessor(Processor):
     """Alias implements Processor for alias type.
@@ -347,6 +973,7 @@ class AliasProcessor(Processor):
         self.to.process(ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class MessageFieldProcessor(Processor):
     """MessageFieldProcessor implements Processor for message field.
@@ -362,16 +989,16 @@ class MessageFieldProcessor(Processor):
         return FLAG_MESSAGE_FIELD
 
     def process(self, ctx: ProcessContext, di: DataIndexer, accessor: Accessor) -> None:
-        # Ignore data indexer passed in, because accessor is rewrite.
         # Rewrite data indexer's fieldNumber.
-        di = DataIndexer(field_number=self.field_number)
+        di.field_number = self.field_number
         self.type_processor.process(ctx, di, accessor)
 
 
+@add_slots
 @dataclass
 class MessageProcessor(Processor):
     """MessageProcessor implements Processor for message.
-    Assuming compiler generates Message a method: bp_processor to returns this.
+    Assuming compiler generates Message a method: bp_build_processor to returns this.
 
     :param field_processors:  List of message field's processors.
     """
@@ -384,15 +1011,32 @@ class MessageProcessor(Processor):
         return FLAG_MESSAGE
 
     def process(self, ctx: ProcessContext, di: DataIndexer, accessor: Accessor) -> None:
-        if di.is_valid():
+        if not di.is_valid():
             # Invalid DataIndexer NIL_DATA_INDEXER is passed in right after this message
             # is asked to process, indicates this message is the top level message on the
-            # processing chain. The di will be dropped (or overwritten) by the
-            # MessageFieldProcessor of this message and never be NIL_DATA_INDEXER again.
-            #
-            # Rewrite accessor if this message processor is called from a upper accessor.
-            accessor = accessor.bp_get_accessor(di)
-
+            # processing chain, which only the encode and decode methods generated by
+            # older compilers do. Runs the plan of the message class instead, built from
+            # this processor tree on the first call.
+            cls = cast(Type[MessageBase], type(accessor))
+            plan = cls.__dict__.get("_bp_plan", None)
+            if plan is None:
+                plan = cls.bp_build_plan(self)
+            plan.process(ctx, accessor)
+            return
+
+        # Rewrite accessor if this message processor is called from a upper accessor.
+        accessor = accessor.bp_get_accessor(di)
+
+        # Fields of this message index data from the new accessor, starting with an
+        # empty array index stack. Restores the upper message's indexing after.
+        field_number, base = di.field_number, di.base
+        di.base = di.top
+        self.process_fields(ctx, di, accessor)
+        di.field_number, di.base = field_number, base
+
+    def process_fields(
+        self, ctx: ProcessContext, di: DataIndexer, accessor: Accessor
+    ) -> None:
         # Record current number of bits processed.
         i = ctx.i
         # Opponent message nbits if extensible set.
@@ -418,109 +1062,377 @@ class MessageProcessor(Processor):
 
     def encode_extensible_ahead(self, ctx: ProcessContext) -> None:
         """Encode the message nbits as the ahead flag to current bit encoding stream."""
-        accessor = IntAccessor(data=self.nbits)
-        di = DataIndexer(field_number=1)
-        process_base_type(16, ctx, di, accessor)
+        write_bits(ctx, 16, self.nbits)
 
     def decode_extensible_ahead(self, ctx: ProcessContext) -> int:
         """Decode the message ahead flag as the nbits from current bit decoding stream."""
-        accessor = IntAccessor()
-        di = DataIndexer(field_number=1)
-        process_base_type(16, ctx, di, accessor)
-        return accessor.data
+        return read_bits(ctx, 16)
+
+
+def write_bits_at(s: Buffer, i: int, nbits: int, data: int) -> None:
+    """Encode number of nbits of given data to buffer s at bit index i. The data is
+    copied onto the bytes it spans in buffer s.
+
+    Encoding goes sequentially, the bits before i on the first byte are kept, and all
+    bits after the data on the last byte are cleared, they are either overwritten by
+    following data or left as zero paddings. So the buffer s doesn't have to be
+    cleared before encoding.
+    Raises IndexError if the bits are out of buffer s, like the C accelerator.
+    """
+    if i < 0 or (i + nbits + 7) >> 3 > len(s):
+        raise IndexError("bitprotolib: buffer index out of range")
+    data &= (1 << nbits) - 1
+    start = i >> 3
+    shift = i & 7
+
+    if shift > 0:
+        # Partially aligned, keeps the bits already encoded on the first byte.
+        data = (data << shift) | (s[start] & ((1 << shift) - 1))
+
+    if shift + nbits <= 8:
+        # Fits in current byte.
+        s[start] = data
+    else:
+        end = (i + nbits + 7) >> 3
+        s[start:end] = data.to_bytes(end - start, "little")
+
+
+def read_bits_at(s: Buffer, i: int, nbits: int) -> int:
+    """Decode number of nbits from buffer s at bit index i as an unsigned integer.
+    The bytes spanned in buffer s are read as a single integer.
+    Raises IndexError if the bits are out of buffer s, like the C accelerator.
+    """
+    if i < 0 or (i + nbits + 7) >> 3 > len(s):
+        raise IndexError("bitprotolib: buffer index out of range")
+    start = i >> 3
+    shift = i & 7
+
+    if shift + nbits <= 8:
+        # Fits in current byte.
+        data = s[start] >> shift
+    else:
+        end = (i + nbits + 7) >> 3
+        data = int.from_bytes(s[start:end], "little") >> shift
+    return data & ((1 << nbits) - 1)
 
 
-def smart_shift(n: byte, k: int) -> byte:
-    """Shifts given byte n by k bits.
-    If k is larger than 0, performs a right shift, otherwise left.
+def patch_bits_at(s: Buffer, i: int, nbits: int, data: int) -> None:
+    """Patch number of nbits of given data to buffer s at bit index i in place.
+    Unlike write_bits_at, the bits around the data on the bytes it spans are kept, they
+    are masked like the compiler's op_mode_get_mask, i.e. (1 << (k + c)) - (1 << k) for
+    c bits starting at bit k.
     """
-    if k > 0:
-        return n >> k
-    elif k < 0:
-        return n << (0 - k)
-    return n
+    start = i >> 3
+    shift = i & 7
+    mask = ((1 << nbits) - 1) << shift
+    data = (data << shift) & mask
+
+    if shift + nbits <= 8:
+        # Fits in current byte.
+        s[start] = (s[start] & ~mask) | data
+    else:
+        end = (i + nbits + 7) >> 3
+        old = int.from_bytes(s[start:end], "little")
+        s[start:end] = ((old & ~mask) | data).to_bytes(end - start, "little")
 
 
-def get_mask(k: int, c: int) -> int:
-    """Returns the mask value to copy bits inside a single byte.
+# Whether to use the C accelerator. Set environment variable BITPROTOLIB_NO_SPEEDUPS
+# to a non-empty value to use pure Python even if it's built.
+USE_SPEEDUPS = not os.environ.get("BITPROTOLIB_NO_SPEEDUPS")
 
-    :param k: The start bit index in the byte.
-    :param c: The number of bits to copy.
+# Replaces the bits functions above with the C accelerator, if it's built.
+if USE_SPEEDUPS:
+    try:
+        from bitprotolib._speedups import read_bits_at, write_bits_at  # type: ignore
+    except ImportError:  # pragma: no cover
+        USE_SPEEDUPS = False
 
-    Examples of returned mask:
 
-        Returns                Arguments
-        00001111               k=0, c=4
-        01111100               k=2, c=5
-        00111100               k=2, c=4
+def write_bits(ctx: ProcessContext, nbits: int, data: int) -> None:
+    """Encode number of nbits of given data to buffer s at bit index ctx.i, and then
+    moves ctx.i forward.
     """
-    if k == 0:
-        return (1 << c) - 1
-    return (1 << ((k + 1 + c) - 1)) - (1 << ((k + 1) - 1))
+    write_bits_at(ctx.s, ctx.i, nbits, data)
+    ctx.i += nbits
 
 
-def get_nbits_to_copy(i: int, j: int, n: int) -> int:
-    """Returns the number of bits to copy during a single byte process.
-    :param i: the number of the total bits processed.
-    :param j: the number of bits processed on current base type.
-    :param n: the number of bits current base type occupy.
+def read_bits(ctx: ProcessContext, nbits: int) -> int:
+    """Decode number of nbits from buffer s at bit index ctx.i as an unsigned integer,
+    and then moves ctx.i forward.
     """
-    return min(n - j, 8 - (j % 8), 8 - (i % 8))
+    data = read_bits_at(ctx.s, ctx.i, nbits)
+    ctx.i += nbits
+    return data
 
 
-def encode_single_byte(
-    ctx: ProcessContext, di: DataIndexer, accessor: Accessor, j: int, c: int
-) -> None:
-    """Encode number of c bits from data to given buffer s.
-    Where the data is lookedup by data indexer di from data container accessor.
-    And the buffer s is given in ProcessContext ctx.
-    """
-    # Number of bits to shift right to obtain byte from accessor.
-    rshift = int(j / 8) * 8
-    b = accessor.bp_get_byte(di, rshift)
-    shift = (j % 8) - (ctx.i % 8)
-    mask = get_mask(ctx.i % 8, c)
-    # Shift and then take mask to get bits to copy.
-    d = smart_shift(b, shift) & mask
-    # Copy bits to buffer s.
-    ctx.s[int(ctx.i / 8)] |= d
-
-
-def decode_single_byte(
-    ctx: ProcessContext, di: DataIndexer, accessor: Accessor, j: int, c: int
-) -> None:
-    """Decode number of c bits from buffer s to target data.
-    Where the data is lookedup by data indexer di from data container accessor.
-    And the buffer s is given in ProcessContext ctx.
-    Byte decoding is finally done by accessor's generated function bp_set_byte.
-    """
-    b = ctx.s[int(ctx.i / 8)]
-    shift = (ctx.i % 8) - (j % 8)
-    mask = get_mask(j % 8, c)
-    # Shift and then take mask to get bits to copy.
-    d = smart_shift(b, shift) & mask
-    # Number of bits to shift left to set byte to accessor.
-    lshift = int(j / 8) * 8
-    accessor.bp_set_byte(di, lshift, d)
-
-
-def process_single_byte(
-    ctx: ProcessContext, di: DataIndexer, accessor: Accessor, j: int, c: int
+def process_base_type(
+    nbits: int, ctx: ProcessContext, di: DataIndexer, accessor: Accessor
 ) -> None:
-    """Dispatch process to encode_single_byte and decode_single_byte."""
+    """Process encoding and decoding on a base type.
+    Bits are copied in batch, like the batch branches of BpCopyBufferBits in the C
+    library. The data is lookedup by data indexer di from data container accessor as a
+    whole value.
+    """
     if ctx.is_encode:
-        encode_single_byte(ctx, di, accessor, j, c)
+        write_bits(ctx, nbits, accessor.bp_get_value(di))
     else:
-        decode_single_byte(ctx, di, accessor, j, c)
+        accessor.bp_set_value(di, read_bits(ctx, nbits))
 
 
-def process_base_type(
-    nbits: int, ctx: ProcessContext, di: DataIndexer, accessor: Accessor
-) -> None:
-    """Process encoding and decoding on a base type."""
-    j: int = 0
-    while j < nbits:
-        c = get_nbits_to_copy(ctx.i, j, nbits)
-        process_single_byte(ctx, di, accessor, j, c)
-        ctx.i += c
-        j += c
+# Opcodes of plan steps.
+OP_VALUE: int = 1
+OP_MESSAGE: int = 2
+OP_AHEAD: int = 3
+OP_SKIP: int = 4
+
+
+@add_slots
+@dataclass
+class Plan:
+    """Plan is the flattened processor tree of a message, a linear list of steps to
+    execute in a loop, instead of walking the processor tree recursively on every
+    encoding and decoding. Arrays, enums and aliases are unrolled, nested messages are
+    sub plans.
+    Assuming MessageBase.bp_plan builds this from the message's processor once.
+
+    Steps are tuples leading by an opcode, bit offsets in steps are relative to the
+    start of the message:
+
+    * (OP_VALUE, di, offset, nbits): A base type value, lookedup by di from accessor.
+    * (OP_MESSAGE, di, offset, plan): A nested message, its accessor is lookedup by
+      di from accessor.
+    * (OP_AHEAD, offset, value, scale): The ahead flag of an extensible message or
+      array. On decoding, the enclosing message or array ends at the bit index of this
+      ahead plus the decoded value times scale, if that's further than the offset of
+      the paired OP_SKIP.
+    * (OP_SKIP, offset): End of an extensible message or array.
+
+    Bits skipped by OP_SKIP on decoding shift all offsets after, this is tracked as a
+    delta at runtime.
+
+    A plan of a top level message may also have an encoder and a decoder, generated
+    straight-line functions by bitprotolib.codegen or the struct codecs by compiler,
+    which take arguments (accessor, s, byte offset), and return False to fall back to
+    the steps.
+
+    :param nbits: Number of bits of the message, including aheads.
+    :param steps: List of steps in encoding order.
+    :param encoder: Optional generated encoding function.
+    :param decoder: Optional generated decoding function.
+    """
+
+    nbits: int
+    steps: List[Tuple[Any, ...]] = dataclass_field(default_factory=list)
+    encoder: Optional[Codec] = None
+    decoder: Optional[Codec] = None
+
+    def process(self, ctx: ProcessContext, accessor: Accessor) -> None:
+        """Process encoding or decoding on given accessor, starting at bit index ctx.i,
+        and then moves ctx.i to the end of the message.
+        The generated functions are used if ctx.i is at a byte boundary.
+        """
+        if ctx.is_encode:
+            if (
+                self.encoder
+                and not ctx.i & 7
+                and self.encoder(accessor, ctx.s, ctx.i >> 3)
+            ):
+                ctx.i += self.nbits
+            else:
+                self.encode(ctx, accessor)
+        else:
+            if (
+                self.decoder
+                and not ctx.i & 7
+                and self.decoder(accessor, ctx.s, ctx.i >> 3)
+            ):
+                ctx.i += self.nbits
+            else:
+                self.decode(ctx, accessor)
+
+    def encode(self, ctx: ProcessContext, accessor: Accessor) -> None:
+        s = ctx.s
+        start = ctx.i
+
+        for step in self.steps:
+            op = step[0]
+            if op == OP_VALUE:
+                _, di, offset, nbits = step
+                write_bits_at(s, start + offset, nbits, accessor.bp_get_value(di))
+            elif op == OP_MESSAGE:
+                _, di, offset, plan = step
+                ctx.i = start + offset
+                plan.encode(ctx, accessor.bp_get_accessor(di))
+            elif op == OP_AHEAD:
+                write_bits_at(s, start + step[1], 16, step[2])
+
+        ctx.i = start + self.nbits
+
+    def decode(self, ctx: ProcessContext, accessor: Accessor) -> None:
+        s = ctx.s
+        start = ctx.i
+        # Number of bits skipped so far.
+        delta = 0
+        # Stack of the bit indexes to skip to, by decoded aheads.
+        itos: List[int] = []
+
+        for step in self.steps:
+            op = step[0]
+            if op == OP_VALUE:
+                _, di, offset, nbits = step
+                v = read_bits_at(s, start + delta + offset, nbits)
+                accessor.bp_set_value(di, v)
+            elif op == OP_MESSAGE:
+                _, di, offset, plan = step
+                ctx.i = start + delta + offset
+                plan.decode(ctx, accessor.bp_get_accessor(di))
+                delta = ctx.i - start - offset - plan.nbits
+            elif op == OP_AHEAD:
+                _, offset, _, scale = step
+                i = start + delta + offset
+                itos.append(i + read_bits_at(s, i, 16) * scale)
+            else:
+                i = start + delta + step[1]
+                ito = itos.pop()
+                if ito >= i:
+                    delta += ito - i
+
+        ctx.i = start + delta + self.nbits
+
+
+def build_plan(processor: MessageProcessor) -> Plan:
+    """Flattens given message processor tree to a plan."""
+    steps: List[Tuple[Any, ...]] = []
+    offset = 0
+
+    if processor.extensible:
+        steps.append((OP_AHEAD, offset, processor.nbits, 1))
+        offset += 16
+
+    for field_processor in processor.field_processors:
+        fp = cast(MessageFieldProcessor, field_processor)
+        offset = build_plan_steps(steps, fp.type_processor, fp.field_number, [], offset)
+
+    if processor.extensible:
+        steps.append((OP_SKIP, offset))
+    return Plan(offset, steps)
+
+
+def build_plan_steps(
+    steps: List[Tuple[Any, ...]],
+    processor: Processor,
+    field_number: int,
+    indexes: List[int],
+    offset: int,
+) -> int:
+    """Appends the steps of given type processor to steps, where the data locates at
+    given field number and array indexes, and the bits start at given offset.
+    Returns the offset of the bits after.
+    """
+    flag = processor.flag()
+
+    if flag == FLAG_ALIAS:
+        to = cast(AliasProcessor, processor).to
+        return build_plan_steps(steps, to, field_number, indexes, offset)
+
+    if flag == FLAG_ENUM:
+        ut = cast(EnumProcessor, processor).ut
+        return build_plan_steps(steps, ut, field_number, indexes, offset)
+
+    if flag == FLAG_ARRAY:
+        array = cast(Array, processor)
+        if array.extensible:
+            steps.append((OP_AHEAD, offset, array.capacity, array.capacity))
+            offset += 16
+        for k in range(array.capacity):
+            offset = build_plan_steps(
+                steps, array.element_processor, field_number, indexes + [k], offset
+            )
+        if array.extensible:
+            steps.append((OP_SKIP, offset))
+        return offset
+
+    di = DataIndexer(field_number, list(indexes), 0, len(indexes))
+
+    if flag == FLAG_MESSAGE:
+        plan = build_plan(cast(MessageProcessor, processor))
+        steps.append((OP_MESSAGE, di, offset, plan))
+        return offset + plan.nbits
+
+    if flag == FLAG_BOOL:
+        nbits = 1
+    elif flag == FLAG_BYTE:
+        nbits = 8
+    else:
+        nbits = cast(Union[Int, Uint], processor).nbits
+    steps.append((OP_VALUE, di, offset, nbits))
+    return offset + nbits
+
+
+def parse_field_paths(paths: Iterable[str]) -> Dict[str, Any]:
+    """Parses given dotted field paths to a tree of dicts keyed by field names, where
+    selected fields map to None, e.g. {"status": None, "power": {"battery": None}}.
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        *parents, name = path.split(".")
+        for parent in parents:
+            child = node.setdefault(parent, {})
+            if child is None:
+                # The whole parent is selected.
+                break
+            node = child
+        else:
+            node[name] = None
+    return tree
+
+
+def reduce_plan(plan: Plan, cls: Any, tree: Dict[str, Any]) -> Plan:
+    """Reduces given plan of message class cls to a plan decoding only the fields in
+    given tree, see parse_field_paths. Steps of other fields are dropped, so their bits
+    are skipped, except aheads which may shift the fields after. Nested messages not
+    selected as a whole are reduced recursively, the sub selection applies to every
+    message of an array.
+    """
+    # Field number => sub tree, and the message class of the field if sub tree is set.
+    selection: Dict[int, Tuple[Optional[Dict[str, Any]], Any]] = {}
+
+    if tree:
+        sample = cls()
+        processor = cast(MessageProcessor, cls.bp_processor())
+        numbers = {
+            field.name: cast(MessageFieldProcessor, fp).field_number
+            for field, fp in zip(dataclass_fields(sample), processor.field_processors)
+        }
+        for name, subtree in tree.items():
+            if name not in numbers:
+                raise ValueError(f"bitprotolib: {cls.__qualname__} has no field {name}")
+            field_cls = None
+            if subtree is not None:
+                value = getattr(sample, name)
+                while isinstance(value, list):
+                    value = value[0]
+                if not isinstance(value, MessageBase):
+                    raise ValueError(f"bitprotolib: field {name} is not a message")
+                field_cls = type(value)
+            selection[numbers[name]] = (subtree, field_cls)
+
+    steps: List[Tuple[Any, ...]] = []
+    for step in plan.steps:
+        op = step[0]
+        if op == OP_VALUE:
+            if step[1].field_number in selection:
+                steps.append(step)
+        elif op == OP_MESSAGE:
+            _, di, offset, sub_plan = step
+            subtree, field_cls = selection.get(di.field_number, ({}, None))
+            if subtree is None:
+                steps.append(step)
+                continue
+            sub_plan = reduce_plan(sub_plan, field_cls, subtree)
+            if sub_plan.steps:
+                steps.append((OP_MESSAGE, di, offset, sub_plan))
+        else:
+            steps.append(step)
+    return Plan(plan.nbits, steps)
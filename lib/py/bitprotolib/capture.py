@@ -0,0 +1,158 @@
+"""
+bitprotolib.capture
+~~~~~~~~~~~~~~~~~~~
+
+Random access to capture files of contiguous encoded frames of a message.
+
+Frames are of fixed size, the BYTES_LENGTH of the message class, so frame k locates at
+byte offset k * BYTES_LENGTH. A capture file is memory mapped instead of read into
+memory, and frames are decoded on demand, only the pages touched are loaded by the
+operating system.
+"""
+
+import mmap
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from bitprotolib.bp import Buffer, MessageBase
+
+M = TypeVar("M", bound=MessageBase)
+
+# Default number of frames per batch in iter_batches.
+DEFAULT_BATCH_FRAMES = 64 * 1024
+
+
+class Frames(Generic[M]):
+    """Frames is a lazy sequence of the frames of a message class in a buffer, supports
+    len(), indexing, slicing and iteration. Frames are decoded on access, slicing
+    returns another Frames on the same buffer without decoding or copying.
+
+    :param message_class: The message class to decode frames to.
+    :param s: The buffer of contiguous encoded frames, trailing bytes of an
+       incomplete frame are ignored.
+    :param indices: Indices of the frames in this sequence, defaults to all.
+    """
+
+    def __init__(
+        self, message_class: Type[M], s: Buffer, indices: Optional[range] = None
+    ) -> None:
+        self.message_class = message_class
+        self.frame_size = message_class.BYTES_LENGTH
+        if self.frame_size <= 0:
+            raise ValueError("bitprotolib: can't index frames of empty message")
+        self.s = s
+        if indices is None:
+            indices = range(len(s) // self.frame_size)
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    @overload
+    def __getitem__(self, key: int) -> M:
+        ...
+
+    @overload
+    def __getitem__(self, key: slice) -> "Frames[M]":
+        ...
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[M, "Frames[M]"]:
+        if isinstance(key, slice):
+            return Frames(self.message_class, self.s, self.indices[key])
+        return self.decode(self.indices[key])
+
+    def __iter__(self) -> Iterator[M]:
+        for k in self.indices:
+            yield self.decode(k)
+
+    def decode(self, k: int) -> M:
+        """Decodes the frame at given index k of the buffer."""
+        message = self.message_class()
+        message.decode_from(self.s, k * self.frame_size)
+        return message
+
+    def raw(self, k: int) -> memoryview:
+        """Returns a memoryview of the encoded bytes of the frame at index k of this
+        sequence, without decoding.
+        """
+        offset = self.indices[k] * self.frame_size
+        return memoryview(self.s)[offset : offset + self.frame_size]
+
+    def iter_batches(
+        self, batch_frames: int = DEFAULT_BATCH_FRAMES
+    ) -> Iterator[Dict[str, Any]]:
+        """Decodes the frames to numpy columns in batches of at most number of
+        batch_frames, yields the columns of each batch, see MessageBase.decode_batch.
+        Scanning a large file in batches bounds the memory of the columns.
+        Requires numpy.
+        """
+        for k in range(0, len(self.indices), batch_frames):
+            yield self[k : k + batch_frames].decode_batch()
+
+    def decode_batch(self) -> Dict[str, Any]:
+        """Decodes all the frames to numpy columns, see MessageBase.decode_batch.
+        Requires numpy.
+        """
+        if self.indices.step == 1:
+            start = self.indices.start * self.frame_size
+            stop = start + len(self.indices) * self.frame_size
+            with memoryview(self.s) as view:
+                return self.message_class.decode_batch(view[start:stop])
+        # Gathers the frames of a stepped slice to a contiguous buffer.
+        return self.message_class.decode_batch(
+            b"".join(map(self.raw, range(len(self))))
+        )
+
+
+class CaptureFile(Frames[M]):
+    """CaptureFile memory maps a capture file of contiguous encoded frames of a message
+    class for read, as a Frames sequence.
+
+    :param message_class: The message class to decode frames to.
+    :param path: Path to the capture file.
+
+    Example::
+
+        with CaptureFile(Drone, "flight.bin") as capture:
+            print(len(capture), capture[-1])
+            for columns in capture[1000:].iter_batches():
+                print(columns["status"].mean())
+
+    Messages decoded stay valid after close, raw views must be released before.
+    """
+
+    def __init__(self, message_class: Type[M], path: str) -> None:
+        self.file = open(path, "rb")
+        self.mmap: Optional[mmap.mmap] = None
+        s: Buffer = b""
+        try:
+            # Zero size file can't be mapped.
+            if self.file.seek(0, 2) > 0:
+                self.mmap = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+                s = self.mmap
+            super().__init__(message_class, s)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Unmaps and closes the capture file."""
+        if self.mmap is not None:
+            self.mmap.close()
+            self.mmap = None
+        self.file.close()
+
+    def __enter__(self) -> "CaptureFile[M]":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
@@ -0,0 +1,345 @@
+"""
+bitprotolib.codegen
+~~~~~~~~~~~~~~~~~~~
+
+Runtime code generation of straight-line encoding and decoding functions.
+
+The processor tree of a message is unrolled into Python source at runtime, like what
+the compiler generates in optimization mode, and then compiled with exec. The whole
+message is processed as a single integer: encoding ors every field shifted to its bit
+offset, and decoding shifts and masks every field out of it.
+
+Field names are not in the processor tree, they are taken from the dataclass fields of
+the message class, which the compiler generates in the same order as field processors.
+
+If the C accelerator bitprotolib._speedups is built and not disabled, see
+bp.USE_SPEEDUPS, the generated functions only collect and assign the values, the bits
+are processed by its pack and unpack functions with a layout of the values.
+
+Decoders of partial plans are generated the same way, with only the values of the
+selected fields.
+"""
+
+import struct
+from dataclasses import fields as dataclass_fields
+from dataclasses import is_dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+
+from bitprotolib.bp import (
+    FLAG_ALIAS,
+    FLAG_ARRAY,
+    FLAG_BOOL,
+    FLAG_BYTE,
+    FLAG_ENUM,
+    FLAG_INT,
+    FLAG_MESSAGE,
+    FLAG_UINT,
+    USE_SPEEDUPS,
+    AliasProcessor,
+    Array,
+    Codec,
+    EnumProcessor,
+    MessageBase,
+    MessageFieldProcessor,
+    MessageProcessor,
+    Processor,
+)
+
+if USE_SPEEDUPS:
+    from bitprotolib._speedups import pack, unpack  # type: ignore
+else:
+    pack = unpack = None
+
+# Maximum number of terms in a single expression, long expressions overflow the stack
+# of Python's compiler.
+MAX_TERMS_PER_EXPRESSION = 32
+
+
+class Unsupported(Exception):
+    """Raised if the message can't be processed by straight-line code."""
+
+
+class Generator:
+    """Generator collects the straight-line code of a message.
+
+    :param locals: Assignments binding nested messages to local variables.
+    :param values: List of base type values, as tuple (expr, flag, nbits, offset).
+    :param aheads: List of aheads, as tuple (value, offset).
+    """
+
+    def __init__(self) -> None:
+        self.locals: List[str] = []
+        self.values: List[Tuple[str, int, int, int]] = []
+        self.aheads: List[Tuple[int, int]] = []
+
+    def gen_message(
+        self,
+        processor: MessageProcessor,
+        expr: str,
+        sample: Any,
+        offset: int,
+        tree: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Generates code of a message at given offset, returns the offset after.
+        The argument sample is an instance of the message class, to lookup names and
+        the classes of nested messages. The argument tree selects the fields to
+        generate code for, in the format of bp.parse_field_paths, None for all.
+        Aheads are always generated.
+        """
+        if not is_dataclass(sample):
+            raise Unsupported()
+        fields = dataclass_fields(sample)
+        if len(fields) != len(processor.field_processors):
+            raise Unsupported()
+
+        start = offset
+        if processor.extensible:
+            self.aheads.append((processor.nbits, offset))
+            offset += 16
+
+        for field, field_processor in zip(fields, processor.field_processors):
+            fp = cast(MessageFieldProcessor, field_processor)
+            name = field.name
+            subtree = None if tree is None else tree.get(name, {})
+            offset = self.gen_type(
+                fp.type_processor,
+                f"{expr}.{name}",
+                getattr(sample, name),
+                offset,
+                subtree,
+            )
+
+        if processor.extensible:
+            # Decoding skips to the index of ahead plus nbits, if it's further.
+            if start + processor.nbits > offset:
+                raise Unsupported()
+        return offset
+
+    def gen_type(
+        self,
+        processor: Processor,
+        expr: str,
+        sample: Any,
+        offset: int,
+        tree: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Generates code of a value of given type at given offset, returns the offset
+        after.
+        """
+        flag = processor.flag()
+
+        if flag == FLAG_ALIAS:
+            to = cast(AliasProcessor, processor).to
+            return self.gen_type(to, expr, sample, offset, tree)
+
+        if flag == FLAG_ENUM:
+            ut = cast(EnumProcessor, processor).ut
+            return self.gen_type(ut, expr, sample, offset, tree)
+
+        if flag == FLAG_ARRAY:
+            return self.gen_array(cast(Array, processor), expr, sample, offset, tree)
+
+        if flag == FLAG_MESSAGE:
+            if tree is None or tree:
+                # Binds the nested message to a local variable.
+                name = f"m{len(self.locals) + 1}"
+                self.locals.append(f"{name} = {expr}")
+                expr = name
+            return self.gen_message(
+                cast(MessageProcessor, processor), expr, sample, offset, tree
+            )
+
+        if tree is not None:
+            # Not selected.
+            return offset + self.nbits_of(processor)
+
+        nbits = self.nbits_of(processor)
+        self.values.append((expr, flag, nbits, offset))
+        return offset + nbits
+
+    def nbits_of(self, processor: Processor) -> int:
+        """Returns the number of bits of given base type processor."""
+        flag = processor.flag()
+        if flag == FLAG_BOOL:
+            return 1
+        if flag == FLAG_BYTE:
+            return 8
+        return cast(int, getattr(processor, "nbits"))
+
+    def gen_array(
+        self,
+        processor: Array,
+        expr: str,
+        sample: Any,
+        offset: int,
+        tree: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        """Generates code of an array at given offset, returns the offset after."""
+        if len(sample) != processor.capacity:
+            raise Unsupported()
+
+        start = offset
+        if processor.extensible:
+            self.aheads.append((processor.capacity, offset))
+            offset += 16
+
+        for k in range(processor.capacity):
+            offset = self.gen_type(
+                processor.element_processor, f"{expr}[{k}]", sample[k], offset, tree
+            )
+
+        if processor.extensible:
+            # Decoding skips to the index of ahead times capacity, if it's further, even
+            # if the ahead is the array's own capacity.
+            if start + processor.capacity * processor.capacity > offset:
+                raise Unsupported()
+        return offset
+
+    def encoder_source(self, nbits: int) -> List[str]:
+        nbytes = (nbits + 7) >> 3
+        lines = ["def encode(m, s, o):", f"    if len(s) - o < {nbytes}:"]
+        lines.append("        return False")
+        lines.extend(f"    {line}" for line in self.locals)
+
+        terms = []
+        for expr, _, nbits, offset in self.values:
+            term = f"({expr} & {(1 << nbits) - 1})"
+            terms.append(f"{term} << {offset}" if offset else term)
+        # Aheads are constants.
+        constant = 0
+        for value, offset in self.aheads:
+            constant |= value << offset
+        terms.append(str(constant))
+
+        for k in range(0, len(terms), MAX_TERMS_PER_EXPRESSION):
+            expression = " | ".join(terms[k : k + MAX_TERMS_PER_EXPRESSION])
+            lines.append(f"    n {'|=' if k else '='} {expression}")
+
+        lines.append(f"    s[o : o + {nbytes}] = n.to_bytes({nbytes}, 'little')")
+        lines.append("    return True")
+        return lines
+
+    def layout(self) -> bytes:
+        """Returns the layout of the aheads and values for the C accelerator, as packed
+        entries (uint32 offset, uint8 nbits, uint8 flag).
+        """
+        entries = [(offset, 16, FLAG_UINT) for _, offset in self.aheads]
+        entries.extend((offset, nbits, flag) for _, flag, nbits, offset in self.values)
+        return b"".join(struct.pack("<IBB", *entry) for entry in entries)
+
+    def speedups_encoder_source(self, nbits: int) -> List[str]:
+        nbytes = (nbits + 7) >> 3
+        lines = ["def encode(m, s, o):", f"    if len(s) - o < {nbytes}:"]
+        lines.append("        return False")
+        lines.extend(f"    {line}" for line in self.locals)
+
+        values = [str(value) for value, _ in self.aheads]
+        values.extend(expr for expr, _, _, _ in self.values)
+        values_tuple = f"({', '.join(values)},)" if values else "()"
+        lines.append(f"    pack(s, o, {nbytes}, LAYOUT, {values_tuple})")
+        lines.append("    return True")
+        return lines
+
+    def speedups_decoder_source(self, nbits: int) -> List[str]:
+        nbytes = (nbits + 7) >> 3
+        lines = ["def decode(m, s, o):", f"    if len(s) - o < {nbytes}:"]
+        lines.append("        return False")
+        lines.extend(f"    {line}" for line in self.locals)
+
+        targets = [f"a{k}" for k in range(len(self.aheads))]
+        targets.extend(expr for expr, _, _, _ in self.values)
+        if targets:
+            lines.append(f"    {', '.join(targets)}, = unpack(s, o, {nbytes}, LAYOUT)")
+
+        # Message's layout changes if any ahead differs, values are decoded again then.
+        for k, (value, _) in enumerate(self.aheads):
+            lines.append(f"    if a{k} != {value}:")
+            lines.append("        return False")
+
+        lines.append("    return True")
+        return lines
+
+    def decoder_source(self, nbits: int) -> List[str]:
+        nbytes = (nbits + 7) >> 3
+        lines = ["def decode(m, s, o):", f"    if len(s) - o < {nbytes}:"]
+        lines.append("        return False")
+        lines.append(f"    n = int.from_bytes(s[o : o + {nbytes}], 'little')")
+
+        # Message's layout changes if any ahead differs.
+        for value, offset in self.aheads:
+            lines.append(f"    if (n >> {offset}) & 65535 != {value}:")
+            lines.append("        return False")
+
+        lines.extend(f"    {line}" for line in self.locals)
+
+        for expr, flag, nbits, offset in self.values:
+            v = f"(n >> {offset})" if offset else "n"
+            if flag == FLAG_BOOL:
+                lines.append(f"    {expr} = {v} & 1 == 1")
+            elif flag == FLAG_INT:
+                lines.append(f"    v = {v} & {(1 << nbits) - 1}")
+                lines.append(
+                    f"    {expr} = v - {1 << nbits} if v >= {1 << (nbits - 1)} else v"
+                )
+            else:
+                lines.append(f"    {expr} = {v} & {(1 << nbits) - 1}")
+
+        lines.append("    return True")
+        return lines
+
+
+def compile_codecs(cls: Any, source: List[str], namespace: Dict[str, Any]) -> None:
+    """Compiles given source of codecs into given namespace."""
+    code = compile(
+        "\n".join(source), f"<bitprotolib codegen {cls.__qualname__}>", "exec"
+    )
+    exec(code, namespace)
+
+
+def build_codecs(
+    cls: Any, processor: MessageProcessor
+) -> Tuple[Optional[Codec], Optional[Codec]]:
+    """Builds the straight-line encoder and decoder of given message class.
+    Returns (None, None) if the message can't be processed by straight-line code.
+    """
+    generator = Generator()
+    try:
+        nbits = generator.gen_message(processor, "m", cls(), 0)
+    except Unsupported:
+        return None, None
+
+    if pack is not None:
+        namespace = {"pack": pack, "unpack": unpack, "LAYOUT": generator.layout()}
+        encoder_source = generator.speedups_encoder_source(nbits)
+        decoder_source = generator.speedups_decoder_source(nbits)
+    else:
+        namespace = {}
+        encoder_source = generator.encoder_source(nbits)
+        decoder_source = generator.decoder_source(nbits)
+
+    compile_codecs(cls, encoder_source + ["", ""] + decoder_source, namespace)
+    return namespace["encode"], namespace["decode"]
+
+
+def build_partial_decoder(
+    cls: Any, processor: MessageProcessor, tree: Dict[str, Any]
+) -> Optional[Codec]:
+    """Builds the straight-line decoder of given message class decoding only the
+    fields selected by given tree, in the format of bp.parse_field_paths.
+    Returns None if the message can't be processed by straight-line code.
+    """
+    generator = Generator()
+    try:
+        nbits = generator.gen_message(processor, "m", cls(), 0, tree)
+    except Unsupported:
+        return None
+
+    if pack is not None:
+        namespace = {"unpack": unpack, "LAYOUT": generator.layout()}
+        decoder_source = generator.speedups_decoder_source(nbits)
+    else:
+        namespace = {}
+        decoder_source = generator.decoder_source(nbits)
+
+    compile_codecs(cls, decoder_source, namespace)
+    return namespace["decode"]
@@ -0,0 +1,142 @@
+"""
+bitprotolib.framing
+~~~~~~~~~~~~~~~~~~~
+
+Framing of multiple message types on a single channel.
+
+A frame is a header followed by the encoded message. The header is the 16 bits type id
+of the message, which compiler generates as BP_TYPE_ID, and optionally the 16 bits
+number of bytes of the encoded message, both in little endian::
+
+    +---------+----------+-----------------+
+    | type id | length   | encoded message |
+    +---------+----------+-----------------+
+      2 bytes   2 bytes    length bytes
+                optional
+
+The length makes frames of messages with different sizes (e.g. an extensible message
+of another version) decodable, and unknown frames skippable.
+"""
+
+from typing import Dict, Mapping, Tuple, Type, TypeVar
+
+from bitprotolib.bp import Buffer, Error, MessageBase, NotEnoughBytes
+
+M = TypeVar("M", bound=MessageBase)
+
+
+class UnknownMessageType(Error):
+    """No message class registered for the type id of a frame."""
+
+
+class Registry:
+    """Registry maps type ids to message classes.
+
+    :param messages: Message classes keyed by type id to register, e.g. the BP_MESSAGES
+       the compiler generates for each proto.
+
+    Example::
+
+        registry = Registry(drone_bp.BP_MESSAGES, camera_bp.BP_MESSAGES)
+    """
+
+    def __init__(self, *messages: Mapping[int, Type[MessageBase]]) -> None:
+        self.messages: Dict[int, Type[MessageBase]] = {}
+        for mapping in messages:
+            for message_class in mapping.values():
+                self.register(message_class)
+
+    def register(self, message_class: Type[M]) -> Type[M]:
+        """Registers given message class by its BP_TYPE_ID, returns the class.
+        Raises ValueError if the type id is taken by another class.
+        """
+        type_id = message_class.BP_TYPE_ID
+        registered = self.messages.setdefault(type_id, message_class)
+        if registered is not message_class:
+            raise ValueError(
+                f"bitprotolib: type id {type_id:#06x} of {message_class.__qualname__} "
+                f"is taken by {registered.__qualname__}"
+            )
+        return message_class
+
+    def lookup(self, type_id: int) -> Type[MessageBase]:
+        """Returns the message class of given type id.
+        Raises UnknownMessageType if not registered.
+        """
+        message_class = self.messages.get(type_id, None)
+        if message_class is None:
+            raise UnknownMessageType(f"bitprotolib: unknown type id {type_id:#06x}")
+        return message_class
+
+
+class Framing:
+    """Framing encodes and decodes frames of the messages in a registry.
+
+    :param registry: The registry to lookup message classes on decoding.
+    :param length_prefix: Whether frame headers carry the length of messages.
+    """
+
+    def __init__(self, registry: Registry, length_prefix: bool = False) -> None:
+        self.registry = registry
+        self.length_prefix = length_prefix
+        self.header_size = 4 if length_prefix else 2
+
+    def frame_size(self, message_class: Type[MessageBase]) -> int:
+        """Returns the number of bytes of a frame of given message class."""
+        return self.header_size + message_class.BYTES_LENGTH
+
+    def encode(self, message: MessageBase) -> bytearray:
+        """Encode given message to a frame."""
+        s = bytearray(self.frame_size(type(message)))
+        self.encode_into(message, s)
+        return s
+
+    def encode_into(self, message: MessageBase, s: Buffer, offset: int = 0) -> int:
+        """Encode given message to a frame into given writable buffer s starting at
+        byte offset. Returns the number of bytes written.
+        """
+        if len(s) - offset < self.frame_size(type(message)):
+            raise NotEnoughBytes()
+        header = message.BP_TYPE_ID
+        if self.length_prefix:
+            header |= message.BYTES_LENGTH << 16
+        s[offset : offset + self.header_size] = header.to_bytes(
+            self.header_size, "little"
+        )
+        return self.header_size + message.encode_into(s, offset + self.header_size)
+
+    def decode(self, s: Buffer, offset: int = 0) -> Tuple[MessageBase, int]:
+        """Decode a frame from given buffer s starting at byte offset.
+        Returns the decoded message and the number of bytes of the frame.
+        Raises UnknownMessageType if the type id is not registered, in which case the
+        frame can still be skipped by the length in its header, see decode_header.
+        """
+        type_id, length = self.decode_header(s, offset)
+        message_class = self.registry.lookup(type_id)
+        start = offset + self.header_size
+        if len(s) - start < length:
+            raise NotEnoughBytes()
+
+        message = message_class()
+        if length >= message_class.BYTES_LENGTH:
+            message.decode_from(s, start)
+        else:
+            # Shorter message, e.g. of an older version, pads it with zeros instead of
+            # reading the bytes following in the buffer.
+            payload = bytearray(s[start : start + length])
+            payload.extend(bytes(message_class.BYTES_LENGTH - length))
+            message.decode_from(payload)
+        return message, self.header_size + length
+
+    def decode_header(self, s: Buffer, offset: int = 0) -> Tuple[int, int]:
+        """Decode the header of a frame from given buffer s starting at byte offset.
+        Returns the type id and the number of bytes of the message. Without length
+        prefix, the length is the BYTES_LENGTH of the registered message class.
+        """
+        if len(s) - offset < self.header_size:
+            raise NotEnoughBytes()
+        header = int.from_bytes(s[offset : offset + self.header_size], "little")
+        type_id = header & 0xFFFF
+        if self.length_prefix:
+            return type_id, header >> 16
+        return type_id, self.registry.lookup(type_id).BYTES_LENGTH
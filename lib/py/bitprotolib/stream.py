@@ -0,0 +1,170 @@
+"""
+bitprotolib.stream
+~~~~~~~~~~~~~~~~~~
+
+Decoding streams of contiguous encoded frames of a message, from files, sockets and
+asyncio streams.
+
+Frames are of fixed size, the BYTES_LENGTH of the message class. Received bytes are
+read into a single buffer allocated once per reader, and frames are decoded from it in
+place via decode_from, without copying.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Generic, Iterator, Type, TypeVar
+
+from bitprotolib.bp import MessageBase
+
+M = TypeVar("M", bound=MessageBase)
+
+# Default size of the receive buffer in bytes.
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class FrameBuffer(Generic[M]):
+    """FrameBuffer is the receive buffer of frames of a message class.
+    Bytes received are appended at index end, and complete frames are decoded from index
+    start. The bytes of an incomplete frame are moved to the front before receiving.
+
+    :param message_class: The message class to decode frames to.
+    :param buffer_size: Size of the buffer, at least a frame.
+    """
+
+    def __init__(
+        self, message_class: Type[M], buffer_size: int = DEFAULT_BUFFER_SIZE
+    ) -> None:
+        self.message_class = message_class
+        self.frame_size = message_class.BYTES_LENGTH
+        if self.frame_size <= 0:
+            raise ValueError("bitprotolib: can't stream frames of empty message")
+
+        self.buf = bytearray(max(buffer_size, self.frame_size))
+        # The buffer is never resized, so a single view can be kept.
+        self.view = memoryview(self.buf)
+        self.start = 0
+        self.end = 0
+
+    def pending(self) -> int:
+        """Returns the number of bytes received of the incomplete frame."""
+        return self.end - self.start
+
+    def frames(self) -> Iterator[M]:
+        """Decodes and yields all complete frames received."""
+        while self.end - self.start >= self.frame_size:
+            message = self.message_class()
+            message.decode_from(self.buf, self.start)
+            self.start += self.frame_size
+            yield message
+
+    def compact(self) -> int:
+        """Moves the bytes of the incomplete frame to the front of the buffer.
+        Returns the number of bytes free to receive.
+        """
+        if self.start > 0:
+            n = self.end - self.start
+            self.view[:n] = self.view[self.start : self.end]
+            self.start, self.end = 0, n
+        return len(self.buf) - self.end
+
+    def receive(self, data: bytes) -> None:
+        """Appends given received data to the buffer, which must fit the free space."""
+        n = len(data)
+        self.buf[self.end : self.end + n] = data
+        self.end += n
+
+    def readinto(self, fileobj: Any) -> int:
+        """Reads bytes from given file object into the buffer.
+        Returns the number of bytes read, 0 on EOF.
+        """
+        size = self.compact()
+
+        if not hasattr(fileobj, "recv_into") and not hasattr(fileobj, "readinto"):
+            data = fileobj.read(size)
+            self.receive(data)
+            return len(data)
+
+        with self.view[self.end :] as target:
+            if hasattr(fileobj, "recv_into"):
+                # A socket.
+                n = fileobj.recv_into(target)
+            else:
+                n = fileobj.readinto(target)
+        n = n or 0
+        self.end += n
+        return n
+
+
+class FrameReader(Generic[M]):
+    """FrameReader iterates decoded messages from a stream of contiguous frames.
+
+    :param message_class: The message class to decode frames to.
+    :param fileobj: A readable binary file object, e.g. a file opened in mode "rb", or
+       a socket. Bytes are read via recv_into, readinto or read, whichever it supports.
+    :param buffer_size: Size of the receive buffer in bytes.
+
+    Example::
+
+        for drone in FrameReader(Drone, sock):
+            handle(drone)
+
+    Iteration stops on EOF, the bytes of a trailing incomplete frame are left in the
+    buffer, see pending().
+    """
+
+    def __init__(
+        self,
+        message_class: Type[M],
+        fileobj: Any,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        self.fileobj = fileobj
+        self.buffer: FrameBuffer[M] = FrameBuffer(message_class, buffer_size)
+
+    def __iter__(self) -> Iterator[M]:
+        while self.buffer.readinto(self.fileobj) > 0:
+            yield from self.buffer.frames()
+
+    def pending(self) -> int:
+        """Returns the number of bytes received of the incomplete frame."""
+        return self.buffer.pending()
+
+
+class AsyncFrameReader(Generic[M]):
+    """AsyncFrameReader is the asyncio version of FrameReader, iterates decoded messages
+    via async for from an asyncio.StreamReader.
+
+    :param message_class: The message class to decode frames to.
+    :param reader: The asyncio.StreamReader to read bytes from.
+    :param buffer_size: Size of the receive buffer in bytes.
+
+    Example::
+
+        reader, writer = await asyncio.open_connection(host, port)
+        async for drone in AsyncFrameReader(Drone, reader):
+            handle(drone)
+    """
+
+    def __init__(
+        self,
+        message_class: Type[M],
+        reader: asyncio.StreamReader,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        self.reader = reader
+        self.buffer: FrameBuffer[M] = FrameBuffer(message_class, buffer_size)
+
+    def __aiter__(self) -> AsyncIterator[M]:
+        return self.iterate()
+
+    async def iterate(self) -> AsyncIterator[M]:
+        while True:
+            data = await self.reader.read(self.buffer.compact())
+            if not data:
+                return
+            self.buffer.receive(data)
+            for message in self.buffer.frames():
+                yield message
+
+    def pending(self) -> int:
+        """Returns the number of bytes received of the incomplete frame."""
+        return self.buffer.pending()
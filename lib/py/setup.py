@@ -1,4 +1,4 @@
-from setuptools import setup  # type: ignore
+from setuptools import Extension, setup  # type: ignore
 
 setup(
     name="bitprotolib",
@@ -8,8 +8,16 @@ setup(
     author_email="hit9@icloud.com",
     description="bitproto encoding and decoding library for generated python files.",
     packages=["bitprotolib"],
+    # The C accelerator is optional, bitprotolib falls back to pure Python if it
+    # fails to build.
+    ext_modules=[
+        Extension(
+            "bitprotolib._speedups", ["bitprotolib/_speedups.c"], optional=True
+        )
+    ],
     include_package_data=True,
     python_requires=">=3.7",
+    extras_require={"numpy": ["numpy"]},
     zip_safe=False,
     platforms="any",
     classifiers=[
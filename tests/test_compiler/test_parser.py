@@ -2,9 +2,21 @@ import os
 from typing import Union as Fixture
 
 import pytest
-from bitproto._ast import (Alias, Array, Bool, BooleanConstant, Constant, Enum,
-                           Int, IntegerConstant, Message, MessageField, Option,
-                           Proto, StringConstant)
+from bitproto._ast import (
+    Alias,
+    Array,
+    Bool,
+    BooleanConstant,
+    Constant,
+    Enum,
+    Int,
+    IntegerConstant,
+    Message,
+    MessageField,
+    Option,
+    Proto,
+    StringConstant,
+)
 from bitproto.errors import GrammarError
 from bitproto.parser import parse
 from bitproto.utils import cast_or_raise
@@ -474,6 +486,19 @@ def test_parse_dupliate_enum_field_value() -> None:
         parse(bitproto_filepath("duplicate_enum_field_value.bitproto"))
 
 
+def test_parse_duplicate_type_id() -> None:
+    with pytest.raises(GrammarError):
+        parse(bitproto_filepath("duplicate_type_id.bitproto"))
+
+
+def test_parse_type_id_collision() -> None:
+    proto = parse(bitproto_filepath("type_id_collision.bitproto"))
+
+    message_a = cast_or_raise(Message, proto.get_member("M2"))
+    message_b = cast_or_raise(Message, proto.get_member("M6690"))
+    assert message_a.type_id() == message_b.type_id()
+
+
 def test_parse_hex_value() -> None:
     proto = parse(bitproto_filepath("hex_value.bitproto"))
 
@@ -15,6 +15,10 @@ int main(void) {
     for (int i = 0; i < 7; i++)
         m.f[i] = (struct Note){i, false, {1, 2, 3, 4, 5, 6, 7}};
     m.g = (struct Note){2, false, {7, 2, 3, 4, 5, 6, 7}};
+    // Negative values of byte-aligned signed integers.
+    m.b[6] = -123456;
+    m.c[6] = -7;
+    m.h = 171;
     unsigned char s[BYTES_LENGTH_M] = {0};
     EncodeM(&m, s);
 
@@ -38,6 +42,7 @@ int main(void) {
     for (int j = 0; j < 7; j++) assert(m1.g.arr[j] == m.g.arr[j]);
     assert(m1.g.number == m.g.number);
     assert(m1.g.ok == m.g.ok);
+    assert(m1.h == m.h);
 
     return 0;
 }
@@ -33,6 +33,10 @@ func main() {
 		m.F[i] = bp.Note{uint8(i), false, bp.Uint3s{1, 2, 3, 4, 5, 6, 7}}
 	}
 	m.G = bp.Note{uint8(2), false, bp.Uint3s{7, 2, 3, 4, 5, 6, 7}}
+	// Negative values of byte-aligned signed integers.
+	m.B[6] = -123456
+	m.C[6] = -7
+	m.H = 171
 
 	s := m.Encode()
 	for _, x := range s {
@@ -69,4 +73,5 @@ func main() {
 	}
 	assert(m1.G.Number == m.G.Number)
 	assert(m1.G.Ok == m.G.Ok)
+	assert(m1.H == m.H)
 }
@@ -16,6 +16,10 @@ def main() -> None:
     for i in range(7):
         m.f[i] = bp.Note(i, False, [j for j in range(1, 8)])
     m.g = bp.Note(2, False, [7, 2, 3, 4, 5, 6, 7])
+    # Negative values of byte-aligned signed integers.
+    m.b[6] = -123456
+    m.c[6] = -7
+    m.h = 171
     s = m.encode()
 
     for x in s:
@@ -43,6 +47,7 @@ def main() -> None:
         assert m1.g.arr[j] == m.g.arr[j]
     assert m1.g.number == m.g.number
     assert m1.g.ok == m.g.ok
+    assert m1.h == m.h
 
 
 if __name__ == "__main__":
@@ -54,5 +54,19 @@ int main(void) {
     assert(drone_new.network.signal == drone.network.signal);
     assert(drone_new.network.heartbeat_at == drone.network.heartbeat_at);
     assert(drone_new.landing_gear.status == drone.landing_gear.status);
+
+    // Byte-aligned signed integers.
+    struct Pose pose = {-4321, -1, 5678};
+    unsigned char s1[BYTES_LENGTH_POSE] = {0};
+    EncodePose(&pose, s1);
+
+    for (int i = 0; i < BYTES_LENGTH_POSE; i++) printf("%u ", s1[i]);
+
+    struct Pose pose_new = {0};
+    DecodePose(&pose_new, s1);
+
+    assert(pose_new.yaw == pose.yaw);
+    assert(pose_new.pitch == pose.pitch);
+    assert(pose_new.roll == pose.roll);
     return 0;
 }
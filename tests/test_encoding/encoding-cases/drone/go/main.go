@@ -62,4 +62,18 @@ func main() {
 	assert(droneNew.Network.Signal == drone.Network.Signal)
 	assert(droneNew.Network.HeartbeatAt == drone.Network.HeartbeatAt)
 	assert(droneNew.LandingGear.Status == drone.LandingGear.Status)
+
+	// Byte-aligned signed integers.
+	pose := &bp.Pose{Yaw: -4321, Pitch: -1, Roll: 5678}
+	s1 := pose.Encode()
+	for _, b := range s1 {
+		fmt.Printf("%d ", b)
+	}
+
+	poseNew := &bp.Pose{}
+	poseNew.Decode(s1)
+
+	assert(poseNew.Yaw == pose.Yaw)
+	assert(poseNew.Pitch == pose.Pitch)
+	assert(poseNew.Roll == pose.Roll)
 }
@@ -52,6 +52,20 @@ def main() -> None:
     assert drone_new.network.heartbeat_at == drone.network.heartbeat_at
     assert drone_new.landing_gear.status == drone.landing_gear.status
 
+    # Byte-aligned signed integers.
+    pose = bp.Pose(yaw=-4321, pitch=-1, roll=5678)
+    s = pose.encode()
+
+    for b in s:
+        print(int(b), end=" ")
+
+    pose_new = bp.Pose()
+    pose_new.decode(s)
+
+    assert pose_new.yaw == pose.yaw
+    assert pose_new.pitch == pose.pitch
+    assert pose_new.roll == pose.roll
+
 
 if __name__ == "__main__":
     main()
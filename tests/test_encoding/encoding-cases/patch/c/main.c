@@ -0,0 +1,100 @@
+#include <assert.h>
+#include <stdio.h>
+#include <string.h>
+
+#include "patch_bp.h"
+
+int main(void) {
+    // Encode.
+    struct Shape shape = {0};
+    shape.visible = true;
+    shape.color = COLOR_RED;
+    shape.created_at = 1611515729967;
+    shape.center.x = -1;
+    shape.center.y = 3;
+    shape.points[0].x = 100;
+    shape.points[0].y = 1;
+    shape.points[1].x = -200;
+    shape.points[1].y = 2;
+    shape.points[2].x = 300;
+    shape.points[2].y = 31;
+    shape.weights[0] = 1;
+    shape.weights[1] = 2;
+    shape.weights[2] = 3;
+    shape.weights[3] = 4;
+    shape.flags[0] = true;
+    shape.flags[1] = false;
+    shape.flags[2] = true;
+    shape.flags[3] = false;
+    shape.flags[4] = true;
+    shape.tag = 18;
+    shape.delta = -3;
+
+    unsigned char s[BYTES_LENGTH_SHAPE] = {0};
+    EncodeShape(&shape, s);
+
+    for (int i = 0; i < BYTES_LENGTH_SHAPE; i++) printf("%u ", s[i]);
+
+    // Patch.
+    PatchShape_Visible(s, false);
+    PatchShape_Color(s, COLOR_BLUE);
+    PatchShape_CreatedAt(s, -1611515729967);
+    PatchShape_Center_X(s, -300);
+    PatchShape_Center_Y(s, 30);
+    PatchShape_Points_X(s, 1, -32768);
+    PatchShape_Points_Y(s, 2, 17);
+    PatchShape_Weights(s, 0, 0);
+    PatchShape_Weights(s, 3, 8191);
+    PatchShape_Flags(s, 1, true);
+    PatchShape_Flags(s, 4, false);
+    PatchShape_Tag(s, 171);
+    PatchShape_Delta(s, -128);
+
+    for (int i = 0; i < BYTES_LENGTH_SHAPE; i++) printf("%u ", s[i]);
+
+    // Same as encoding the patched values.
+    shape.visible = false;
+    shape.color = COLOR_BLUE;
+    shape.created_at = -1611515729967;
+    shape.center.x = -300;
+    shape.center.y = 30;
+    shape.points[1].x = -32768;
+    shape.points[2].y = 17;
+    shape.weights[0] = 0;
+    shape.weights[3] = 8191;
+    shape.flags[1] = true;
+    shape.flags[4] = false;
+    shape.tag = 171;
+    shape.delta = -128;
+
+    unsigned char s1[BYTES_LENGTH_SHAPE] = {0};
+    EncodeShape(&shape, s1);
+    assert(memcmp(s, s1, BYTES_LENGTH_SHAPE) == 0);
+
+    // Decode.
+    struct Shape shape_new = {0};
+    DecodeShape(&shape_new, s);
+    assert(shape_new.visible == false);
+    assert(shape_new.color == COLOR_BLUE);
+    assert(shape_new.created_at == -1611515729967);
+    assert(shape_new.center.x == -300);
+    assert(shape_new.center.y == 30);
+    assert(shape_new.points[0].x == 100);
+    assert(shape_new.points[0].y == 1);
+    assert(shape_new.points[1].x == -32768);
+    assert(shape_new.points[1].y == 2);
+    assert(shape_new.points[2].x == 300);
+    assert(shape_new.points[2].y == 17);
+    assert(shape_new.weights[0] == 0);
+    assert(shape_new.weights[1] == 2);
+    assert(shape_new.weights[2] == 3);
+    assert(shape_new.weights[3] == 8191);
+    assert(shape_new.flags[0] == true);
+    assert(shape_new.flags[1] == true);
+    assert(shape_new.flags[2] == true);
+    assert(shape_new.flags[3] == false);
+    assert(shape_new.flags[4] == false);
+    assert(shape_new.tag == 171);
+    assert(shape_new.delta == -128);
+    return 0;
+}
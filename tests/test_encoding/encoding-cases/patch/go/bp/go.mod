@@ -0,0 +1,3 @@
+module github.com/hit9/bitproto/tests/test_encoding/encoding-cases/patch/go/bp
+
+go 1.15
@@ -0,0 +1,80 @@
+package main
+
+import (
+	"bytes"
+	"fmt"
+
+	bp "github.com/hit9/bitproto/tests/test_encoding/encoding-cases/patch/go/bp"
+)
+
+func assert(condition bool) {
+	if !condition {
+		panic("assertion failed")
+	}
+}
+
+func main() {
+	// Encode
+	shape := &bp.Shape{}
+	shape.Visible = true
+	shape.Color = bp.COLOR_RED
+	shape.CreatedAt = 1611515729967
+	shape.Center.X = -1
+	shape.Center.Y = 3
+	shape.Points[0].X = 100
+	shape.Points[0].Y = 1
+	shape.Points[1].X = -200
+	shape.Points[1].Y = 2
+	shape.Points[2].X = 300
+	shape.Points[2].Y = 31
+	shape.Weights = [4]uint16{1, 2, 3, 4}
+	shape.Flags = [5]bool{true, false, true, false, true}
+	shape.Tag = 18
+	shape.Delta = -3
+
+	s := shape.Encode()
+
+	for _, b := range s {
+		fmt.Printf("%d ", b)
+	}
+
+	// Patch
+	bp.PatchShape_Visible(s, false)
+	bp.PatchShape_Color(s, bp.COLOR_BLUE)
+	bp.PatchShape_CreatedAt(s, -1611515729967)
+	bp.PatchShape_Center_X(s, -300)
+	bp.PatchShape_Center_Y(s, 30)
+	bp.PatchShape_Points_X(s, 1, -32768)
+	bp.PatchShape_Points_Y(s, 2, 17)
+	bp.PatchShape_Weights(s, 0, 0)
+	bp.PatchShape_Weights(s, 3, 8191)
+	bp.PatchShape_Flags(s, 1, true)
+	bp.PatchShape_Flags(s, 4, false)
+	bp.PatchShape_Tag(s, 171)
+	bp.PatchShape_Delta(s, -128)
+
+	for _, b := range s {
+		fmt.Printf("%d ", b)
+	}
+
+	// Same as encoding the patched values.
+	shape.Visible = false
+	shape.Color = bp.COLOR_BLUE
+	shape.CreatedAt = -1611515729967
+	shape.Center.X = -300
+	shape.Center.Y = 30
+	shape.Points[1].X = -32768
+	shape.Points[2].Y = 17
+	shape.Weights[0] = 0
+	shape.Weights[3] = 8191
+	shape.Flags[1] = true
+	shape.Flags[4] = false
+	shape.Tag = 171
+	shape.Delta = -128
+	assert(bytes.Equal(s, shape.Encode()))
+
+	// Decode
+	shapeNew := &bp.Shape{}
+	shapeNew.Decode(s)
+	assert(*shapeNew == *shape)
+}
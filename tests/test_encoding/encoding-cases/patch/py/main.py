@@ -0,0 +1,69 @@
+import patch_bp as bp
+
+
+def main() -> None:
+    # Encode.
+    shape = bp.Shape()
+    shape.visible = True
+    shape.color = bp.COLOR_RED
+    shape.created_at = 1611515729967
+    shape.center.x = -1
+    shape.center.y = 3
+    shape.points[0].x = 100
+    shape.points[0].y = 1
+    shape.points[1].x = -200
+    shape.points[1].y = 2
+    shape.points[2].x = 300
+    shape.points[2].y = 31
+    shape.weights = [1, 2, 3, 4]
+    shape.flags = [True, False, True, False, True]
+    shape.tag = 18
+    shape.delta = -3
+
+    s = shape.encode()
+
+    for b in s:
+        print(int(b), end=" ")
+
+    # Patch.
+    bp.Shape.patch(s, "visible", False)
+    bp.Shape.patch(s, "color", bp.COLOR_BLUE)
+    bp.Shape.patch(s, "created_at", -1611515729967)
+    bp.Shape.patch(s, "center.x", -300)
+    bp.Shape.patch(s, "center.y", 30)
+    bp.Shape.patch(s, "points[1].x", -32768)
+    bp.Shape.patch(s, "points[2].y", 17)
+    bp.Shape.patch(s, "weights[0]", 0)
+    bp.Shape.patch(s, "weights[3]", 8191)
+    bp.Shape.patch(s, "flags[1]", True)
+    bp.Shape.patch(s, "flags[4]", False)
+    bp.Shape.patch(s, "tag", 171)
+    bp.Shape.patch(s, "delta", -128)
+
+    for b in s:
+        print(int(b), end=" ")
+
+    # Same as encoding the patched values.
+    shape.visible = False
+    shape.color = bp.COLOR_BLUE
+    shape.created_at = -1611515729967
+    shape.center.x = -300
+    shape.center.y = 30
+    shape.points[1].x = -32768
+    shape.points[2].y = 17
+    shape.weights[0] = 0
+    shape.weights[3] = 8191
+    shape.flags[1] = True
+    shape.flags[4] = False
+    shape.tag = 171
+    shape.delta = -128
+    assert s == shape.encode()
+
+    # Decode.
+    shape_new = bp.Shape()
+    shape_new.decode(s)
+    assert shape_new == shape
+
+
+if __name__ == "__main__":
+    main()
@@ -121,5 +121,9 @@ def test_encoding_arrays() -> None:
     _TestCase("arrays").run()
 
 
+def test_encoding_patch() -> None:
+    _TestCase("patch", support_optimization_mode=False).run()
+
+
 def test_encoding_scatter() -> None:
     _TestCase("arrays").run()
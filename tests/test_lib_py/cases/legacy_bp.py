@@ -0,0 +1,234 @@
+# Code generated by bitproto. DO NOT EDIT.
+
+
+"""
+Proto legacy is compiled by the bitproto compiler before whole value accessors,
+to legacy_bp.py, which calls the processors directly and implements per-byte
+accessors bp_set_byte and bp_get_byte.
+"""
+
+
+import json
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, List
+
+from bitprotolib import bp
+
+
+Timestamp = int # 64bit
+
+def bp_processor_Timestamp() -> bp.Processor:
+    return bp.AliasProcessor(bp.Int(64))
+
+def bp_default_factory_Timestamp() -> Timestamp:
+    return 0
+
+
+Color = int # 3bit
+COLOR_UNKNOWN: Color = 0
+COLOR_RED: Color = 1
+COLOR_BLUE: Color = 7
+
+_COLOR_VALUE_TO_NAME_MAP: Dict[Color, str] = {
+    0: "COLOR_UNKNOWN",
+    1: "COLOR_RED",
+    7: "COLOR_BLUE",
+}
+
+def bp_processor_Color() -> bp.Processor:
+    return bp.EnumProcessor(bp.Uint(3))
+
+
+@dataclass
+class Point(bp.MessageBase):
+    # Number of bytes to serialize class Point
+    BYTES_LENGTH: ClassVar[int] = 4
+
+    x: int = 0 # 16bit
+    y: int = 0 # 16bit
+
+    def bp_processor(self) -> bp.Processor:
+        field_processors: List[bp.Processor] = [
+            bp.MessageFieldProcessor(1, bp.Int(16)),
+            bp.MessageFieldProcessor(2, bp.Int(16)),
+        ]
+        return bp.MessageProcessor(False, 32, field_processors)
+
+    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+        if di.field_number == 1:
+            self.x |= bp.int16((int(b) << lshift))
+        if di.field_number == 2:
+            self.y |= bp.int16((int(b) << lshift))
+        return
+
+    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+        if di.field_number == 1:
+            return (self.x >> rshift) & 255
+        if di.field_number == 2:
+            return (self.y >> rshift) & 255
+        return bp.byte(0)  # Won't reached
+
+    def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
+        return bp.NilAccessor() # Won't reached
+
+    def encode(self) -> bytearray:
+        """
+        Encode this object to bytearray.
+        """
+        s = bytearray(self.BYTES_LENGTH)
+        ctx = bp.ProcessContext(True, s)
+        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        return ctx.s
+
+    def decode(self, s: bytearray) -> None:
+        """
+        Decode given bytearray s to this object.
+        :param s: A bytearray with length at least `BYTES_LENGTH`.
+        """
+        assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
+        ctx = bp.ProcessContext(False, s)
+        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+
+
+@dataclass
+class Inner(bp.MessageBase):
+    # Number of bytes to serialize class Inner
+    BYTES_LENGTH: ClassVar[int] = 7
+
+    a: int = 0 # 5bit
+    b: int = 0 # 32bit
+
+    def bp_processor(self) -> bp.Processor:
+        field_processors: List[bp.Processor] = [
+            bp.MessageFieldProcessor(1, bp.Uint(5)),
+            bp.MessageFieldProcessor(2, bp.Int(32)),
+        ]
+        return bp.MessageProcessor(True, 53, field_processors)
+
+    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+        if di.field_number == 1:
+            self.a |= (int(b) << lshift)
+        if di.field_number == 2:
+            self.b |= bp.int32((int(b) << lshift))
+        return
+
+    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+        if di.field_number == 1:
+            return (self.a >> rshift) & 255
+        if di.field_number == 2:
+            return (self.b >> rshift) & 255
+        return bp.byte(0)  # Won't reached
+
+    def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
+        return bp.NilAccessor() # Won't reached
+
+    def encode(self) -> bytearray:
+        """
+        Encode this object to bytearray.
+        """
+        s = bytearray(self.BYTES_LENGTH)
+        ctx = bp.ProcessContext(True, s)
+        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        return ctx.s
+
+    def decode(self, s: bytearray) -> None:
+        """
+        Decode given bytearray s to this object.
+        :param s: A bytearray with length at least `BYTES_LENGTH`.
+        """
+        assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
+        ctx = bp.ProcessContext(False, s)
+        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+
+
+@dataclass
+class Shape(bp.MessageBase):
+    # Number of bytes to serialize class Shape
+    BYTES_LENGTH: ClassVar[int] = 39
+
+    visible: bool = False # 1bit
+    color: Color = 0 # 3bit
+    flags: int = bp.byte(0) # 8bit
+    created_at: Timestamp = field(default_factory=bp_default_factory_Timestamp) # 64bit
+    origin: Point = field(default_factory=Point) # 32bit
+    points: List[Point] = field(default_factory=lambda: [Point() for _ in range(3)]) # 96bit
+    offsets: List[int] = field(default_factory=lambda: [0 for _ in range(2)]) # 16bit
+    raw: bytearray = field(default_factory=lambda: bytearray(3)) # 24bit
+    size: int = 0 # 13bit
+    inner: Inner = field(default_factory=Inner) # 53bit
+
+    def bp_processor(self) -> bp.Processor:
+        field_processors: List[bp.Processor] = [
+            bp.MessageFieldProcessor(1, bp.Bool()),
+            bp.MessageFieldProcessor(2, bp_processor_Color()),
+            bp.MessageFieldProcessor(3, bp.Byte()),
+            bp.MessageFieldProcessor(4, bp_processor_Timestamp()),
+            bp.MessageFieldProcessor(5, Point().bp_processor()),
+            bp.MessageFieldProcessor(6, bp.Array(False, 3, Point().bp_processor())),
+            bp.MessageFieldProcessor(7, bp.Array(False, 2, bp.Int(8))),
+            bp.MessageFieldProcessor(8, bp.Array(False, 3, bp.Byte())),
+            bp.MessageFieldProcessor(9, bp.Uint(13)),
+            bp.MessageFieldProcessor(10, Inner().bp_processor()),
+        ]
+        return bp.MessageProcessor(False, 310, field_processors)
+
+    def bp_set_byte(self, di: bp.DataIndexer, lshift: int, b: bp.byte) -> None:
+        if di.field_number == 1:
+            self.visible = bool(b)
+        if di.field_number == 2:
+            self.color |= (Color(b) << lshift)
+        if di.field_number == 3:
+            self.flags |= (int(b) << lshift)
+        if di.field_number == 4:
+            self.created_at |= bp.int64((int(b) << lshift))
+        if di.field_number == 7:
+            self.offsets[di.i(0)] |= bp.int8((int(b) << lshift))
+        if di.field_number == 8:
+            self.raw[di.i(0)] |= (int(b) << lshift)
+        if di.field_number == 9:
+            self.size |= (int(b) << lshift)
+        return
+
+    def bp_get_byte(self, di: bp.DataIndexer, rshift: int) -> bp.byte:
+        if di.field_number == 1:
+            return (int(self.visible) >> rshift) & 255
+        if di.field_number == 2:
+            return (self.color >> rshift) & 255
+        if di.field_number == 3:
+            return (self.flags >> rshift) & 255
+        if di.field_number == 4:
+            return (self.created_at >> rshift) & 255
+        if di.field_number == 7:
+            return (self.offsets[di.i(0)] >> rshift) & 255
+        if di.field_number == 8:
+            return (self.raw[di.i(0)] >> rshift) & 255
+        if di.field_number == 9:
+            return (self.size >> rshift) & 255
+        return bp.byte(0)  # Won't reached
+
+    def bp_get_accessor(self, di: bp.DataIndexer) -> bp.Accessor:
+        if di.field_number == 5:
+            return self.origin
+        if di.field_number == 6:
+            return self.points[di.i(0)]
+        if di.field_number == 10:
+            return self.inner
+        return bp.NilAccessor() # Won't reached
+
+    def encode(self) -> bytearray:
+        """
+        Encode this object to bytearray.
+        """
+        s = bytearray(self.BYTES_LENGTH)
+        ctx = bp.ProcessContext(True, s)
+        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
+        return ctx.s
+
+    def decode(self, s: bytearray) -> None:
+        """
+        Decode given bytearray s to this object.
+        :param s: A bytearray with length at least `BYTES_LENGTH`.
+        """
+        assert len(s) >= self.BYTES_LENGTH, bp.NotEnoughBytes()
+        ctx = bp.ProcessContext(False, s)
+        self.bp_processor().process(ctx, bp.NIL_DATA_INDEXER, self)
\ No newline at end of file
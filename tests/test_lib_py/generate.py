@@ -0,0 +1,77 @@
+"""
+Helpers to compile bitproto files and make messages for the tests of the Python
+library bitprotolib.
+"""
+
+import importlib.util
+import os
+import random
+import tempfile
+from dataclasses import fields, is_dataclass
+from types import ModuleType
+from typing import Any, Type, TypeVar
+
+from bitproto.parser import parse
+from bitproto.renderer import render
+
+# Whether the generated files are in optimization mode, the same environment variable
+# with test_encoding.
+OPTIMIZATION_MODE = os.environ.get("BP_TEST_OPTIMIZATION_ARG", "") == "-O"
+
+T = TypeVar("T")
+
+
+def bitproto_filepath(filename: str) -> str:
+    return os.path.join(os.path.dirname(__file__), "cases", filename)
+
+
+def load(name: str, optimization_mode: bool = False) -> ModuleType:
+    """Compiles the bitproto file cases/{name}.bitproto to Python, and then imports
+    the generated module. Each call returns a new module, so that classes of different
+    tests don't share their cached processors and plans.
+    """
+    proto = parse(
+        bitproto_filepath(f"{name}.bitproto"), traditional_mode=optimization_mode
+    )
+    with tempfile.TemporaryDirectory() as outdir:
+        filepath = render(
+            proto, "py", outdir=outdir, optimization_mode=optimization_mode
+        )[0]
+        return import_file(filepath, f"{proto.name}_bp")
+
+
+def import_file(filepath: str, name: str) -> ModuleType:
+    """Imports the Python file at given filepath as a new module of given name."""
+    spec = importlib.util.spec_from_file_location(name, filepath)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    return module
+
+
+def randomize(value: Any, rng: random.Random) -> Any:
+    """Returns a random value of the same type with given value, messages are
+    randomized in place. Integers are of 64 bits, which are truncated to the bits of
+    their fields on encoding.
+    """
+    if isinstance(value, bool):
+        return rng.random() < 0.5
+    if isinstance(value, int):
+        return rng.randrange(-(1 << 63), 1 << 63)
+    if isinstance(value, bytearray):
+        return bytearray(rng.randrange(256) for _ in value)
+    if isinstance(value, list):
+        return [randomize(v, rng) for v in value]
+    if is_dataclass(value):
+        for f in fields(value):
+            setattr(value, f.name, randomize(getattr(value, f.name), rng))
+    return value
+
+
+def random_message(cls: Type[T], rng: random.Random) -> T:
+    """Returns a message of given class with random values of its fields."""
+    message = randomize(cls(), rng)
+    # Normalizes the values to the bits of their fields.
+    result = cls()
+    result.decode(message.encode())  # type: ignore
+    return result
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from .generate import bitproto_filepath, import_file, load, random_message
+
+
+def test_accessor_legacy_classes() -> None:
+    # Classes generated by older compilers only implement per-byte accessors.
+    legacy = import_file(bitproto_filepath("legacy_bp.py"), "legacy_bp")
+    bp = load("legacy")
+    rng = random.Random(4)
+
+    for _ in range(200):
+        shape = random_message(bp.Shape, rng)
+        s = shape.encode()
+
+        shape_legacy = legacy.Shape()
+        shape_legacy.decode(s)
+        assert shape_legacy.to_dict() == shape.to_dict()
+        assert shape_legacy.encode() == s
+
+
+def test_accessor_legacy_classes_negative_values() -> None:
+    legacy = import_file(bitproto_filepath("legacy_bp.py"), "legacy_bp")
+    shape = legacy.Shape(created_at=-1, offsets=[-128, -1])
+    shape.origin.x = -32768
+    shape.inner.b = -2
+
+    shape_new = legacy.Shape()
+    shape_new.decode(shape.encode())
+    assert shape_new == shape
+
+
+# Field number, name, number of bits and signed of the base type fields of Few and
+# Many.
+FIELDS = {
+    "Few": [(1, "a", 3, False), (2, "b", 16, True), (3, "c", 1, False)],
+    "Many": [
+        (1, "a", 3, False),
+        (2, "b", 8, True),
+        (3, "c", 1, False),
+        (4, "d", 16, True),
+        (5, "e", 24, False),
+        (7, "g", 8, False),
+        (8, "h", 64, True),
+        (9, "i", 7, False),
+    ],
+}
+
+
+@pytest.mark.parametrize("name", ["Few", "Many"])
+def test_accessor_dispatch(name: str) -> None:
+    bp = load("dispatch")
+    cls = getattr(bp, name)
+    assert hasattr(cls, "_BP_VALUE_SETTERS") == (name == "Many")
+    message = cls()
+    rng = random.Random(5)
+    for number, field, nbits, signed in FIELDS[name]:
+        raw = rng.randrange(1 << nbits)
+        message.bp_set_value(bp.bp.DataIndexer(number), raw)
+        v = getattr(message, field)
+        if signed:
+            assert v == raw - (1 << nbits) * (raw >> (nbits - 1))
+        else:
+            assert v == raw
+        assert message.bp_get_value(bp.bp.DataIndexer(number)) == v
+
+    # Nested messages are accessed by their accessors.
+    number, field = (4, "d") if name == "Few" else (10, "j")
+    inner = message.bp_get_accessor(bp.bp.DataIndexer(number))
+    assert inner is getattr(message, field)
+
+
+@pytest.mark.parametrize("name", ["Few", "Many"])
+def test_accessor_dispatch_encoding(name: str) -> None:
+    bp = load("dispatch")
+    cls = getattr(bp, name)
+    rng = random.Random(5)
+    for _ in range(50):
+        message = random_message(cls, rng)
+        result = cls()
+        result.decode(message.encode())
+        assert result == message
+
+
+@pytest.mark.parametrize("name", ["Few", "Many"])
+def test_accessor_dispatch_unknown_field(name: str) -> None:
+    # Both dispatching ways fall back to the same defaults.
+    bp = load("dispatch")
+    message = getattr(bp, name)(a=1)
+    di = bp.bp.DataIndexer(99)
+    message.bp_set_value(di, 5)
+    assert message == getattr(bp, name)(a=1)
+    assert message.bp_get_value(di) == 0
+    assert isinstance(message.bp_get_accessor(di), bp.bp.NilAccessor)
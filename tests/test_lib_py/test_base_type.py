@@ -0,0 +1,81 @@
+import random
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from .generate import load
+
+# Name, number of bits, signed and array capacity of the fields of message Fields.
+FIELDS: List[Tuple[str, int, bool, int]] = [
+    ("a", 1, False, 0),
+    ("b", 16, True, 0),
+    ("c", 2, False, 0),
+    ("d", 24, False, 0),
+    ("e", 8, True, 0),
+    ("f", 6, False, 0),
+    ("g", 32, True, 0),
+    ("h", 64, False, 0),
+    ("i", 64, True, 0),
+    ("j", 13, False, 0),
+    ("k", 16, True, 3),
+    ("l", 9, False, 2),
+]
+
+
+def random_values(rng: random.Random) -> Dict[str, Any]:
+    """Returns random values in range of the fields of message Fields."""
+    values: Dict[str, Any] = {}
+    for name, nbits, signed, cap in FIELDS:
+        lo, hi = (-(1 << (nbits - 1)), 1 << (nbits - 1)) if signed else (0, 1 << nbits)
+        if cap:
+            values[name] = [rng.randrange(lo, hi) for _ in range(cap)]
+        else:
+            values[name] = rng.randrange(lo, hi)
+    return values
+
+
+def pack(values: Dict[str, Any]) -> bytes:
+    """Encodes given values of message Fields bit by bit as a little-endian integer,
+    as a reference independent of the runtime.
+    """
+    data, offset = 0, 0
+    for name, nbits, _, cap in FIELDS:
+        for v in values[name] if cap else [values[name]]:
+            data |= (v & ((1 << nbits) - 1)) << offset
+            offset += nbits
+    return data.to_bytes((offset + 7) // 8, "little")
+
+
+@pytest.mark.parametrize("optimization_mode", [False, True])
+def test_base_type_unaligned(optimization_mode: bool) -> None:
+    bp = load("offsets", optimization_mode)
+    rng = random.Random(3)
+    for _ in range(200):
+        values = random_values(rng)
+        s = pack(values)
+        assert bp.Fields(**values).encode() == s
+
+        message = bp.Fields()
+        message.decode(s)
+        assert message == bp.Fields(**values)
+
+
+@pytest.mark.parametrize("optimization_mode", [False, True])
+def test_base_type_unaligned_extremes(optimization_mode: bool) -> None:
+    bp = load("offsets", optimization_mode)
+    for k in range(4):
+        values: Dict[str, Any] = {}
+        for name, nbits, signed, cap in FIELDS:
+            # Minimum, maximum, -1 and 1 of each field.
+            lo, hi = (
+                (-(1 << (nbits - 1)), (1 << (nbits - 1)) - 1)
+                if signed
+                else (0, (1 << nbits) - 1)
+            )
+            v = [lo, hi, -1 if signed else hi, 1][k]
+            values[name] = [v] * cap if cap else v
+        s = pack(values)
+        assert bp.Fields(**values).encode() == s
+        message = bp.Fields()
+        message.decode(s)
+        assert message == bp.Fields(**values)
@@ -0,0 +1,125 @@
+import random
+from typing import Any, List
+
+import pytest
+
+from .generate import load, random_message
+
+np = pytest.importorskip("numpy")
+
+
+def get_path(data: Any, path: List[str]) -> Any:
+    """Returns the value of given dotted path in the dict of a message, arrays along
+    the path are mapped to nested lists.
+    """
+    if isinstance(data, list):
+        return [get_path(e, path) for e in data]
+    if not path:
+        return data
+    return get_path(data[path[0]], path[1:])
+
+
+def test_decode_batch() -> None:
+    bp = load("drone")
+    rng = random.Random(7)
+    drones = [random_message(bp.Drone, rng) for _ in range(50)]
+    s = b"".join(drone.encode() for drone in drones)
+
+    columns = bp.Drone.decode_batch(s)
+    layout = bp.Drone.bp_batch_layout()
+    assert set(columns) == {field.name for field in layout.fields}
+
+    for name, column in columns.items():
+        expect = [get_path(drone.to_dict(), name.split(".")) for drone in drones]
+        assert column.tolist() == expect, name
+
+
+def test_decode_batch_dtypes() -> None:
+    bp = load("drone")
+    columns = bp.Drone.decode_batch(bp.Drone().encode() * 3)
+    assert columns["status"].dtype == np.uint8
+    assert columns["flight.pose.yaw"].dtype == np.int32
+    assert columns["network.heartbeat_at"].dtype == np.int64
+    assert columns["power.is_charging"].dtype == np.bool_
+    assert columns["flight.velocity"].shape == (3, 3)
+    assert columns["propellers.id"].shape == (3, 4)
+
+
+def test_decode_batch_extensible() -> None:
+    bp = load("drone_extended")
+    rng = random.Random(7)
+    drones = [random_message(bp.Drone, rng) for _ in range(20)]
+    columns = bp.Drone.decode_batch(b"".join(drone.encode() for drone in drones))
+    assert columns["propellers.field_new"].tolist() == [
+        [p.field_new for p in drone.propellers] for drone in drones
+    ]
+
+
+def test_decode_batch_incomplete_frame() -> None:
+    bp = load("drone")
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone.decode_batch(bp.Drone().encode() * 2 + b"\x00")
+
+
+def test_decode_batch_empty() -> None:
+    bp = load("drone")
+    assert bp.Drone.decode_batch(b"")["status"].shape == (0,)
+    assert load("empty").Empty.decode_batch(b"") == {}
+
+
+def test_encode_batch_messages() -> None:
+    bp = load("drone")
+    rng = random.Random(8)
+    drones = [random_message(bp.Drone, rng) for _ in range(50)]
+    s = b"".join(drone.encode() for drone in drones)
+    assert bp.Drone.encode_batch(drones) == s
+    assert bp.Drone.encode_batch(drones, count=50) == s
+
+
+def test_encode_batch_columns() -> None:
+    bp = load("drone_extended")
+    rng = random.Random(8)
+    s = b"".join(random_message(bp.Drone, rng).encode() for _ in range(50))
+    assert bp.Drone.encode_batch(bp.Drone.decode_batch(s)) == s
+
+
+def test_encode_batch_missing_columns() -> None:
+    bp = load("drone")
+    s = bp.Drone.encode_batch({"status": [1, 2], "flight.pose.yaw": [-1, 1]})
+    drones = [bp.Drone(), bp.Drone()]
+    drones[0].decode(s[: bp.Drone.BYTES_LENGTH])
+    drones[1].decode(s[bp.Drone.BYTES_LENGTH :])
+    assert drones[0] == bp.Drone(status=1, flight=bp.Flight(pose=bp.Pose(yaw=-1)))
+    assert drones[1] == bp.Drone(status=2, flight=bp.Flight(pose=bp.Pose(yaw=1)))
+
+
+def test_encode_batch_unknown_column() -> None:
+    bp = load("drone")
+    with pytest.raises(ValueError, match="unknown column"):
+        bp.Drone.encode_batch({"status": [1, 2], "flight.pose.yew": [1, 2]})
+
+
+def test_encode_batch_column_lengths() -> None:
+    bp = load("drone")
+    with pytest.raises(ValueError, match="same length"):
+        bp.Drone.encode_batch({"status": [1, 2], "flight.pose.yaw": [1, 2, 3]})
+    with pytest.raises(ValueError, match="same length"):
+        bp.Drone.encode_batch({"status": [1, 2]}, count=3)
+    with pytest.raises(ValueError, match="count"):
+        bp.Drone.encode_batch([bp.Drone()], count=2)
+
+
+def test_encode_batch_column_shape() -> None:
+    bp = load("drone")
+    with pytest.raises(ValueError, match="shape"):
+        bp.Drone.encode_batch({"flight.velocity": [1, 2]})
+
+
+def test_encode_batch_without_fields() -> None:
+    bp = load("empty")
+    s = bp.EmptyExtensible().encode()
+    assert bp.EmptyExtensible.encode_batch({}, count=3) == s * 3
+    assert bp.EmptyExtensible.encode_batch([bp.EmptyExtensible()] * 3) == s * 3
+    assert bp.Empty.encode_batch({}, count=3) == b""
+    with pytest.raises(ValueError, match="count"):
+        bp.EmptyExtensible.encode_batch({})
@@ -0,0 +1,137 @@
+import mmap
+import random
+
+import pytest
+
+from .generate import load, random_message
+
+
+def test_encode_into_offset() -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(9))
+    n = bp.Drone.BYTES_LENGTH
+    s = bytearray(n + 5)
+    assert drone.encode_into(s, 3) == n
+    assert s[:3] == b"\x00" * 3
+    assert s[3 : 3 + n] == drone.encode()
+    assert s[3 + n :] == b"\x00" * 2
+
+
+@pytest.mark.parametrize("wrap", [memoryview, lambda s: memoryview(s).cast("H")])
+def test_encode_into_memoryview(wrap) -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(9))
+    n = bp.Drone.BYTES_LENGTH
+    s = bytearray(2 * n)
+    assert drone.encode_into(wrap(s), n) == n
+    assert s[n:] == drone.encode()
+
+
+def test_encode_into_mmap() -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(9))
+    with mmap.mmap(-1, bp.Drone.BYTES_LENGTH) as m:
+        drone.encode_into(m)
+        assert m[:] == drone.encode()
+
+
+def test_encode_into_not_enough_bytes() -> None:
+    bp = load("drone")
+    n = bp.Drone.BYTES_LENGTH
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone().encode_into(bytearray(n - 1))
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone().encode_into(bytearray(n), 1)
+
+
+def test_encode_into_readonly() -> None:
+    bp = load("drone")
+    with pytest.raises(TypeError):
+        bp.Drone().encode_into(bytes(bp.Drone.BYTES_LENGTH))
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview])
+def test_negative_offset(wrap) -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(9))
+    n = bp.Drone.BYTES_LENGTH
+    s = wrap(bytearray(drone.encode()) + bytearray(2))
+    with pytest.raises(ValueError, match="negative offset"):
+        bp.Drone(status=1).encode_into(s, -1)
+    assert bytes(s) == drone.encode() + bytes(2)
+    with pytest.raises(ValueError, match="negative offset"):
+        bp.Drone().decode_from(s, -2)
+    with pytest.raises(ValueError, match="negative offset"):
+        bp.Drone().decode_from(bytes(s), -n, ["status"])
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_decode_from_offset(wrap) -> None:
+    bp = load("drone")
+    rng = random.Random(9)
+    drones = [random_message(bp.Drone, rng) for _ in range(3)]
+    s = wrap(b"\xff" + b"".join(drone.encode() for drone in drones))
+    n = bp.Drone.BYTES_LENGTH
+    for k, drone in enumerate(drones):
+        result = bp.Drone()
+        assert result.decode_from(s, 1 + k * n) == n
+        assert result == drone
+
+
+def test_decode_from_mmap() -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(9))
+    s = drone.encode()
+    with mmap.mmap(-1, len(s)) as m:
+        m[:] = s
+        result = bp.Drone()
+        result.decode_from(m)
+        assert result == drone
+
+
+def test_decode_from_not_enough_bytes() -> None:
+    bp = load("drone")
+    s = bp.Drone().encode()
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone().decode_from(s[:-1])
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone().decode_from(s, 1)
+
+
+def test_encode_into_dirty_buffer() -> None:
+    bp = load("drone_extended")
+    rng = random.Random(10)
+    n = bp.Drone.BYTES_LENGTH
+    for _ in range(50):
+        drone = random_message(bp.Drone, rng)
+        s = bytearray(rng.randrange(256) for _ in range(n + 2))
+        head, tail = s[:1], s[-1:]
+        drone.encode_into(s, 1)
+        assert s[1 : 1 + n] == drone.encode()
+        assert s[:1] == head and s[-1:] == tail
+
+
+def test_encode_scratch() -> None:
+    bp = load("drone")
+    rng = random.Random(10)
+    a = random_message(bp.Drone, rng)
+    b = random_message(bp.Drone, rng)
+
+    view = a.encode_scratch()
+    assert isinstance(view, memoryview)
+    assert bytes(view) == a.encode()
+
+    # The scratch buffer is reused and overwritten by the next call.
+    assert b.encode_scratch() is view
+    assert bytes(view) == b.encode()
+    assert bp.Drone().encode_scratch() is view
+    assert bytes(view) == bp.Drone().encode()
+
+
+def test_encode_scratch_per_class() -> None:
+    bp = load("drone")
+    pose = bp.Pose(yaw=-1, pitch=2, roll=-3)
+    view = pose.encode_scratch()
+    bp.Drone().encode_scratch()
+    assert len(view) == bp.Pose.BYTES_LENGTH
+    assert bytes(view) == pose.encode()
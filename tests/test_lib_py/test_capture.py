@@ -0,0 +1,89 @@
+import random
+from typing import Any, List, Tuple
+
+import pytest
+from bitprotolib.capture import CaptureFile
+
+from .generate import load, random_message
+
+
+def make_capture(tmp_path: Any, n: int, trailing: bytes = b"") -> Tuple[Any, List[Any]]:
+    """Writes a capture file of n random drones, returns its path and the drones."""
+    bp = load("drone")
+    rng = random.Random(18)
+    drones = [random_message(bp.Drone, rng) for _ in range(n)]
+    path = tmp_path / "capture.bin"
+    path.write_bytes(b"".join(drone.encode() for drone in drones) + trailing)
+    return path, drones
+
+
+def test_capture_file(tmp_path) -> None:
+    path, drones = make_capture(tmp_path, 100, b"\x01\x02\x03")
+    cls = type(drones[0])
+    with CaptureFile(cls, str(path)) as capture:
+        assert len(capture) == 100
+        assert capture[0] == drones[0]
+        assert capture[57] == drones[57]
+        assert capture[-1] == drones[-1]
+        assert list(capture) == drones
+        with pytest.raises(IndexError):
+            capture[100]
+    assert capture.mmap is None and capture.file.closed
+
+
+def test_capture_file_slices(tmp_path) -> None:
+    path, drones = make_capture(tmp_path, 100)
+    with CaptureFile(type(drones[0]), str(path)) as capture:
+        for key in [
+            slice(10, 20),
+            slice(None, None, 7),
+            slice(-5, None),
+            slice(90, 10, -3),
+            slice(200, 300),
+        ]:
+            frames = capture[key]
+            assert len(frames) == len(drones[key])
+            assert list(frames) == drones[key]
+        assert list(capture[10:50][::4][1:3]) == drones[10:50][::4][1:3]
+        assert capture[10:50:4][-1] == drones[10:50:4][-1]
+
+
+def test_capture_file_raw(tmp_path) -> None:
+    path, drones = make_capture(tmp_path, 10)
+    with CaptureFile(type(drones[0]), str(path)) as capture:
+        frames = capture[::3]
+        for k, drone in enumerate(drones[::3]):
+            with frames.raw(k) as view:
+                assert view == drone.encode()
+
+
+def test_capture_file_batches(tmp_path) -> None:
+    np = pytest.importorskip("numpy")
+    path, drones = make_capture(tmp_path, 100, b"\x01")
+    with CaptureFile(type(drones[0]), str(path)) as capture:
+        batches = list(capture[5:].iter_batches(batch_frames=30))
+        assert [len(batch["status"]) for batch in batches] == [30, 30, 30, 5]
+        statuses = np.concatenate([batch["status"] for batch in batches])
+        assert statuses.tolist() == [drone.status for drone in drones[5:]]
+
+        columns = capture[::-2].decode_batch()
+        expect = [drone.flight.pose.yaw for drone in drones[::-2]]
+        assert columns["flight.pose.yaw"].tolist() == expect
+
+
+def test_capture_file_empty(tmp_path) -> None:
+    bp = load("drone")
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    with CaptureFile(bp.Drone, str(path)) as capture:
+        assert len(capture) == 0
+        assert list(capture) == []
+        assert list(capture.iter_batches()) == []
+
+
+def test_capture_file_empty_message(tmp_path) -> None:
+    bp = load("empty")
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"\x00")
+    with pytest.raises(ValueError):
+        CaptureFile(bp.Empty, str(path))
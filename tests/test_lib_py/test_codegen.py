@@ -0,0 +1,83 @@
+import random
+from typing import Any
+
+import pytest
+
+from .generate import load, random_message
+
+
+def without_new_fields(data: Any) -> Any:
+    """Drops the fields added in drone_extended from the dict of a message."""
+    if isinstance(data, list):
+        return [without_new_fields(e) for e in data]
+    if isinstance(data, dict):
+        return {k: without_new_fields(v) for k, v in data.items() if k != "field_new"}
+    return data
+
+
+@pytest.mark.parametrize("name", ["drone", "drone_extended"])
+def test_codecs(name: str) -> None:
+    bp = load(name)
+    plan = bp.Drone.bp_plan()
+    assert plan.encoder is not None and plan.decoder is not None
+    rng = random.Random(14)
+    for _ in range(50):
+        drone = random_message(bp.Drone, rng)
+        s = bytearray(bp.Drone.BYTES_LENGTH + 1)
+        assert plan.encoder(drone, s, 1)
+        assert s[1:] == drone.encode()
+
+        result = bp.Drone()
+        assert plan.decoder(result, bytes(s), 1)
+        assert result == drone
+
+
+def test_codecs_short_buffer() -> None:
+    bp = load("drone")
+    plan = bp.Drone.bp_plan()
+    n = bp.Drone.BYTES_LENGTH
+    s = bytearray(n)
+    assert not plan.encoder(bp.Drone(status=1), s, 1)
+    assert not plan.decoder(bp.Drone(), bytes(s), 1)
+    assert not plan.encoder(bp.Drone(status=1), s[:-1], 0)
+    assert not plan.decoder(bp.Drone(), bytes(s[:-1]), 0)
+    assert s == bytes(n)
+
+
+def test_codecs_ahead_mismatch() -> None:
+    origin = load("drone_origin")
+    extended = load("drone_extended")
+    rng = random.Random(14)
+    for _ in range(50):
+        drone = random_message(extended.Drone, rng)
+        s = drone.encode()
+
+        # Aheads mismatch, falls back to the steps.
+        result = origin.Drone()
+        assert not origin.Drone.bp_plan().decoder(result, s, 0)
+        result.decode(s)
+        assert result.to_dict() == without_new_fields(drone.to_dict())
+
+
+def test_codecs_unsupported(monkeypatch) -> None:
+    from bitprotolib import codegen
+
+    def unsupported(*args: Any, **kwargs: Any) -> int:
+        raise codegen.Unsupported()
+
+    expect = load("drone_extended")
+    assert expect.Drone.bp_plan().encoder is not None
+
+    monkeypatch.setattr(codegen.Generator, "gen_message", unsupported)
+    bp = load("drone_extended")
+    plan = bp.Drone.bp_plan()
+    assert plan.encoder is None and plan.decoder is None
+
+    rng = random.Random(14)
+    for _ in range(50):
+        drone = random_message(expect.Drone, rng)
+        s = drone.encode()
+        result = bp.Drone()
+        result.decode(s)
+        assert result.to_dict() == drone.to_dict()
+        assert result.encode() == s
@@ -0,0 +1,105 @@
+import json
+import random
+import re
+from dataclasses import asdict
+from typing import Any
+
+import pytest
+
+from .generate import bitproto_filepath, import_file, load, random_message
+
+MODES = [False, True]
+
+
+@pytest.mark.parametrize("optimization_mode", MODES)
+def test_to_dict(optimization_mode: bool) -> None:
+    bp = load("drone", optimization_mode)
+    rng = random.Random(22)
+    for _ in range(20):
+        drone = random_message(bp.Drone, rng)
+        assert drone.to_dict() == asdict(drone)
+        assert json.loads(drone.to_json()) == asdict(drone)
+
+
+@pytest.mark.parametrize("optimization_mode", MODES)
+def test_to_dict_enum_names(optimization_mode: bool) -> None:
+    bp = load("drone", optimization_mode)
+    drone = bp.Drone(status=bp.DRONE_STATUS_FLYING)
+    drone.propellers[1].direction = bp.ROTATING_DIRECTION_ANTI_CLOCK_WISE
+    drone.landing_gear.status = bp.LANDING_GEAR_STATUS_FOLDED
+
+    d = drone.to_dict(enum_names=True)
+    assert d["status"] == "DRONE_STATUS_FLYING"
+    assert d["propellers"][0]["direction"] == "ROTATING_DIRECTION_UNKNOWN"
+    assert d["propellers"][1]["direction"] == "ROTATING_DIRECTION_ANTI_CLOCK_WISE"
+    assert d["landing_gear"]["status"] == "LANDING_GEAR_STATUS_FOLDED"
+    assert d["power"]["battery"] == 0
+    assert json.loads(drone.to_json(enum_names=True)) == d
+
+    # Values without names are kept.
+    drone.status = 7
+    assert drone.to_dict(enum_names=True)["status"] == 7
+
+
+def test_to_dict_legacy_classes() -> None:
+    # Classes generated by older compilers fall back to dataclasses.asdict.
+    legacy = import_file(bitproto_filepath("legacy_bp.py"), "legacy_bp")
+    shape = random_message(legacy.Shape, random.Random(22))
+    assert shape.to_dict() == asdict(shape)
+    assert shape.to_dict(enum_names=True) == asdict(shape)
+
+
+@pytest.mark.parametrize("optimization_mode", MODES)
+def test_from_dict(optimization_mode: bool) -> None:
+    bp = load("drone", optimization_mode)
+    rng = random.Random(23)
+    for _ in range(20):
+        drone = random_message(bp.Drone, rng)
+        for enum_names in (False, True):
+            d = drone.to_dict(enum_names)
+            assert bp.Drone.from_dict(d, validate=True) == drone
+            s = drone.to_json(enum_names=enum_names)
+            assert bp.Drone.from_json(s, validate=True) == drone
+            assert bp.Drone.from_json(s.encode()) == drone
+
+
+@pytest.mark.parametrize("optimization_mode", MODES)
+def test_from_dict_defaults(optimization_mode: bool) -> None:
+    bp = load("drone", optimization_mode)
+    assert bp.Drone.from_dict({}) == bp.Drone()
+    drone = bp.Drone.from_dict(
+        {"status": "DRONE_STATUS_RISING", "flight": {"pose": {"yaw": -1}}},
+        validate=True,
+    )
+    expect = bp.Drone(status=bp.DRONE_STATUS_RISING)
+    expect.flight.pose.yaw = -1
+    assert drone == expect
+    # Nested messages and arrays are not shared with defaults.
+    drone.propellers[0].id = 1
+    assert bp.Drone.from_dict({}).propellers[0].id == 0
+    # Not validated by default, values are truncated on encoding.
+    assert bp.Drone.from_dict({"status": 8}).status == 8
+
+
+@pytest.mark.parametrize("optimization_mode", MODES)
+@pytest.mark.parametrize(
+    "d, match",
+    [
+        ({"status": 8}, "Drone.status 8"),
+        ({"status": -1}, "Drone.status -1"),
+        ({"status": "DRONE_STATUS_NONE"}, "Drone.status 'DRONE_STATUS_NONE'"),
+        ({"flight": {"pose": {"yaw": 1 << 31}}}, "Pose.yaw"),
+        ({"flight": {"velocity": [1, 2]}}, "Flight.velocity requires 3"),
+        ({"flight": {"velocity": [1, 2, -(1 << 31) - 1]}}, "Flight.velocity"),
+        ({"propellers": [{}] * 5}, "Drone.propellers requires 4"),
+        ({"propellers": [{"id": 256}] * 4}, "Propeller.id 256"),
+        ({"power": {"is_charging": "yes"}}, "Power.is_charging"),
+        ({"network": {"heartbeat_at": 1.5}}, "Network.heartbeat_at"),
+    ],
+)
+def test_from_dict_validate(optimization_mode: bool, d: Any, match: str) -> None:
+    bp = load("drone", optimization_mode)
+    with pytest.raises(ValueError, match=re.escape(match)):
+        bp.Drone.from_dict(d, validate=True)
+    with pytest.raises(ValueError, match=re.escape(match)):
+        bp.Drone.from_json(json.dumps(d), validate=True)
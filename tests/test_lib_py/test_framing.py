@@ -0,0 +1,113 @@
+import pytest
+from bitprotolib.framing import Framing, Registry, UnknownMessageType
+
+from .generate import load
+
+
+def test_registry() -> None:
+    bp = load("framing")
+    assert bp.BP_MESSAGES == {
+        1: bp.Packet,
+        2: bp.Ack,
+        bp.Other.BP_TYPE_ID: bp.Other,
+    }
+    registry = Registry(bp.BP_MESSAGES)
+    assert registry.lookup(1) is bp.Packet
+    assert registry.lookup(2) is bp.Ack
+    assert registry.register(bp.Ack) is bp.Ack
+    with pytest.raises(UnknownMessageType):
+        registry.lookup(3)
+    with pytest.raises(ValueError, match="taken"):
+        registry.register(load("framing").Ack)
+
+
+def test_registry_type_id_collision() -> None:
+    bp = load("type_id_collision")
+    assert bp.M2.BP_TYPE_ID == bp.M6690.BP_TYPE_ID
+    assert bp.BP_MESSAGES == {}
+    registry = Registry(bp.BP_MESSAGES)
+    registry.register(bp.M2)
+    with pytest.raises(ValueError, match="taken by M2"):
+        registry.register(bp.M6690)
+
+
+@pytest.mark.parametrize("length_prefix", [False, True])
+def test_framing(length_prefix: bool) -> None:
+    bp = load("framing")
+    framing = Framing(Registry(bp.BP_MESSAGES), length_prefix)
+    messages = [
+        bp.Packet(kind=5, value=-2000, extra=65535, flag=True),
+        bp.Ack(seq=1234),
+        bp.Other(x=7),
+    ]
+    s = b"".join(framing.encode(message) for message in messages)
+
+    offset = 0
+    for message in messages:
+        result, n = framing.decode(s, offset)
+        assert result == message
+        assert n == framing.frame_size(type(message))
+        offset += n
+    assert offset == len(s)
+
+
+def test_framing_not_enough_bytes() -> None:
+    bp = load("framing")
+    framing = Framing(Registry(bp.BP_MESSAGES), length_prefix=True)
+    s = framing.encode(bp.Packet(kind=1))
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        framing.decode(s[:-1])
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        framing.decode_header(s[:3])
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        framing.encode_into(bp.Packet(), bytearray(len(s)), 1)
+
+
+def test_framing_unknown_type() -> None:
+    bp = load("framing")
+    s = Framing(Registry(bp.BP_MESSAGES), True).encode(bp.Other(x=1))
+    s += Framing(Registry(bp.BP_MESSAGES), True).encode(bp.Ack(seq=2))
+
+    framing = Framing(Registry({1: bp.Packet, 2: bp.Ack}), length_prefix=True)
+    with pytest.raises(UnknownMessageType):
+        framing.decode(s)
+    # Skips the unknown frame by its length.
+    type_id, length = framing.decode_header(s)
+    assert type_id == bp.Other.BP_TYPE_ID
+    assert framing.decode(s, 4 + length) == (bp.Ack(seq=2), 6)
+
+    with pytest.raises(UnknownMessageType):
+        Framing(framing.registry).decode_header(s)
+
+
+def test_framing_older_peer() -> None:
+    v1 = load("framing_v1")
+    v2 = load("framing")
+    s = Framing(Registry(v1.BP_MESSAGES), length_prefix=True).encode(
+        v1.Packet(kind=3, value=-7)
+    )
+    s += Framing(Registry(v1.BP_MESSAGES), length_prefix=True).encode(
+        v1.Ack(seq=0xFFFF)
+    )
+
+    framing = Framing(Registry(v2.BP_MESSAGES), length_prefix=True)
+    packet, n = framing.decode(s)
+    # The bytes of the next frame are not decoded as the new fields.
+    assert packet == v2.Packet(kind=3, value=-7)
+    assert n == 4 + v1.Packet.BYTES_LENGTH
+    assert framing.decode(s, n) == (v2.Ack(seq=0xFFFF), 6)
+
+
+def test_framing_newer_peer() -> None:
+    v1 = load("framing_v1")
+    v2 = load("framing")
+    s = Framing(Registry(v2.BP_MESSAGES), length_prefix=True).encode(
+        v2.Packet(kind=3, value=-7, extra=0xFFFF, flag=True)
+    )
+    s += Framing(Registry(v2.BP_MESSAGES), length_prefix=True).encode(v2.Ack(seq=9))
+
+    framing = Framing(Registry(v1.BP_MESSAGES), length_prefix=True)
+    packet, n = framing.decode(s)
+    assert packet == v1.Packet(kind=3, value=-7)
+    assert n == 4 + v2.Packet.BYTES_LENGTH
+    assert framing.decode(s, n) == (v1.Ack(seq=9), 6)
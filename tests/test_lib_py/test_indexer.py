@@ -0,0 +1,60 @@
+import random
+from types import ModuleType
+from typing import Any
+
+import pytest
+
+from .generate import load, randomize
+
+
+def process_tree(bp: ModuleType, message: Any, s: bytearray, is_encode: bool) -> None:
+    """Encodes or decodes given message of module bp by walking its processor tree, on
+    the single data indexer of the context shared by all processors.
+    """
+    ctx = bp.bp.ProcessContext(is_encode, s)
+    type(message).bp_processor().process_fields(ctx, ctx.di, message)
+    # The indexer is back to the top level message.
+    assert ctx.di.base == 0 and ctx.di.top == 0
+
+
+@pytest.mark.parametrize("name", ["Leaf", "Node", "Tree"])
+def test_indexer_nested_arrays(name: str) -> None:
+    # The optimization mode indexes fields directly, without data indexers.
+    bp = load("nested_arrays")
+    cls = getattr(bp, name)
+    op = getattr(load("nested_arrays", optimization_mode=True), name)
+    for seed in range(20):
+        # Same random values of 64 bits, truncated on encoding.
+        message = randomize(cls(), random.Random(seed))
+        s = bytearray(cls.BYTES_LENGTH)
+        process_tree(bp, message, s, True)
+        assert randomize(op(), random.Random(seed)).encode() == s
+
+        result = cls()
+        process_tree(bp, result, s, False)
+        op_message = op()
+        op_message.decode(s)
+        assert result.to_dict() == op_message.to_dict()
+
+
+def test_indexer_restored() -> None:
+    bp = load("nested_arrays")
+    tree = bp.Tree(x=-1, e=[1, -2])
+    tree.nodes[1].leaves[1].pairs[2] = [3, -4]
+    tree.nodes[1].leaves[1].bits[1][1][0][1][0][1][1] = 1
+    tree.nodes[1].leaves[1].c = True
+    tree.nodes[1].d = [5, 6, 7]
+    tree.nodes[1].leaf.a = 2
+    tree.leaves[0].pairs[0][1] = 8
+    tree.leaves[1].c = True
+
+    s = bytearray(bp.Tree.BYTES_LENGTH)
+    ctx = bp.bp.ProcessContext(True, s)
+    bp.Tree.bp_processor().process_fields(ctx, ctx.di, tree)
+    assert s == tree.encode()
+    # Grown beyond the preallocated 8 array indexes.
+    assert len(ctx.di.aistack) == 9
+
+    result = bp.Tree()
+    process_tree(bp, result, s, False)
+    assert result == tree
@@ -0,0 +1,101 @@
+import copy
+import random
+from typing import Any, List
+
+import pytest
+from bitprotolib.bp import parse_field_paths
+
+from .generate import load, random_message
+
+FIELDS = [
+    ["status"],
+    ["flight.pose.yaw", "network.heartbeat_at"],
+    ["flight.pose", "flight.pose.roll"],
+    ["flight.acceleration", "power.is_charging"],
+    ["propellers.direction", "landing_gear"],
+    ["position", "flight", "propellers", "power", "network", "landing_gear"],
+    [],
+]
+
+
+def copy_path(dst: Any, src: Any, path: List[str]) -> None:
+    """Copies the field of given path from message src to message dst, arrays of
+    messages along the path are copied element by element.
+    """
+    if isinstance(dst, list):
+        for d, s in zip(dst, src):
+            copy_path(d, s, path)
+        return
+    name, *rest = path
+    if rest:
+        copy_path(getattr(dst, name), getattr(src, name), rest)
+    else:
+        setattr(dst, name, copy.deepcopy(getattr(src, name)))
+
+
+@pytest.mark.parametrize("fields", FIELDS)
+def test_partial_decode(fields: List[str]) -> None:
+    bp = load("drone")
+    rng = random.Random(20)
+    for _ in range(20):
+        source = random_message(bp.Drone, rng)
+        base = random_message(bp.Drone, rng)
+        expect = copy.deepcopy(base)
+        for path in fields:
+            copy_path(expect, source, path.split("."))
+
+        result = copy.deepcopy(base)
+        result.decode(source.encode(), fields=fields)
+        assert result == expect
+
+        result = copy.deepcopy(base)
+        s = b"\x00\x00" + source.encode()
+        assert result.decode_from(s, 2, fields) == bp.Drone.BYTES_LENGTH
+        assert result == expect
+
+
+def test_partial_decode_extensible() -> None:
+    origin = load("drone_origin")
+    extended = load("drone_extended")
+    fields = ["status", "flight.pose", "propellers.id", "network"]
+    rng = random.Random(20)
+    for _ in range(20):
+        source = random_message(extended.Drone, rng)
+        s = source.encode()
+        for bp in (origin, extended):
+            expect = bp.Drone()
+            expect.decode(s)
+            result = bp.Drone()
+            result.decode(s, fields=fields)
+            assert result.status == expect.status
+            assert result.flight.pose == expect.flight.pose
+            assert [p.id for p in result.propellers] == [
+                p.id for p in expect.propellers
+            ]
+            assert result.network == expect.network
+            assert result.position == bp.Position()
+
+
+def test_partial_plan_cache() -> None:
+    bp = load("drone")
+    plan = bp.Drone.bp_partial_plan(["status", "power.battery"])
+    assert bp.Drone.bp_partial_plan(("power.battery", "status")) is plan
+    assert bp.Drone.bp_partial_plan(["status"]) is not plan
+
+
+def test_partial_decode_invalid_fields() -> None:
+    bp = load("drone")
+    s = bp.Drone().encode()
+    with pytest.raises(ValueError, match="no field"):
+        bp.Drone().decode(s, fields=["flight.pose.yew"])
+    with pytest.raises(ValueError, match="not a message"):
+        bp.Drone().decode(s, fields=["status.value"])
+
+
+def test_parse_field_paths() -> None:
+    assert parse_field_paths(["a", "b.c", "b.d.e"]) == {
+        "a": None,
+        "b": {"c": None, "d": {"e": None}},
+    }
+    assert parse_field_paths(["b", "b.c"]) == {"b": None}
+    assert parse_field_paths(["b.c", "b"]) == {"b": None}
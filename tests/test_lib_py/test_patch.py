@@ -0,0 +1,127 @@
+import itertools
+import random
+from typing import Any, List, Tuple
+
+import pytest
+
+from .generate import load, random_message
+
+
+def set_field(message: Any, name: str, index: Tuple[int, ...], value: Any) -> str:
+    """Sets the base type field of given dotted name and array indexes on message to
+    value, returns the path of the field to patch, e.g. "propellers[2].direction".
+    """
+    parts: List[str] = []
+    indexes = list(index)
+    holder, obj = None, message
+    for part in name.split("."):
+        holder, key, obj = obj, part, getattr(obj, part)
+        while isinstance(obj, list):
+            k = indexes.pop(0)
+            part += f"[{k}]"
+            holder, key, obj = obj, k, obj[k]
+        parts.append(part)
+    if isinstance(obj, bool):
+        value = bool(value & 1)
+    if isinstance(holder, list):
+        holder[key] = value
+    else:
+        setattr(holder, key, value)
+    return ".".join(parts)
+
+
+def getattr_path(message: Any, path: str) -> Any:
+    """Returns the value of given patch path on message."""
+    obj = message
+    for part in path.split("."):
+        name, *index = part.replace("]", "").split("[")
+        obj = getattr(obj, name)
+        for k in index:
+            obj = obj[int(k)]
+    return obj
+
+
+@pytest.mark.parametrize("name", ["drone", "drone_extended"])
+def test_patch(name: str) -> None:
+    bp = load(name)
+    rng = random.Random(21)
+    for field in bp.Drone.bp_batch_layout().fields:
+        for index in itertools.product(*map(range, field.shape)):
+            drone = random_message(bp.Drone, rng)
+            s = drone.encode()
+            value = rng.randrange(-(1 << 63), 1 << 63)
+            path = set_field(drone, field.name, index, value)
+            bp.Drone.patch(s, path, getattr_path(drone, path))
+            assert s == drone.encode(), path
+
+
+def test_patch_buffers() -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(21))
+    n = bp.Drone.BYTES_LENGTH
+
+    s = bytearray(b"\xff" + drone.encode() + b"\xff")
+    bp.Drone.patch(memoryview(s), "flight.pose.yaw", -5, 1)
+    bp.Drone.patch(s, "propellers[3].direction", 2, 1)
+    drone.flight.pose.yaw = -5
+    drone.propellers[3].direction = 2
+    assert s == b"\xff" + drone.encode() + b"\xff"
+
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone.patch(bytearray(n - 1), "status", 1)
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.Drone.patch(bytearray(n), "status", 1, 1)
+    with pytest.raises(ValueError, match="negative offset"):
+        bp.Drone.patch(s, "status", 1, -1)
+    assert s == b"\xff" + drone.encode() + b"\xff"
+
+
+@pytest.mark.parametrize(
+    "path, value",
+    [
+        ("status", 8),
+        ("status", -1),
+        ("flight.pose.yaw", 1 << 31),
+        ("flight.pose.yaw", -(1 << 31) - 1),
+        ("propellers[1].id", 256),
+        ("power.is_charging", 2),
+        ("network.heartbeat_at", 1.5),
+    ],
+)
+def test_patch_validate(path: str, value: Any) -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(21))
+    s = bytearray(drone.encode())
+    with pytest.raises(ValueError, match="out of range"):
+        bp.Drone.patch(s, path, value, validate=True)
+    assert s == drone.encode()
+
+
+def test_patch_truncate() -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(21))
+    s = bytearray(drone.encode())
+    # Truncated to the field's bits without touching its neighbours, like encoding.
+    bp.Drone.patch(s, "status", 9)
+    bp.Drone.patch(s, "flight.pose.yaw", (1 << 32) - 5)
+    bp.Drone.patch(s, "propellers[1].id", -1, validate=False)
+    bp.Drone.patch(s, "flight.pose.pitch", -(1 << 31), validate=True)
+    drone.status = 1
+    drone.flight.pose.yaw = -5
+    drone.propellers[1].id = 255
+    drone.flight.pose.pitch = -(1 << 31)
+    assert s == drone.encode()
+
+
+def test_patch_invalid_paths() -> None:
+    bp = load("drone")
+    s = bp.Drone().encode()
+    with pytest.raises(ValueError, match="no base type field"):
+        bp.Drone.patch(s, "flight.pose", 1)
+    with pytest.raises(ValueError, match="no base type field"):
+        bp.Drone.patch(s, "flight.pose.yew", 1)
+    with pytest.raises(ValueError, match="requires 1 index"):
+        bp.Drone.patch(s, "propellers.id", 1)
+    with pytest.raises(IndexError):
+        bp.Drone.patch(s, "propellers[4].id", 1)
+    assert s == bp.Drone().encode()
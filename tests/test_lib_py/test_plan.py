@@ -0,0 +1,56 @@
+import random
+
+import pytest
+
+from .generate import load, random_message
+
+
+@pytest.mark.parametrize("name", ["drone", "drone_extended"])
+def test_plan_steps(name: str) -> None:
+    bp = load(name)
+    plan = bp.Drone.bp_plan()
+    rng = random.Random(13)
+    for _ in range(50):
+        drone = random_message(bp.Drone, rng)
+        # Steps only, without the generated codecs.
+        s = bytearray(bp.Drone.BYTES_LENGTH)
+        plan.encode(bp.bp.ProcessContext(True, s), drone)
+        assert s == drone.encode()
+
+        result = bp.Drone()
+        ctx = bp.bp.ProcessContext(False, bytes(s))
+        plan.decode(ctx, result)
+        assert ctx.i == plan.nbits
+        assert result == drone
+
+
+@pytest.mark.parametrize("i", range(1, 8))
+def test_plan_unaligned(i: int) -> None:
+    bp = load("drone_extended")
+    plan = bp.Drone.bp_plan()
+    drone = random_message(bp.Drone, random.Random(i))
+    n = bp.Drone.BYTES_LENGTH
+
+    s = bytearray(n + 1)
+    ctx = bp.bp.ProcessContext(True, s, i)
+    plan.process(ctx, drone)
+    assert ctx.i == i + plan.nbits
+    assert int.from_bytes(s, "little") == int.from_bytes(drone.encode(), "little") << i
+
+    result = bp.Drone()
+    ctx = bp.bp.ProcessContext(False, bytes(s), i)
+    plan.process(ctx, result)
+    assert ctx.i == i + plan.nbits
+    assert result == drone
+
+
+def test_plan_ahead_past_end() -> None:
+    # Aheads skipping beyond the buffer raise IndexError, with or without the C
+    # accelerator, instead of decoding the following fields as zeros.
+    bp = load("drone_extended")
+    drone = random_message(bp.Drone, random.Random(13))
+    for i, _ in bp.DroneView.BP_AHEADS:
+        s = bytearray(drone.encode())
+        bp.bp.write_bits_at(s, i, 16, 0xFFFF)
+        with pytest.raises(IndexError):
+            bp.Drone().decode(s)
@@ -0,0 +1,27 @@
+from .generate import load
+
+
+def test_processor_cached_per_class() -> None:
+    bp = load("drone")
+    processor = bp.Drone.bp_processor()
+    assert bp.Drone.bp_processor() is processor
+    assert bp.Drone().bp_processor() is processor
+    # Processors of nested messages are the cached ones of their classes.
+    assert processor.field_processors[1].type_processor is bp.Position.bp_processor()
+
+
+def test_processor_shared_by_instances() -> None:
+    bp = load("drone")
+    a = bp.Drone(status=bp.DRONE_STATUS_RISING)
+    a.flight.pose.yaw = -1
+    b = bp.Drone(status=bp.DRONE_STATUS_LANDING)
+    b.propellers[3].id = 255
+
+    s_a, s_b = a.encode(), b.encode()
+    assert s_a != s_b
+
+    a_new, b_new = bp.Drone(), bp.Drone()
+    a_new.decode(s_a)
+    b_new.decode(s_b)
+    assert a_new == a
+    assert b_new == b
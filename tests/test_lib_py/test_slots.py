@@ -0,0 +1,66 @@
+import copy
+import pickle
+import random
+
+import pytest
+
+from .generate import OPTIMIZATION_MODE, load, random_message
+
+
+def test_slots_no_instance_dict() -> None:
+    bp = load("slots", OPTIMIZATION_MODE)
+    shape = bp.Shape()
+    assert not hasattr(shape, "__dict__")
+    assert set(bp.Shape.__slots__) == {
+        "status",
+        "visible",
+        "created_at",
+        "origin",
+        "points",
+        "raw",
+    }
+    with pytest.raises(AttributeError):
+        shape.unknown = 1
+
+
+def test_slots_defaults() -> None:
+    bp = load("slots", OPTIMIZATION_MODE)
+    a, b = bp.Shape(), bp.Shape()
+    a.points[0].x = 1
+    a.raw[0] = 1
+    # Default factories are still called per instance.
+    assert b.points[0].x == 0 and b.raw[0] == 0
+    assert bp.Shape(visible=True).visible
+
+
+def test_slots_encoding() -> None:
+    bp = load("slots", OPTIMIZATION_MODE)
+    rng = random.Random(6)
+    for _ in range(50):
+        shape = random_message(bp.Shape, rng)
+        shape_new = bp.Shape()
+        shape_new.decode(shape.encode())
+        assert shape_new == shape
+        assert bp.Shape.from_dict(shape.to_dict()) == shape
+
+
+def test_slots_runtime_classes() -> None:
+    bp = load("drone")
+    processor = bp.Drone.bp_processor()
+    ctx = bp.bp.ProcessContext(True, bytearray(bp.Drone.BYTES_LENGTH))
+    di = bp.bp.DataIndexer(1)
+    for obj in (ctx, di, processor, *processor.field_processors):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unknown = 1
+
+    # Still copyable and picklable.
+    for obj in (ctx, di, processor):
+        assert copy.copy(obj) == obj
+        assert copy.deepcopy(obj) == obj
+        assert pickle.loads(pickle.dumps(obj)) == obj
+    di.index_stack_up()
+    di.index_stack_replace(3)
+    di_copy = copy.deepcopy(di)
+    assert di_copy.i(0) == 3 and di_copy.top == 1
+    assert di_copy.aistack is not di.aistack
@@ -0,0 +1,100 @@
+import importlib.util
+import random
+from types import ModuleType
+
+import pytest
+from bitprotolib import bp, codegen
+
+from .generate import load, random_message, randomize
+
+speedups = pytest.importorskip("bitprotolib._speedups")
+
+
+@pytest.fixture
+def pure_bp(monkeypatch) -> ModuleType:
+    """Returns a separate copy of module bitprotolib.bp without the C accelerator."""
+    monkeypatch.setenv("BITPROTOLIB_NO_SPEEDUPS", "1")
+    spec = importlib.util.spec_from_file_location("pure_bp", bp.__file__)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)  # type: ignore
+    assert not module.USE_SPEEDUPS
+    return module
+
+
+def test_read_bits_at(pure_bp: ModuleType) -> None:
+    rng = random.Random(15)
+    s = bytes(rng.randrange(256) for _ in range(32))
+    for _ in range(2000):
+        nbits = rng.randrange(1, 65)
+        i = rng.randrange(len(s) * 8 - nbits + 1)
+        expect = pure_bp.read_bits_at(s, i, nbits)
+        assert speedups.read_bits_at(s, i, nbits) == expect
+        assert speedups.read_bits_at(memoryview(s), i, nbits) == expect
+
+
+def test_write_bits_at(pure_bp: ModuleType) -> None:
+    rng = random.Random(15)
+    for _ in range(2000):
+        s = bytearray(rng.randrange(256) for _ in range(32))
+        nbits = rng.randrange(1, 65)
+        i = rng.randrange(len(s) * 8 - nbits + 1)
+        data = rng.randrange(-(1 << 63), 1 << 64)
+        expect = bytearray(s)
+        pure_bp.write_bits_at(expect, i, nbits, data)
+        speedups.write_bits_at(s, i, nbits, data)
+        assert s == expect
+
+
+@pytest.mark.parametrize("i, nbits", [(12, 16), (9, 8), (16, 1), (-1, 4)])
+def test_bits_at_out_of_range(pure_bp: ModuleType, i: int, nbits: int) -> None:
+    for module in (pure_bp, speedups):
+        s = bytearray(2)
+        with pytest.raises(IndexError):
+            module.read_bits_at(bytes(s), i, nbits)
+        with pytest.raises(IndexError):
+            module.write_bits_at(s, i, nbits, (1 << nbits) - 1)
+        assert s == bytearray(2)
+
+
+@pytest.mark.parametrize("name", ["drone", "drone_extended"])
+def test_codecs(monkeypatch, name: str) -> None:
+    fast = load(name)
+    assert fast.Drone.bp_plan().encoder is not None
+
+    monkeypatch.setattr(codegen, "pack", None)
+    monkeypatch.setattr(codegen, "unpack", None)
+    pure = load(name)
+    assert pure.Drone.bp_plan().encoder is not None
+
+    rng = random.Random(15)
+    for _ in range(100):
+        drone = random_message(fast.Drone, rng)
+        s = drone.encode()
+        result = pure.Drone()
+        result.decode(s)
+        assert result.encode() == s
+        assert result.to_dict() == drone.to_dict()
+
+        # Values out of the range of fields are truncated the same.
+        drone = randomize(fast.Drone(), rng)
+        s = bytearray(fast.Drone.BYTES_LENGTH)
+        assert pure.Drone.bp_plan().encoder(drone, s, 0)
+        assert s == drone.encode()
+
+
+def test_codecs_partial(monkeypatch) -> None:
+    fields = ["status", "flight.pose", "propellers.id", "network.heartbeat_at"]
+    fast = load("drone")
+    monkeypatch.setattr(codegen, "pack", None)
+    monkeypatch.setattr(codegen, "unpack", None)
+    pure = load("drone")
+
+    rng = random.Random(15)
+    for _ in range(100):
+        s = random_message(fast.Drone, rng).encode()
+        expect = fast.Drone()
+        expect.decode_from(s, fields=fields)
+        result = pure.Drone()
+        result.decode_from(s, fields=fields)
+        assert result.to_dict() == expect.to_dict()
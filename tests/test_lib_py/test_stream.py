@@ -0,0 +1,92 @@
+import asyncio
+import io
+import random
+import socket
+import threading
+from typing import Any, List
+
+import pytest
+from bitprotolib.stream import AsyncFrameReader, FrameReader
+
+from .generate import load, random_message
+
+
+class ChunkedFile:
+    """A file object supporting only read, returning at most chunk bytes per call."""
+
+    def __init__(self, data: bytes, chunk: int) -> None:
+        self.data = io.BytesIO(data)
+        self.chunk = chunk
+
+    def read(self, size: int) -> bytes:
+        return self.data.read(min(size, self.chunk))
+
+
+def make_drones(bp: Any, n: int) -> List[Any]:
+    rng = random.Random(16)
+    return [random_message(bp.Drone, rng) for _ in range(n)]
+
+
+@pytest.mark.parametrize("buffer_size", [1, 100, 64 * 1024])
+def test_frame_reader_file(tmp_path, buffer_size: int) -> None:
+    bp = load("drone")
+    drones = make_drones(bp, 30)
+    path = tmp_path / "drones.bin"
+    path.write_bytes(b"".join(drone.encode() for drone in drones) + b"\x01\x02")
+
+    with open(path, "rb") as f:
+        reader = FrameReader(bp.Drone, f, buffer_size)
+        assert list(reader) == drones
+        assert reader.pending() == 2
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 1000])
+def test_frame_reader_chunks(chunk: int) -> None:
+    bp = load("drone")
+    drones = make_drones(bp, 30)
+    f = ChunkedFile(b"".join(drone.encode() for drone in drones), chunk)
+    reader = FrameReader(bp.Drone, f, 50)
+    assert list(reader) == drones
+    assert reader.pending() == 0
+
+
+def test_frame_reader_socket() -> None:
+    bp = load("drone")
+    drones = make_drones(bp, 100)
+    s = b"".join(drone.encode() for drone in drones)
+    a, b = socket.socketpair()
+
+    def send() -> None:
+        with a:
+            for k in range(0, len(s), 13):
+                a.sendall(s[k : k + 13])
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    with b:
+        assert list(FrameReader(bp.Drone, b, 64)) == drones
+    thread.join()
+
+
+def test_async_frame_reader() -> None:
+    bp = load("drone")
+    drones = make_drones(bp, 30)
+    s = b"".join(drone.encode() for drone in drones) + b"\x01"
+
+    async def read() -> List[Any]:
+        stream = asyncio.StreamReader()
+        for k in range(0, len(s), 11):
+            stream.feed_data(s[k : k + 11])
+        stream.feed_eof()
+        reader = AsyncFrameReader(bp.Drone, stream, 40)
+        result = [drone async for drone in reader]
+        assert reader.pending() == 1
+        return result
+
+    assert asyncio.run(read()) == drones
+
+
+def test_frame_reader_empty_message() -> None:
+    bp = load("empty")
+    with pytest.raises(ValueError):
+        FrameReader(bp.Empty, io.BytesIO(b""))
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+
+from .generate import load, random_message, randomize
+
+MESSAGES = [
+    "Inner",
+    "All",
+    "Unaligned",
+    "Mixed",
+    "Mixed2",
+    "Many",
+    "Shifted",
+    "Empty",
+]
+
+
+@pytest.mark.parametrize("name", MESSAGES)
+def test_struct_codecs(name: str) -> None:
+    bp = load("aligned")
+    cls = getattr(bp, name)
+    plan = cls.bp_plan()
+    rng = random.Random(24)
+    for _ in range(50):
+        message = random_message(cls, rng)
+        s = message.encode()
+
+        # Same as the plan steps, without the generated codecs.
+        expect = bytearray(cls.BYTES_LENGTH)
+        plan.encode(bp.bp.ProcessContext(True, expect), message)
+        assert s == expect
+
+        result = cls()
+        plan.decode(bp.bp.ProcessContext(False, s), result)
+        assert result == message
+        result = cls()
+        result.decode(s)
+        assert result == message
+
+
+def test_struct_codecs_generated() -> None:
+    bp = load("aligned")
+    for cls in (bp.Inner, bp.All, bp.Unaligned, bp.Mixed, bp.Mixed2, bp.Many):
+        encoder, decoder = cls.bp_struct_codecs()
+        assert encoder is not None and decoder is not None
+        assert cls.bp_plan().encoder is encoder
+    # Messages without byte-aligned integers, or without fields.
+    assert bp.Shifted.bp_struct_codecs() == (None, None)
+    assert bp.Empty.bp_struct_codecs() == (None, None)
+    # Extensible messages, and messages containing them.
+    extended = load("drone_extended")
+    assert extended.Pose.bp_struct_codecs() != (None, None)
+    assert extended.Propeller.bp_struct_codecs() == (None, None)
+    assert extended.Flight.bp_struct_codecs() == (None, None)
+    assert extended.Drone.bp_struct_codecs() == (None, None)
+
+
+@pytest.mark.parametrize("name", ["Inner", "Mixed", "Mixed2"])
+def test_struct_codecs_short_buffer(name: str) -> None:
+    bp = load("aligned")
+    cls = getattr(bp, name)
+    encoder, decoder = cls.bp_struct_codecs()
+    n = cls.BYTES_LENGTH
+    assert not encoder(cls(), bytearray(n - 1), 0)
+    assert not encoder(cls(), bytearray(n), 1)
+    assert not decoder(cls(), bytes(n - 1), 0)
+    assert not decoder(cls(), bytes(n), 1)
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        cls().encode_into(bytearray(n), 1)
+
+
+@pytest.mark.parametrize(
+    "proto, name", [("aligned", name) for name in MESSAGES] + [("drone", "Drone")]
+)
+def test_struct_optimization_mode(proto: str, name: str) -> None:
+    standard = getattr(load(proto), name)
+    op = getattr(load(proto, optimization_mode=True), name)
+    for seed in range(50):
+        # Same random values of 64 bits, truncated on encoding.
+        message = randomize(standard(), random.Random(seed))
+        op_message = randomize(op(), random.Random(seed))
+        s = message.encode()
+        assert op_message.encode() == s
+
+        result = op()
+        result.decode(s)
+        message.decode(s)
+        assert result.to_dict() == message.to_dict()
+
+
+@pytest.mark.parametrize("optimization_mode", [False, True])
+def test_struct_dirty_buffer(optimization_mode: bool) -> None:
+    bp = load("aligned", optimization_mode)
+    rng = random.Random(24)
+    for cls in (bp.Mixed, bp.Mixed2, bp.Many):
+        message = random_message(cls, rng)
+        s = message.encode()
+        result = random_message(cls, rng)
+        result.decode(s)
+        assert result == message
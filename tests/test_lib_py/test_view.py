@@ -0,0 +1,90 @@
+import random
+from dataclasses import fields, is_dataclass
+from typing import Any
+
+import pytest
+
+from .generate import load, random_message
+
+
+def check_view(view: Any, expect: Any) -> None:
+    """Asserts all the fields read through given view equal to the expected message."""
+    if is_dataclass(expect):
+        for f in fields(expect):
+            check_view(getattr(view, f.name), getattr(expect, f.name))
+    elif isinstance(expect, list):
+        assert len(view) == len(expect)
+        for v, e in zip(view, expect):
+            check_view(v, e)
+    else:
+        assert type(view) is type(expect)
+        assert view == expect
+
+
+@pytest.mark.parametrize("name", ["drone", "drone_extended"])
+def test_view(name: str) -> None:
+    bp = load(name)
+    rng = random.Random(19)
+    for _ in range(50):
+        drone = random_message(bp.Drone, rng)
+        s = drone.encode()
+        check_view(bp.DroneView(s), drone)
+        assert bp.DroneView(s).decode() == drone
+
+
+def test_view_offset() -> None:
+    bp = load("drone_extended")
+    rng = random.Random(19)
+    drones = [random_message(bp.Drone, rng) for _ in range(3)]
+    s = memoryview(b"\x00" + b"".join(drone.encode() for drone in drones))
+    for k, drone in enumerate(drones):
+        view = bp.DroneView(s, 1 + k * bp.Drone.BYTES_LENGTH)
+        check_view(view, drone)
+        assert view.decode() == drone
+
+
+def test_view_array() -> None:
+    bp = load("drone")
+    drone = random_message(bp.Drone, random.Random(19))
+    view = bp.DroneView(drone.encode())
+    velocity = view.flight.velocity
+    assert len(velocity) == 3
+    assert velocity.tolist() == drone.flight.velocity
+    assert velocity[-1] == drone.flight.velocity[-1]
+    assert velocity[::-2] == drone.flight.velocity[::-2]
+    with pytest.raises(IndexError):
+        velocity[3]
+    with pytest.raises(IndexError):
+        velocity[-4]
+    ids = [p.id for p in view.propellers[1:3]]
+    assert ids == [p.id for p in drone.propellers[1:3]]
+
+
+def test_view_not_enough_bytes() -> None:
+    bp = load("drone")
+    s = bp.Drone().encode()
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.DroneView(s[:-1])
+    with pytest.raises(bp.bp.NotEnoughBytes):
+        bp.DroneView(s, 1)
+
+
+def test_view_layout_mismatch() -> None:
+    origin = load("drone_origin")
+    extended = load("drone_extended")
+    s = extended.Drone().encode()
+    with pytest.raises(origin.bp.LayoutMismatch):
+        origin.DroneView(s)
+    # Still decodable.
+    drone = origin.Drone()
+    drone.decode_from(s)
+    assert drone == origin.Drone()
+
+    # Any extensible ahead differs, including nested ones: flight, its two arrays,
+    # propellers and each propeller.
+    assert len(extended.DroneView.BP_AHEADS) == 8
+    for i, value in extended.DroneView.BP_AHEADS:
+        s = bytearray(extended.Drone().encode())
+        extended.bp.write_bits_at(s, i, 16, value + 1)
+        with pytest.raises(extended.bp.LayoutMismatch):
+            extended.DroneView(s)